@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+마스터 파일 아티팩트 레지스트리
+한 번의 실행(run) 동안 각 마스터 파일(ZIP)을 한 번만 읽고 압축 해제하여
+원본 바이트, 레코드 수, 해시, 파싱 결과를 파서/로더/검증기가 함께 사용합니다.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import zipfile
+from contextlib import contextmanager
+from config import DATA_DIR
+from metrics import stage_timer
+
+logger = logging.getLogger('artifact_registry')
+
+MASTER_EXTENSIONS = ('.mst', '.cod')
+
+class MasterArtifact:
+    """압축 해제된 마스터 파일 한 개"""
+
+    def __init__(self, path, member_name, data, mtime, size):
+        self.path = path
+        self.member_name = member_name
+        self.data = data
+        self.mtime = mtime
+        self.size = size  # 원본(ZIP) 파일 크기
+        self.sha256 = hashlib.sha256(data).hexdigest()
+        self.parsed = {}  # (파서 클래스명, 시장구분) -> DataFrame
+        self.analysis = {}  # 레코드 크기 -> FileAnalyzer 분석 결과
+
+    @property
+    def byte_size(self):
+        return len(self.data)
+
+    def line_count(self):
+        """개행 기준 레코드 수 (마지막 라인 개행 누락 포함)"""
+        count = self.data.count(b'\n')
+        if self.data and not self.data.endswith(b'\n'):
+            count += 1
+        return count
+
+    def record_count(self, record_size=None):
+        """레코드 수 (개행 없는 고정 길이 파일은 크기 기준)"""
+        lines = self.line_count()
+        if record_size and lines <= 1:
+            return len(self.data) // record_size
+        return lines
+
+    def open_binary(self):
+        return io.BytesIO(self.data)
+
+    def open_text(self, encoding='cp949'):
+        """텍스트 모드 스트림 (open(..., mode='r')와 동일한 개행 처리)"""
+        return io.TextIOWrapper(io.BytesIO(self.data), encoding=encoding)
+
+class ArtifactRegistry:
+    """실행 단위 마스터 파일 레지스트리 (파일 경로 기준, 스레드 안전)"""
+
+    def __init__(self):
+        self._artifacts = {}
+        self._lock = threading.Lock()
+        self._path_locks = {}
+        self.reads = 0
+
+    def _resolve(self, path):
+        full_path = path if os.path.isabs(path) else os.path.join(DATA_DIR, path)
+        return os.path.abspath(full_path)
+
+    def get(self, path):
+        """마스터 파일 아티팩트 반환 (최초 요청 시에만 읽기/압축 해제)
+
+        같은 실행에서는 처음 읽은 바이트를 계속 사용하므로, 적재된 데이터와
+        검증에 사용되는 파일 레코드 수가 항상 같은 내용에서 나옵니다.
+        """
+        full_path = self._resolve(path)
+        with self._lock:
+            artifact = self._artifacts.get(full_path)
+            if artifact is not None:
+                return artifact
+            path_lock = self._path_locks.setdefault(full_path, threading.Lock())
+
+        # 같은 파일을 여러 스레드가 동시에 요청해도 한 번만 읽음
+        with path_lock:
+            with self._lock:
+                artifact = self._artifacts.get(full_path)
+            if artifact is None:
+                artifact = self._read(full_path)
+                with self._lock:
+                    self._artifacts[full_path] = artifact
+        return artifact
+
+    def _read(self, full_path):
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"파일이 존재하지 않음: {full_path}")
+
+        stat = os.stat(full_path)
+        with stage_timer('extract', name=os.path.basename(full_path)) as stage:
+            if full_path.endswith('.zip'):
+                with zipfile.ZipFile(full_path, 'r') as zip_ref:
+                    member_name = _master_member(zip_ref, full_path)
+                    data = zip_ref.read(member_name)
+            else:
+                member_name = os.path.basename(full_path)
+                with open(full_path, 'rb') as f:
+                    data = f.read()
+            stage.bytes = len(data)
+
+        self.reads += 1
+        artifact = MasterArtifact(full_path, member_name, data, stat.st_mtime, stat.st_size)
+        logger.info(f"마스터 파일 적재: {os.path.basename(full_path)} -> {member_name} ({artifact.byte_size:,}bytes)")
+        return artifact
+
+    def peek(self, path):
+        """이미 읽은 아티팩트만 반환 (없으면 None)"""
+        with self._lock:
+            return self._artifacts.get(self._resolve(path))
+
+    def artifacts(self):
+        with self._lock:
+            return dict(self._artifacts)
+
+    def clear(self):
+        with self._lock:
+            self._artifacts.clear()
+            self._path_locks.clear()
+
+def _master_member(zip_ref, full_path):
+    """ZIP 안의 마스터 파일(.mst/.cod) 멤버명"""
+    member_name = next(
+        (name for name in zip_ref.namelist() if name.lower().endswith(MASTER_EXTENSIONS)),
+        None
+    )
+    if member_name is None:
+        raise ValueError(f"압축 파일 {full_path}에서 마스터 파일을 찾을 수 없습니다.")
+    return member_name
+
+_registry = ArtifactRegistry()
+
+@contextmanager
+def stream_master(path):
+    """마스터 파일을 레지스트리에 저장하지 않고 스트림으로 열기 -> (바이너리 스트림, 서명)
+
+    채권처럼 큰 파일은 압축 해제한 전체 바이트를 실행 내내 들고 있지 않도록 ZIP 멤버를 바로 읽습니다.
+    서명(ZIP 멤버 CRC/크기, 일반 파일은 크기/수정 시각)으로 검증 패스와 적재 패스가
+    같은 내용을 읽었는지 확인할 수 있습니다.
+    """
+    full_path = _registry._resolve(path)
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(f"파일이 존재하지 않음: {full_path}")
+
+    if full_path.endswith('.zip'):
+        with zipfile.ZipFile(full_path, 'r') as zip_ref:
+            member_name = _master_member(zip_ref, full_path)
+            info = zip_ref.getinfo(member_name)
+            with zip_ref.open(member_name) as stream:
+                yield stream, (member_name, info.CRC, info.file_size)
+    else:
+        stat = os.stat(full_path)
+        with open(full_path, 'rb') as stream:
+            yield stream, (os.path.basename(full_path), stat.st_size, stat.st_mtime)
+
+def get_registry():
+    """프로세스 공용 레지스트리"""
+    return _registry
+
+def reset_registry():
+    """새 실행 시작 시 호출 (이전 실행의 바이트/파싱 결과 폐기)"""
+    _registry.clear()
+    return _registry
@@ -0,0 +1 @@
+# KIS 파서/적재 벤치마크 모듈
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+파서/적재 준비 벤치마크
+합성 마스터 파일(배율 1x/10x/100x)로 항목별 압축 해제, parse, transform, 적재 행 변환
+(db_utils.dataframe_rows), sqlite3 메모리 DB 로 실행한 db_utils.insert_dataframe 시간을 측정하고
+커밋별 결과 JSON 을 benchmarks/results/ 에 저장합니다.
+
+사용법:
+    python -m benchmarks.run_benchmarks --scale 1 10
+    python -m benchmarks.run_benchmarks --scale 1 --compare benchmarks/results/<이전 결과>.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+from artifact_registry import reset_registry
+from config import BATCH_SIZE
+import db_utils
+from db_utils import dataframe_rows
+from metrics import get_recorder, reset_metrics
+from benchmarks.synthetic_masters import MASTER_FILES, write_masters
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BENCH_DIR, 'data')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+# insert_dataframe 와 같이 적재에서 제외하는 컬럼
+EXCLUDE_COLUMNS = ['created_at', 'updated_at']
+
+def create_parser(item, folder):
+    """항목명 -> 파서 (합성 파일 절대 경로 사용)"""
+    from config import BOND_ITEM, DERIVATIVE_ITEMS, OVERSEAS_ITEMS
+    from parsers.bond_parser import BondParser
+    from parsers.derivative_parser import DerivativeParser
+    from parsers.domestic_stock_parser import DomesticStockParser
+    from parsers.elw_parser import ELWParser
+    from parsers.member_parser import MemberParser
+    from parsers.overseas_parser import OverseasParser
+    from parsers.sector_parser import SectorParser
+    from parsers.theme_parser import ThemeParser
+
+    master_name, header_name = MASTER_FILES[item]
+    master_file = os.path.join(folder, master_name)
+    header_file = os.path.join(folder, header_name) if header_name else None
+    if item == BOND_ITEM:
+        return BondParser(master_file, header_file, item)
+    if item in OVERSEAS_ITEMS:
+        return OverseasParser(master_file, None, item)
+    if item in DERIVATIVE_ITEMS:
+        return DerivativeParser(master_file, header_file, item)
+    if item == 'ELW':
+        return ELWParser(master_file, None, item)
+    if item == '회원사코드':
+        return MemberParser(master_file)
+    if item == '업종코드':
+        return SectorParser(master_file)
+    if item == '테마코드':
+        return ThemeParser(master_file)
+    return DomesticStockParser(master_file, None, item)
+
+def _register_sqlite_adapters():
+    # pymysql 과 같이 날짜/시각 값을 문자열로 바인딩
+    for value_type in (datetime.date, datetime.datetime, pd.Timestamp):
+        sqlite3.register_adapter(value_type, lambda value: value.isoformat())
+
+class SQLiteCursor:
+    """pymysql 커서 대신 쓰는 sqlite3 커서 (db_utils 가 보내는 MySQL 문법을 sqlite3 문법으로 변환)"""
+
+    def __init__(self, conn):
+        self._cursor = conn.cursor()
+
+    @staticmethod
+    def _translate(query):
+        if query.startswith('SHOW COLUMNS FROM '):
+            return f"SELECT name FROM pragma_table_info('{query.split()[-1]}')"
+        return query.replace('INSERT IGNORE', 'INSERT OR IGNORE').replace('%s', '?')
+
+    def execute(self, query, params=()):
+        self._cursor.execute(self._translate(query), params or ())
+
+    def executemany(self, query, values):
+        self._cursor.executemany(self._translate(query), values)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+
+class SQLiteConnection:
+    """db_utils.get_connection() 대체 연결 (close() 는 무시하고 측정 후 한 번만 닫음)"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self):
+        return SQLiteCursor(self._conn)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        pass
+
+def time_insert(df, batch_size=BATCH_SIZE):
+    """db_utils.insert_dataframe 를 sqlite3 메모리 DB 로 실행 -> {'row_prep': 초}
+
+    적재 코드는 그대로 두고 get_connection 만 sqlite3 연결로 바꿔 실제 삽입 경로(컬럼 조회, 행 변환,
+    executemany, 커밋)를 측정합니다. 삽입 시간은 insert_dataframe 가 'insert' 단계 지표로 기록하고,
+    그중 행 변환(dataframe_rows) 시간은 따로 측정해 'row_prep' 으로 반환합니다.
+    """
+    if df.empty:
+        return {}
+    columns = [col for col in df.columns if col not in EXCLUDE_COLUMNS]
+    conn = sqlite3.connect(':memory:')
+    original_get_connection = db_utils.get_connection
+    try:
+        conn.execute(f"CREATE TABLE bench ({', '.join(df.columns)})")
+        db_utils.get_connection = lambda: SQLiteConnection(conn)
+        db_utils.insert_dataframe('bench', df, batch_size)
+
+        started = time.perf_counter()
+        for i in range(0, len(df), batch_size):
+            dataframe_rows(df.iloc[i:i+batch_size], columns)
+        return {'row_prep': time.perf_counter() - started}
+    finally:
+        db_utils.get_connection = original_get_connection
+        conn.close()
+
+def run_item(item, folder, repeat):
+    """항목 하나를 repeat 회 측정하여 단계별 최소 시간 반환"""
+    best = {}
+    memory = {}
+    rows = 0
+    for _ in range(repeat):
+        reset_registry()
+        reset_metrics()
+        df = create_parser(item, folder).get_data()
+        rows = len(df)
+        # insert 단계는 insert_dataframe 가 지표로 기록하므로 기록을 읽기 전에 실행
+        prep_timings = time_insert(df)
+        timings = {}
+        for record in get_recorder().records:
+            timings[record.stage] = (record.wall_sec, record.cpu_sec, record.bytes)
+            if record.memory:
+                memory[record.stage] = max(memory.get(record.stage, 0.0), record.memory['py_peak_mb'])
+        for stage, seconds in prep_timings.items():
+            timings[stage] = (seconds, None, None)
+        for stage, timing in timings.items():
+            if stage not in best or timing[0] < best[stage][0]:
+                best[stage] = timing
+
+    return [
+        {
+            'item': item,
+            'stage': stage,
+            'rows': rows,
+            'bytes': timing[2],
+            'wall_sec': round(timing[0], 6),
+            'cpu_sec': round(timing[1], 6) if timing[1] is not None else None,
+            'rows_per_sec': round(rows / timing[0], 1) if rows and timing[0] else None,
+            'py_peak_mb': memory.get(stage)
+        }
+        for stage, timing in best.items()
+    ]
+
+def git_revision():
+    """(커밋 해시, 작업 트리 변경 여부)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+def run_benchmarks(scales, repeat=3, regenerate=False):
+    commit, dirty = git_revision()
+    _register_sqlite_adapters()
+    results = []
+    for scale in scales:
+        folder = os.path.join(DATA_DIR, f"scale_{scale:g}")
+        if regenerate or not os.path.exists(os.path.join(folder, MASTER_FILES['코스피'][0])):
+            print(f"합성 마스터 파일 생성: {scale:g}x -> {folder}")
+            write_masters(folder, scale)
+        for item in MASTER_FILES:
+            for result in run_item(item, folder, repeat):
+                result['scale'] = scale
+                results.append(result)
+                rate = f"{result['rows_per_sec']:>12,.0f}행/초" if result['rows_per_sec'] else ''
+                peak = f" {result['py_peak_mb']:>8.2f}MB" if result['py_peak_mb'] is not None else ''
+                print(f"{scale:>5g}x {item:<6} {result['stage']:<10} {result['rows']:>9,}행 {result['wall_sec']:>9.4f}초 {rate}{peak}")
+    return {
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'repeat': repeat,
+        'results': results
+    }
+
+def save_results(report, folder=RESULTS_DIR):
+    os.makedirs(folder, exist_ok=True)
+    suffix = '-dirty' if report['dirty'] else ''
+    path = os.path.join(folder, f"{report['created_at'][:10]}_{report['commit']}{suffix}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+def compare(report, baseline_path):
+    """이전 결과 대비 단계별 시간 비율 출력 (1 미만이면 빨라짐)"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    base = {(r['scale'], r['item'], r['stage']): r['wall_sec'] for r in baseline['results']}
+    base_peak = {(r['scale'], r['item'], r['stage']): r.get('py_peak_mb') for r in baseline['results']}
+    print(f"\n비교 기준: {baseline['commit']} ({baseline['created_at']})")
+    for r in report['results']:
+        key = (r['scale'], r['item'], r['stage'])
+        if base.get(key):
+            ratio = r['wall_sec'] / base[key]
+            marker = '▲' if ratio > 1.1 else '▼' if ratio < 0.9 else ' '
+            peak = ''
+            if base_peak.get(key) and r.get('py_peak_mb') is not None:
+                peak = f"  메모리 {base_peak[key]:.2f}MB -> {r['py_peak_mb']:.2f}MB"
+            print(f"{r['scale']:>5g}x {r['item']:<6} {r['stage']:<10} {base[key]:>9.4f}초 -> {r['wall_sec']:>9.4f}초 ({ratio:5.2f}x) {marker}{peak}")
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='KIS 파서/적재 벤치마크 (합성 마스터 파일)')
+    arg_parser.add_argument('--scale', type=float, nargs='+', default=[1, 10], help='실제 행 수 대비 배율 (예: 1 10 100)')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='항목별 반복 횟수 (최소 시간 기록)')
+    arg_parser.add_argument('--regenerate', action='store_true', help='합성 파일 다시 생성')
+    arg_parser.add_argument('--compare', help='비교할 이전 결과 JSON 경로')
+    arg_parser.add_argument('--trace-memory', action='store_true', help='parse/transform 단계 tracemalloc 최대치 기록 (시간 측정값은 느려짐)')
+    args = arg_parser.parse_args()
+
+    # 파서 진행 로그는 측정에서 제외
+    logging.basicConfig(level=logging.WARNING)
+    if args.trace_memory:
+        get_recorder().enable_memory_tracing()
+
+    report = run_benchmarks(args.scale, args.repeat, args.regenerate)
+    path = save_results(report)
+    print(f"\n결과 저장: {path}")
+    if args.compare:
+        compare(report, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+합성 KIS 마스터 파일 생성기
+실제 마스터 파일은 외부에 공유할 수 없으므로 파서가 읽는 각 형식과 같은 레이아웃의
+가상 데이터를 만들어 벤치마크에 사용합니다. 배율(scale)은 실제 행 수 대비 배수입니다.
+
+- 국내주식(코스피/코스닥/코넥스): 단축코드(9) + 표준코드(12) + 가변 길이 종목명 + 228자 고정 꼬리
+- ELW: 300바이트 고정 길이 레코드
+- 회원사코드: 50바이트 고정 길이 레코드
+- 업종코드/테마코드: 라인 단위 텍스트
+- 지수/주식선물옵션: '|' 구분 라인, 상품선물옵션: 고정 길이 라인 + 헤더(.h) 파일 (파서가 헤더에서 오프셋을 읽음)
+- 채권코드: 350바이트 고정 길이 라인 + 헤더(.h) 파일
+- 해외(나스닥/뉴욕/도쿄): 탭 구분 .cod 라인 (parsers.overseas_parser 컬럼)
+"""
+
+import io
+import os
+import random
+import zipfile
+
+ENCODING = 'cp949'
+
+# 실제 마스터 파일의 대략적인 행 수 (배율 1 기준)
+BASE_ROW_COUNTS = {
+    '코스피': 2500,
+    '코스닥': 1800,
+    '코넥스': 130,
+    'ELW': 3000,
+    '회원사코드': 100,
+    '업종코드': 120,
+    '테마코드': 5000,
+    '지수선물옵션': 1500,
+    '주식선물옵션': 6000,
+    '상품선물옵션': 300,
+    '채권코드': 20000,
+    '미국(나스닥)': 5000,
+    '미국(뉴욕)': 3500,
+    '일본(도쿄)': 4000
+}
+
+# 항목명 -> (마스터 파일명, 헤더 파일명)
+MASTER_FILES = {
+    '코스피': ('코스피_마스터_kospi_code.mst.zip', '코스피_헤더_kospi_code.h'),
+    '코스닥': ('코스닥_마스터_kosdaq_code.mst.zip', '코스닥_헤더_kosdaq_code.h'),
+    '코넥스': ('코넥스_마스터_konex_code.mst.zip', '코넥스_헤더_konex_code.h'),
+    'ELW': ('ELW_마스터_elw_code.mst.zip', 'ELW_헤더_elw_code.h'),
+    '회원사코드': ('회원사코드_마스터_memcode.mst.zip', '회원사코드_헤더_memcode.h'),
+    '업종코드': ('업종코드_마스터_idxcode.mst.zip', '업종코드_헤더_업종코드정보.h'),
+    '테마코드': ('테마코드_마스터_theme_code.mst.zip', '테마코드_헤더_테마코드정보.h'),
+    '지수선물옵션': ('지수선물옵션_마스터_fo_idx_code_mts.mst.zip', '지수선물옵션_헤더_fo_idx_code_mts.h'),
+    '주식선물옵션': ('주식선물옵션_마스터_fo_stk_code_mts.mst.zip', '주식선물옵션_헤더_fo_stk_code_mts.h'),
+    '상품선물옵션': ('상품선물옵션_마스터_fo_com_code.mst.zip', '상품선물옵션_헤더_fo_com_code.h'),
+    '채권코드': ('채권코드_마스터_bond_code.mst.zip', '채권코드_헤더_bond_code.h'),
+    '미국(나스닥)': ('미국(나스닥)_마스터_nasmst.cod.zip', ''),
+    '미국(뉴욕)': ('미국(뉴욕)_마스터_nysmst.cod.zip', ''),
+    '일본(도쿄)': ('일본(도쿄)_마스터_tsemst.cod.zip', '')
+}
+
+NAME_SYLLABLES = '가나다라마바사아자차카타파하삼성현대기아전자화학바이오제약금융증권건설에너지'
+NAME_SUFFIXES = ['', '우', '홀딩스', '테크', 'ETF', 'ETN', '리츠', '스팩']
+DOMESTIC_TAIL_SIZE = 228
+ELW_RECORD_SIZE = 300
+MEMBER_RECORD_SIZE = 50
+BOND_RECORD_SIZE = 350
+
+# 고정 길이 합성 파일의 헤더(.h) 필드 (C 필드명, 설명 주석, 길이) - 레코드도 이 순서/길이로 생성
+HEADER_FIELDS = {
+    '상품선물옵션': [
+        ('prdt_kind', '상품종류', 1),
+        ('shrn_iscd', '단축코드', 9),
+        ('stnd_iscd', '표준코드', 12),
+        ('kor_isnm', '한글종목명', 41),
+        ('atm_cls_code', 'ATM구분', 1),
+        ('acpr', '행사가', 9),
+        ('mmsc_cls_code', '월물구분코드', 1),
+        ('bast_shrn_iscd', '기초자산 단축코드', 9),
+        ('bast_isnm', '기초자산 명', 40),
+    ],
+    '채권코드': [
+        ('bond_type', '채권유형', 2),
+        ('bond_clsf_code', '채권분류코드', 2),
+        ('stnd_iscd', '표준코드', 12),
+        ('shrn_iscd', '단축코드', 9),
+        ('kor_isnm', '한글종목명', 80),
+        ('issu_istt_code', '발행기관코드', 10),
+        ('issu_istt_name', '발행기관명', 40),
+        ('intr_pymt_mthd', '이자지급방법', 1),
+        ('srfc_inrt', '표면금리', 10),
+        ('crdt_grad', '신용등급', 10),
+        ('lstg_date', '상장일', 8),
+        ('issu_date', '발행일', 8),
+        ('rdpt_date', '상환일', 8),
+        ('fcam', '액면가', 15),
+        ('filler', '예비', BOND_RECORD_SIZE - 215),
+    ],
+}
+
+BOND_ISSUERS = ['국고', '한국전력', '한국도로공사', '서울특별시', '산업은행', '현대자동차', '삼성전자', '엘지화학']
+CREDIT_RATINGS = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'BBB+', '']
+
+# 해외 항목명 -> (국가코드, 거래소ID, 거래소코드, 거래소명, 통화, 거래 시작/종료 시각)
+OVERSEAS_EXCHANGES = {
+    '미국(나스닥)': ('US', '512', 'NAS', '나스닥', 'USD', '0930', '1600'),
+    '미국(뉴욕)': ('US', '513', 'NYS', '뉴욕', 'USD', '0930', '1600'),
+    '일본(도쿄)': ('JP', '515', 'TSE', '도쿄', 'JPY', '0900', '1530'),
+}
+
+# 선물옵션 상품코드 -> 종목명 접두어 / 월물 연도·월 코드 (단축코드 4~5번째 자리)
+INDEX_PRODUCTS = {'01': '코스피200', '05': '미니코스피200', '06': '코스닥150'}
+COMMODITY_PRODUCTS = {'65': '3년국채', '67': '10년국채', '75': '미국달러', '76': '엔', '77': '유로'}
+CONTRACT_MONTHS = [('W', 3), ('W', 6), ('W', 9), ('W', 12), ('X', 3), ('X', 6), ('X', 12), ('Y', 12)]
+
+def isin_check_digit(body):
+    """ISIN 앞 11자리 -> 검증 숫자 (Luhn)"""
+    digits = ''.join(str(int(ch, 36)) for ch in body)
+    total = 0
+    for i, ch in enumerate(reversed(digits)):
+        value = int(ch) * (2 if i % 2 == 0 else 1)
+        total += value // 10 + value % 10
+    return str((10 - total % 10) % 10)
+
+def make_isin(short_code, prefix='KR7'):
+    return isin_check_digit_body(f"{prefix}{short_code}00")
+
+def isin_check_digit_body(body):
+    """ISIN 앞 11자리 + 검증 숫자"""
+    return body + isin_check_digit(body)
+
+def base36(value, width):
+    """0-9A-Z 코드 (테마코드 등 3자리 코드 생성)"""
+    chars = ''
+    while value or not chars:
+        value, digit = divmod(value, 36)
+        chars = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'[digit] + chars
+    return chars.rjust(width, '0')
+
+def fixed(text, size):
+    """cp949 기준 size 바이트로 자르거나 공백으로 채움"""
+    data = text.encode(ENCODING)[:size]
+    return data.ljust(size, b' ')
+
+class SyntheticMasterGenerator:
+    """항목별 합성 마스터 파일 생성 (seed 고정으로 같은 입력 재현)"""
+
+    def __init__(self, scale=1, seed=42):
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.short_codes = {}
+        self.used_codes = set()  # 시장 간 종목코드 중복 방지
+
+    def row_count(self, item):
+        return max(1, int(BASE_ROW_COUNTS[item] * self.scale))
+
+    def _name(self, min_len=2, max_len=10):
+        length = self.random.randint(min_len, max_len)
+        name = ''.join(self.random.choice(NAME_SYLLABLES) for _ in range(length))
+        return name + self.random.choice(NAME_SUFFIXES)
+
+    def _date(self, start_year=1990, end_year=2030):
+        return f"{self.random.randint(start_year, end_year)}{self.random.randint(1, 12):02d}{self.random.randint(1, 28):02d}"
+
+    def _domestic_tail(self):
+        """228자 고정 꼬리 (파서가 읽는 필드 + 나머지 공백, 마지막 개행 포함)"""
+        industry = f"{self.random.randint(1, 30):04d}"
+        fields = [
+            self.random.choice(['ST', 'ST', 'ST', 'EF', 'EN', 'RT']),  # 그룹코드(2)
+            str(self.random.randint(0, 3)),  # 시가총액규모(1)
+            industry,  # 지수업종대분류(4)
+            f"{self.random.randint(0, 30):04d}",  # 지수업종중분류(4)
+            f"{self.random.randint(0, 30):04d}",  # 지수업종소분류(4)
+            ''.join(self.random.choice('NY') for _ in range(26)),  # 1바이트 구분 필드(26)
+            f"{self.random.randint(100, 900000):09d}",  # 기준가(9)
+            '00001',  # 매매수량단위(5)
+            '00001',  # 시간외수량단위(5)
+            self.random.choice('NNNNY'),  # 거래정지(1)
+            'N',  # 정리매매(1)
+            self.random.choice('NNNNY'),  # 관리종목(1)
+            self.random.choice(['00', '00', '01', '02']),  # 시장경고(2)
+            ' ' * 8,  # 경고예고~증거금비율(8)
+            'Y',  # 신용가능(1)
+            '000',  # 신용기간(3)
+            f"{self.random.randint(0, 10**9):012d}",  # 전일거래량(12)
+            f"{self.random.choice([100, 500, 1000, 5000]):012d}",  # 액면가(12)
+            self._date(1990, 2025),  # 상장일자(8)
+        ]
+        tail = ''.join(fields)
+        return tail.ljust(DOMESTIC_TAIL_SIZE - 1) + '\n'
+
+    def domestic(self, item):
+        codes = set()
+        if item == '코스피':
+            codes.add('005930')
+        while len(codes) < self.row_count(item):
+            code = f"{self.random.randint(1, 999999):06d}"
+            if code not in self.used_codes:
+                codes.add(code)
+        self.used_codes |= codes
+        self.short_codes[item] = sorted(codes)
+
+        lines = []
+        for short_code in self.short_codes[item]:
+            name = '삼성전자' if short_code == '005930' else self._name()
+            lines.append(f"{short_code:<9}{make_isin(short_code):<12}{name}{self._domestic_tail()}")
+        return ''.join(lines).encode(ENCODING)
+
+    def elw(self):
+        underlyings = self.short_codes.get('코스피') or ['005930']
+        records = []
+        for i in range(self.row_count('ELW')):
+            short_code = f"{5 + i // 100000}{i % 100000:05d}"
+            elw_code = make_isin(f"{short_code}", prefix='KRA')
+            underlying = self.random.choice(underlyings)
+            records.append(b''.join([
+                fixed(elw_code, 12),
+                fixed(short_code, 6),
+                fixed(f"{self._name(2, 6)}{self.random.choice(['콜', '풋'])}{i}", 40),
+                fixed(f"A{underlying}", 12),
+                fixed(self._name(2, 6), 40),
+                fixed(self.random.choice('12'), 1),
+                fixed(f"{self.random.randint(1000, 900000):015d}", 15),
+                fixed(self._date(2025, 2028), 8),
+                fixed(self._date(2020, 2025), 8),
+                fixed(f"{self.random.randint(1, 60):08d}", 8),
+            ]).ljust(ELW_RECORD_SIZE, b' '))
+        return b''.join(records)
+
+    def member(self):
+        records = []
+        for i in range(self.row_count('회원사코드')):
+            records.append(b''.join([
+                fixed(f"{i + 1:05d}", 5),
+                fixed(f"{self._name(2, 6)}증권", 20),
+                fixed(self._name(2, 4), 10),
+                fixed(f"SEC{i:05d}", 12),
+                fixed(self.random.choice('1234'), 1),
+                fixed('20', 2),
+            ]).ljust(MEMBER_RECORD_SIZE, b' '))
+        return b''.join(records)
+
+    def sector(self):
+        lines = []
+        for i in range(self.row_count('업종코드')):
+            lines.append(f"0{i + 1:04d}{self._name(2, 8):<40}\n")
+        return ''.join(lines).encode(ENCODING)
+
+    def theme(self):
+        stocks = [code for item in ['코스피', '코스닥', '코넥스'] for code in self.short_codes.get(item, [])] or ['005930']
+        theme_count = max(1, self.row_count('테마코드') // 20)
+        themes = [(base36(i, 3), self._name(2, 8)) for i in range(theme_count)]
+        lines = []
+        for _ in range(self.row_count('테마코드')):
+            code, name = self.random.choice(themes)
+            lines.append(f"{code}{name}{self.random.choice(stocks):<9}\n")
+        return ''.join(lines).encode(ENCODING)
+
+    def _derivative_series(self, products, item):
+        """(단축코드, 표준코드, 종목명, ATM구분, 행사가, 기초자산코드, 기초자산명) 목록"""
+        series = []
+        while len(series) < self.row_count(item):
+            product, (name, underlying) = self.random.choice(list(products.items()))
+            year_code, month = self.random.choice(CONTRACT_MONTHS)
+            month_code = '123456789ABC'[month - 1]
+            contract = f"20{ord(year_code) - ord('W') + 25}{month:02d}"
+            kind = self.random.choice('1123')
+            if kind == '1':
+                short_code = f"1{product}{year_code}{month_code}000"
+                series.append((short_code, name + ' F ' + contract, '', '0', underlying, name))
+            else:
+                strike = self.random.randint(100, 999)
+                short_code = f"{kind}{product}{year_code}{month_code}{strike}"
+                label = 'C' if kind == '2' else 'P'
+                series.append((short_code, f"{name} {label} {contract} {strike:.1f}",
+                               self.random.choice('012'), f"{strike:.2f}", underlying, name))
+        # 같은 단축코드는 한 번만
+        unique = {row[0]: row for row in series}
+        return [(row[0], isin_check_digit_body(f"KR4{row[0]}"), *row[1:]) for row in unique.values()]
+
+    def index_derivatives(self):
+        products = {code: (name, '') for code, name in INDEX_PRODUCTS.items()}
+        lines = [
+            '|'.join([short_code[0], short_code, isin, name, atm, strike, '1', underlying, underlying_name])
+            for short_code, isin, name, atm, strike, underlying, underlying_name in
+            self._derivative_series(products, '지수선물옵션')
+        ]
+        return ('\n'.join(lines) + '\n').encode(ENCODING)
+
+    def stock_derivatives(self):
+        stocks = self.short_codes.get('코스피') or ['005930']
+        # 지수/상품 상품코드와 겹치지 않는 2자리 상품코드
+        codes = [code for code in (base36(36 + i, 2) for i in range(220)) if code not in INDEX_PRODUCTS and code not in COMMODITY_PRODUCTS]
+        products = {code: (self._name(2, 5), stocks[i % len(stocks)]) for i, code in enumerate(codes[:200])}
+        lines = [
+            '|'.join([short_code[0], short_code, isin, name, atm, strike, '1', underlying, underlying_name])
+            for short_code, isin, name, atm, strike, underlying, underlying_name in
+            self._derivative_series(products, '주식선물옵션')
+        ]
+        return ('\n'.join(lines) + '\n').encode(ENCODING)
+
+    def commodity_derivatives(self):
+        products = {code: (name, '') for code, name in COMMODITY_PRODUCTS.items()}
+        lines = []
+        sizes = [size for _, _, size in HEADER_FIELDS['상품선물옵션']]
+        for short_code, isin, name, atm, strike, underlying, underlying_name in \
+                self._derivative_series(products, '상품선물옵션'):
+            values = [short_code[0], short_code, isin, name, atm, strike, '1', underlying, underlying_name]
+            lines.append(b''.join(fixed(value, size) for value, size in zip(values, sizes)) + b'\n')
+        return b''.join(lines)
+
+    def bonds(self):
+        sizes = [size for _, _, size in HEADER_FIELDS['채권코드']]
+        lines = []
+        for i in range(self.row_count('채권코드')):
+            short_code = f"{base36(i, 6)}000"
+            issuer = self.random.choice(BOND_ISSUERS)
+            issue_date = self._date(2000, 2025)
+            maturity_year = int(issue_date[:4]) + self.random.choice([1, 2, 3, 5, 10, 20, 30])
+            values = [
+                self.random.choice(['01', '02', '03']),
+                self.random.choice(['11', '21', '31', '41']),
+                isin_check_digit_body(f"KR6{short_code[:8]}"),
+                short_code,
+                f"{issuer}{self._name(1, 3)}{i}",
+                f"{BOND_ISSUERS.index(issuer) + 1:05d}",
+                issuer,
+                self.random.choice('1112'),
+                f"{self.random.randint(0, 800) / 100:.4f}",
+                self.random.choice(CREDIT_RATINGS),
+                issue_date,
+                issue_date,
+                f"{maturity_year}{issue_date[4:]}",
+                f"{self.random.choice([1000, 10000]):015d}",
+                '',
+            ]
+            lines.append(b''.join(fixed(value, size) for value, size in zip(values, sizes)) + b'\n')
+        return b''.join(lines)
+
+    def overseas(self, item):
+        national, exchange_id, exchange_code, exchange_name, currency, start, end = OVERSEAS_EXCHANGES[item]
+        lines = []
+        for i in range(self.row_count(item)):
+            if exchange_code == 'TSE':
+                symbol = f"{1000 + i}"
+            else:
+                symbol = base36(i + 36 ** 3, 4)
+            security_type = self.random.choice('2222223')
+            english_name = f"{symbol} {self.random.choice(['Inc', 'Corp', 'Holdings', 'Trust', 'ETF'])}"
+            lines.append('\t'.join([
+                national, exchange_id, exchange_code, exchange_name, symbol, f"D{exchange_code}{symbol}",
+                self._name(2, 6) if self.random.random() < 0.7 else '', english_name, security_type, currency,
+                '2' if currency == 'USD' else '0', '2', f"{self.random.randint(1, 50000) / 100:.2f}", '1', '1',
+                start, end, self.random.choice('NNNNY'), '', '', '0', '1',
+                '001' if security_type == '3' else '', ''
+            ]))
+        return ('\n'.join(lines) + '\n').encode(ENCODING)
+
+    def build(self):
+        """항목명 -> 마스터 파일 바이트 (종목 코드를 참조하는 ELW/테마는 국내주식 이후 생성)"""
+        data = {item: self.domestic(item) for item in ['코스피', '코스닥', '코넥스']}
+        data['ELW'] = self.elw()
+        data['회원사코드'] = self.member()
+        data['업종코드'] = self.sector()
+        data['테마코드'] = self.theme()
+        data['지수선물옵션'] = self.index_derivatives()
+        data['주식선물옵션'] = self.stock_derivatives()
+        data['상품선물옵션'] = self.commodity_derivatives()
+        data['채권코드'] = self.bonds()
+        for item in OVERSEAS_EXCHANGES:
+            data[item] = self.overseas(item)
+        return data
+
+def header_text(fields):
+    """(C 필드명, 설명 주석, 길이) 목록 -> KIS 헤더(.h) 형식 구조체 선언"""
+    lines = ['typedef struct', '{']
+    lines += [f"    char    {name}[{size}];    /* {label} */" for name, label, size in fields]
+    lines.append('} MASTER_RECORD;')
+    return '\n'.join(lines) + '\n'
+
+def write_masters(folder, scale=1, seed=42):
+    """합성 마스터 ZIP 파일(고정 길이 항목은 헤더 파일도) 작성 -> 파일 매핑 DataFrame (kis_file_sets.csv 와 같은 컬럼)"""
+    import pandas as pd
+
+    os.makedirs(folder, exist_ok=True)
+    rows = []
+    for item, data in SyntheticMasterGenerator(scale, seed).build().items():
+        master_file, header_file = MASTER_FILES[item]
+        member_name = master_file[:-len('.zip')].split('_마스터_')[-1]
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr(member_name, data)
+        with open(os.path.join(folder, master_file), 'wb') as f:
+            f.write(buffer.getvalue())
+        if item in HEADER_FIELDS:
+            with open(os.path.join(folder, header_file), 'w', encoding=ENCODING) as f:
+                f.write(header_text(HEADER_FIELDS[item]))
+        rows.append({'항목명': item, '종목다운로드': master_file, '헤더정보': header_file})
+    return pd.DataFrame(rows)
@@ -19,5 +19,67 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, 'kis_download')
 FILE_SETS_CSV = os.path.join(DATA_DIR, 'kis_file_sets.csv')
 
+# 재적재 대상 항목 (회원사/종목/선물옵션/채권/해외주식) 및 업종/테마 마스터 파일
+DERIVATIVE_ITEMS = ['지수선물옵션', '주식선물옵션', '상품선물옵션']
+BOND_ITEM = '채권코드'
+OVERSEAS_ITEMS = [
+    '미국(나스닥)', '미국(뉴욕)', '미국(아멕스)', '중국(상해)', '중국(상해지수)', '중국(심천)', '중국(심천지수)',
+    '일본(도쿄)', '홍콩', '베트남(하노이)', '베트남(호치민)'
+]
+RELOAD_ITEMS = ['회원사코드', '코스피', '코스닥', '코넥스', 'ELW'] + DERIVATIVE_ITEMS + [BOND_ITEM] + OVERSEAS_ITEMS
+SECTOR_MASTER_FILE = '업종코드_마스터_idxcode.mst.zip'
+SECTOR_HEADER_FILE = '업종코드_헤더_업종코드정보.h'
+THEME_MASTER_FILE = '테마코드_마스터_theme_code.mst.zip'
+THEME_HEADER_FILE = '테마코드_헤더_테마코드정보.h'
+
 # 배치 처리 크기
 BATCH_SIZE = int(os.getenv('BATCH_SIZE', 1000))
+
+# 채권 마스터 청크 크기 (레코드 수, 청크 단위로 파싱/삽입하여 최대 메모리 제한)
+BOND_CHUNK_SIZE = int(os.getenv('BOND_CHUNK_SIZE', 20000))
+
+# 해외 거래소 마스터(.cod) 동시 파싱 작업자 수
+OVERSEAS_PARSE_WORKERS = int(os.getenv('OVERSEAS_PARSE_WORKERS', 4))
+
+# 재적재 세대 번호 파일 (검색 인덱스/캐시 무효화 기준)
+GENERATION_FILE = os.path.join(DATA_DIR, 'reload_generation.txt')
+
+# 검색 결과 캐시 크기 (LRU)
+SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', 1024))
+
+# 조회 서비스용 종목 스냅샷 파일
+SNAPSHOT_FILE = os.path.join(DATA_DIR, 'instruments_snapshot.json')
+
+# 통합 검증 동시 실행 작업자 수 (검증용 연결 풀 크기)
+VALIDATION_WORKERS = int(os.getenv('VALIDATION_WORKERS', 4))
+
+# 마스터 파일 다운로드 설정
+DOWNLOAD_WORKERS = int(os.getenv('DOWNLOAD_WORKERS', 8))
+DOWNLOAD_PER_HOST_LIMIT = int(os.getenv('DOWNLOAD_PER_HOST_LIMIT', 4))
+DOWNLOAD_RETRIES = int(os.getenv('DOWNLOAD_RETRIES', 3))
+DOWNLOAD_BACKOFF_SECONDS = float(os.getenv('DOWNLOAD_BACKOFF_SECONDS', 0.5))
+DOWNLOAD_BACKOFF_MAX_SECONDS = float(os.getenv('DOWNLOAD_BACKOFF_MAX_SECONDS', 30))
+DOWNLOAD_TIMEOUT = int(os.getenv('DOWNLOAD_TIMEOUT', 30))
+DOWNLOAD_CHUNK_SIZE = int(os.getenv('DOWNLOAD_CHUNK_SIZE', 1024 * 1024))
+
+# 다운로드 매니페스트 (ETag, Last-Modified, 크기, SHA-256, 적재 여부)
+MANIFEST_FILE = os.path.join(DATA_DIR, 'kis_file_manifest.json')
+
+# 마스터 파일 URL 매니페스트 캐시 (유효 시간)
+URL_MANIFEST_FILE = os.path.join(DATA_DIR, 'kis_url_manifest.json')
+URL_MANIFEST_TTL_HOURS = float(os.getenv('URL_MANIFEST_TTL_HOURS', 24))
+
+# 작업 그래프 파이프라인 체크포인트 (실패 시 재개용)
+PIPELINE_CHECKPOINT_FILE = os.path.join(DATA_DIR, 'pipeline_checkpoint.json')
+
+# 마스터 파일 변경 감시 (변경 묶음 디바운스, 폴링 간격)
+WATCH_DEBOUNCE_SECONDS = float(os.getenv('WATCH_DEBOUNCE_SECONDS', 5))
+WATCH_POLL_SECONDS = float(os.getenv('WATCH_POLL_SECONDS', 2))
+
+# 단계별 성능 지표 (실행별 JSON 저장 폴더, Prometheus textfile collector 폴더)
+METRICS_DIR = os.path.join(BASE_DIR, 'reports')
+METRICS_TEXTFILE_DIR = os.getenv('METRICS_TEXTFILE_DIR', METRICS_DIR)
+
+# 단계별 메모리 추적 (RSS/tracemalloc 최대치, 상위 할당 위치 수) - 켜면 실행이 느려짐
+TRACE_MEMORY = os.getenv('KIS_TRACE_MEMORY', '0').lower() in ('1', 'true', 'yes', 'y')
+TRACE_MEMORY_TOP_N = int(os.getenv('KIS_TRACE_MEMORY_TOP_N', 5))
@@ -1,6 +1,9 @@
 import pymysql
 import pandas as pd
+import queue
+import threading
 from config import DB_CONFIG, BATCH_SIZE
+from metrics import stage_timer
 import logging
 
 logger = logging.getLogger('db_utils')
@@ -17,6 +20,78 @@ def get_connection():
         autocommit=False
     )
 
+class PooledConnection:
+    """풀에서 빌린 연결 (close() 호출 시 실제로 닫지 않고 풀에 반납)"""
+    
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+    
+    def close(self):
+        if self._conn is not None:
+            self._pool.release(self._conn)
+            self._conn = None
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+class ConnectionPool:
+    """고정 크기 연결 풀
+    
+    consistent_snapshot=True 이면 풀 생성 시 모든 연결에서 연달아
+    START TRANSACTION WITH CONSISTENT SNAPSHOT 을 실행하고 풀을 닫을 때까지 유지합니다.
+    InnoDB 스냅샷은 세션 단위이므로, 검증 중 쓰기 작업이 없다는 전제에서
+    모든 연결이 같은 시점의 데이터를 읽게 됩니다.
+    """
+    
+    def __init__(self, size, consistent_snapshot=False):
+        self.size = max(1, size)
+        self.consistent_snapshot = consistent_snapshot
+        self._idle = queue.Queue()
+        self._connections = []
+        self._lock = threading.Lock()
+        
+        # 스냅샷 시점을 맞추기 위해 연결을 미리 모두 생성
+        try:
+            for _ in range(self.size):
+                conn = get_connection()
+                self._connections.append(conn)
+            if consistent_snapshot:
+                for conn in self._connections:
+                    with conn.cursor() as cursor:
+                        cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        except Exception:
+            self.close()
+            raise
+        
+        for conn in self._connections:
+            self._idle.put(conn)
+        logger.info(f"연결 풀 생성: {self.size}개 연결 (일관된 스냅샷: {'사용' if consistent_snapshot else '미사용'})")
+    
+    def get_connection(self, timeout=None):
+        """연결 대여 (사용 후 close() 호출 시 반납)"""
+        return PooledConnection(self, self._idle.get(timeout=timeout))
+    
+    def release(self, conn):
+        self._idle.put(conn)
+    
+    def close(self):
+        """풀의 모든 연결 종료 (스냅샷 트랜잭션 종료)"""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.rollback()
+                    conn.close()
+                except Exception as e:
+                    logger.warning(f"연결 종료 중 오류: {e}")
+            self._connections = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 def execute_query(query, params=None, fetch=False, many=False):
     """SQL 쿼리를 실행합니다."""
     conn = get_connection()
@@ -37,8 +112,36 @@ def execute_query(query, params=None, fetch=False, many=False):
     finally:
         conn.close()
 
+def dataframe_rows(df, columns):
+    """DataFrame -> executemany 용 튜플 목록 (NaN/NaT/None -> None, numpy 스칼라 -> Python 값)"""
+    frame = df[columns].astype(object)
+    frame = frame.where(frame.notna(), None)
+    return list(frame.itertuples(index=False, name=None))
+
 def insert_dataframe(table_name, df, batch_size=BATCH_SIZE):
-    """DataFrame을 데이터베이스 테이블에 삽입합니다."""
+    """DataFrame을 데이터베이스 테이블에 삽입합니다. (단계 지표 'insert' 기록)"""
+    with stage_timer('insert', name=table_name) as stage:
+        stage.rows = _insert_dataframe(table_name, df, batch_size)
+        return stage.rows
+
+def _insert_statement(cursor, table_name, df_columns):
+    """테이블 컬럼 중 DataFrame 에 있는 컬럼으로 INSERT IGNORE 쿼리 생성 -> (쿼리, 컬럼 목록)"""
+    cursor.execute(f"SHOW COLUMNS FROM {table_name}")
+    columns = [column[0] for column in cursor.fetchall()]
+    
+    # DataFrame에 있는 컬럼만 사용 (created_at, updated_at 제외)
+    exclude_columns = ['created_at', 'updated_at']
+    valid_columns = [col for col in columns if col in df_columns and col not in exclude_columns]
+    if not valid_columns:
+        return None, []
+    
+    placeholders = ', '.join(['%s'] * len(valid_columns))
+    columns_str = ', '.join(valid_columns)
+    
+    # 데이터 삽입 쿼리 (IGNORE 사용하여 중복 처리)
+    return f"INSERT IGNORE INTO {table_name} ({columns_str}) VALUES ({placeholders})", valid_columns
+
+def _insert_dataframe(table_name, df, batch_size):
     if df.empty:
         logger.warning(f"{table_name} 테이블에 삽입할 데이터가 없습니다.")
         return 0
@@ -47,35 +150,15 @@ def insert_dataframe(table_name, df, batch_size=BATCH_SIZE):
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
-            # 테이블 컬럼 정보 가져오기
-            cursor.execute(f"SHOW COLUMNS FROM {table_name}")
-            columns = [column[0] for column in cursor.fetchall()]
-            
-            # DataFrame에 있는 컬럼만 사용 (created_at, updated_at 제외)
-            exclude_columns = ['created_at', 'updated_at']
-            valid_columns = [col for col in columns if col in df.columns and col not in exclude_columns]
-            
+            query, valid_columns = _insert_statement(cursor, table_name, df.columns)
             if not valid_columns:
                 logger.error(f"{table_name} 테이블에 삽입할 유효한 컬럼이 없습니다.")
                 return 0
             
-            placeholders = ', '.join(['%s'] * len(valid_columns))
-            columns_str = ', '.join(valid_columns)
-            
-            # 데이터 삽입 쿼리 (IGNORE 사용하여 중복 처리)
-            query = f"INSERT IGNORE INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-            
             # 배치 처리
             total_rows = 0
             for i in range(0, len(df), batch_size):
-                batch_df = df.iloc[i:i+batch_size]
-                values = []
-                for _, row in batch_df.iterrows():
-                    value_tuple = tuple(
-                        row[col] if col in row.index and pd.notna(row[col]) else None 
-                        for col in valid_columns
-                    )
-                    values.append(value_tuple)
+                values = dataframe_rows(df.iloc[i:i+batch_size], valid_columns)
                 
                 cursor.executemany(query, values)
                 total_rows += len(values)
@@ -91,6 +174,64 @@ def insert_dataframe(table_name, df, batch_size=BATCH_SIZE):
     finally:
         conn.close()
 
+def _insert_chunks(cursor, table_name, chunks, batch_size):
+    """DataFrame 청크를 순서대로 삽입 -> 삽입 행 수 (커밋은 호출하는 쪽에서 한 번만)"""
+    query = valid_columns = None
+    total_rows = 0
+    for chunk_no, df in enumerate(chunks, 1):
+        if df.empty:
+            continue
+        if query is None:
+            query, valid_columns = _insert_statement(cursor, table_name, df.columns)
+            if not valid_columns:
+                raise ValueError(f"{table_name} 테이블에 삽입할 유효한 컬럼이 없습니다.")
+        
+        for i in range(0, len(df), batch_size):
+            cursor.executemany(query, dataframe_rows(df.iloc[i:i+batch_size], valid_columns))
+        total_rows += len(df)
+        logger.info(f"{table_name}: 청크 {chunk_no} ({len(df):,}행) 삽입 완료, 누계 {total_rows:,}행")
+    return total_rows
+
+def insert_dataframe_chunks(table_name, chunks, batch_size=BATCH_SIZE):
+    """DataFrame 청크 이터레이터를 순서대로 삽입 (전체 DataFrame 을 만들지 않음)
+    
+    파서가 청크를 생성하는 동안 이전 청크는 삽입 후 해제되므로 최대 메모리가 청크 크기로 제한됩니다.
+    모든 청크를 한 트랜잭션으로 삽입하고 마지막에 커밋하므로, 오류 시 일부 청크만 남지 않고 전부 롤백됩니다.
+    """
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            total_rows = _insert_chunks(cursor, table_name, chunks, batch_size)
+        conn.commit()
+        logger.info(f"{table_name} 테이블에 총 {total_rows} 행이 삽입되었습니다.")
+        return total_rows
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"{table_name} 테이블 청크 삽입 오류: {e}")
+        raise
+    finally:
+        conn.close()
+
+def replace_dataframe_chunks(table_name, where_clause, params, chunks, batch_size=BATCH_SIZE):
+    """조건에 맞는 기존 행 삭제와 청크 삽입을 한 트랜잭션으로 실행 -> (삭제 행 수, 삽입 행 수)
+    
+    부분 재적재용입니다. 삽입 중 오류가 나면 삭제까지 함께 롤백되어 기존 행이 그대로 남습니다.
+    """
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            deleted = cursor.execute(f"DELETE FROM {table_name} WHERE {where_clause}", params)
+            total_rows = _insert_chunks(cursor, table_name, chunks, batch_size)
+        conn.commit()
+        logger.info(f"{table_name} 테이블 교체 완료: 삭제 {deleted}행, 삽입 {total_rows}행")
+        return deleted, total_rows
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"{table_name} 테이블 교체 오류 (롤백): {e}")
+        raise
+    finally:
+        conn.close()
+
 def count_records(table_name):
     """테이블의 레코드 수를 반환합니다."""
     conn = get_connection()
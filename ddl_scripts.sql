@@ -8,6 +8,7 @@ CREATE TABLE IF NOT EXISTS instruments (
     instrument_name VARCHAR(150) NOT NULL COMMENT '종목명',
     instrument_name_eng VARCHAR(150) COMMENT '영문종목명',
     alias_names VARCHAR(4000) COMMENT '별칭/대체이름(여러 별칭을 구분자로 연결)',
+    chosung_names VARCHAR(4000) COMMENT '종목명/별칭 초성 검색키(쉼표로 연결, 예: ㅅㅅㅈㅈ)',
     
     -- 종목 분류 정보
     instrument_type VARCHAR(20) NOT NULL COMMENT '상품유형(STOCK/FUTURE/OPTION/ELW/BOND/ETF/INDEX 등)',
@@ -52,7 +53,9 @@ CREATE TABLE IF NOT EXISTS instruments (
     credit_rating VARCHAR(10) COMMENT '신용등급(채권)',
     
     -- 분류 코드
-    industry_code VARCHAR(10) COMMENT '업종/섹터코드',
+    industry_code VARCHAR(10) COMMENT '업종/섹터코드(대분류)',
+    industry_medium_code VARCHAR(10) COMMENT '업종코드(중분류)',
+    industry_small_code VARCHAR(10) COMMENT '업종코드(소분류)',
     
     -- 상태 플래그
     is_etf CHAR(1) DEFAULT 'N' COMMENT 'ETF여부(Y/N)',
@@ -107,10 +110,14 @@ CREATE TABLE IF NOT EXISTS sector_code (
     market_type VARCHAR(10) COMMENT '시장구분',
     sector_type VARCHAR(20) COMMENT '업종구분(대/중/소)',
     parent_code VARCHAR(10) COMMENT '상위업종코드',
+    sector_depth INT COMMENT '업종 트리 깊이(대=1, 중=2, 소=3)',
+    tree_left INT COMMENT '중첩집합 구간 시작(하위 업종 범위 조회용)',
+    tree_right INT COMMENT '중첩집합 구간 끝',
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
     PRIMARY KEY (sector_code),
-    INDEX idx_parent (parent_code)
+    INDEX idx_parent (parent_code),
+    INDEX idx_tree (tree_left, tree_right)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='업종코드 정보';
 
 -- 4. 테마 코드 테이블 (theme_code)
@@ -136,3 +143,17 @@ CREATE TABLE IF NOT EXISTS instrument_theme_map (
     CONSTRAINT fk_theme_map_instrument FOREIGN KEY (instrument_code) REFERENCES instruments (instrument_code) ON DELETE CASCADE,
     CONSTRAINT fk_theme_map_theme FOREIGN KEY (theme_code) REFERENCES theme_code (theme_code) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='종목-테마 매핑 정보';
+
+-- 6. 기존 테이블 마이그레이션
+-- 초성 검색키 컬럼 추가 (instruments)
+ALTER TABLE instruments ADD COLUMN IF NOT EXISTS chosung_names VARCHAR(4000) COMMENT '종목명/별칭 초성 검색키(쉼표로 연결, 예: ㅅㅅㅈㅈ)' AFTER alias_names;
+
+-- 업종 중/소분류 컬럼 추가 (instruments)
+ALTER TABLE instruments ADD COLUMN IF NOT EXISTS industry_medium_code VARCHAR(10) COMMENT '업종코드(중분류)' AFTER industry_code;
+ALTER TABLE instruments ADD COLUMN IF NOT EXISTS industry_small_code VARCHAR(10) COMMENT '업종코드(소분류)' AFTER industry_medium_code;
+
+-- 업종 계층(중첩집합) 컬럼 추가 (sector_code)
+ALTER TABLE sector_code ADD COLUMN IF NOT EXISTS sector_depth INT COMMENT '업종 트리 깊이(대=1, 중=2, 소=3)' AFTER parent_code;
+ALTER TABLE sector_code ADD COLUMN IF NOT EXISTS tree_left INT COMMENT '중첩집합 구간 시작(하위 업종 범위 조회용)' AFTER sector_depth;
+ALTER TABLE sector_code ADD COLUMN IF NOT EXISTS tree_right INT COMMENT '중첩집합 구간 끝' AFTER tree_left;
+ALTER TABLE sector_code ADD INDEX IF NOT EXISTS idx_tree (tree_left, tree_right);
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+다운로드 매니페스트 (kis_download/kis_file_manifest.json)
+파일별 ETag, Last-Modified, 크기, SHA-256 을 기록하여 조건부 다운로드와
+변경 없는 파일의 재적재 생략에 사용합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from config import MANIFEST_FILE
+
+logger = logging.getLogger('download_manifest')
+
+class DownloadManifest:
+    """파일명 -> 메타데이터 매니페스트 (스레드 안전)"""
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('files', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"매니페스트를 읽을 수 없어 새로 생성합니다: {e}")
+
+    def get(self, filename):
+        with self._lock:
+            return dict(self.entries.get(filename, {}))
+
+    def update(self, filename, **fields):
+        with self._lock:
+            entry = self.entries.setdefault(filename, {})
+            entry.update(fields)
+            entry['checked_at'] = datetime.now().isoformat(timespec='seconds')
+            return dict(entry)
+
+    def conditional_headers(self, filename, local_path):
+        """조건부 요청 헤더 (로컬 파일이 매니페스트와 일치할 때만)"""
+        entry = self.get(filename)
+        if not entry or not os.path.exists(local_path) or os.path.getsize(local_path) != entry.get('size'):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def unchanged_files(self):
+        """마지막 다운로드에서 변경되지 않은 파일 목록"""
+        with self._lock:
+            return sorted(name for name, entry in self.entries.items() if entry.get('status') == 'unchanged')
+
+    def is_loaded(self, filename):
+        """현재 파일 내용이 이미 DB에 적재되었는지 (SHA-256 비교)"""
+        entry = self.get(filename)
+        return bool(entry.get('sha256')) and entry.get('sha256') == entry.get('loaded_sha256')
+
+    def mark_loaded(self, filenames):
+        """적재 완료 표시 (현재 SHA-256 을 loaded_sha256 으로 기록)"""
+        with self._lock:
+            for filename in filenames:
+                entry = self.entries.get(filename)
+                if entry and entry.get('sha256'):
+                    entry['loaded_sha256'] = entry['sha256']
+                    entry['loaded_at'] = datetime.now().isoformat(timespec='seconds')
+
+    def save(self):
+        """원자적 저장 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            payload = {'updated_at': datetime.now().isoformat(timespec='seconds'), 'files': self.entries}
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
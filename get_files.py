@@ -4,16 +4,24 @@
 import os
 import requests
 import csv
+import hashlib
+import json
 import logging
+import random
+import threading
 import time
-from urllib.parse import unquote
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import unquote, urlsplit
+from requests.adapters import HTTPAdapter
+from download_manifest import DownloadManifest
+from metrics import stage_timer, reset_metrics, export_metrics, format_summary
+from config import (
+    DOWNLOAD_WORKERS, DOWNLOAD_PER_HOST_LIMIT, DOWNLOAD_RETRIES,
+    DOWNLOAD_BACKOFF_SECONDS, DOWNLOAD_BACKOFF_MAX_SECONDS, DOWNLOAD_TIMEOUT, DOWNLOAD_CHUNK_SIZE,
+    URL_MANIFEST_FILE, URL_MANIFEST_TTL_HOURS
+)
 
 # 로깅 설정
 os.makedirs('logs', exist_ok=True)
@@ -27,12 +35,106 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+_host_semaphores = {}
+
+def get_http_session():
+    """keep-alive 연결을 재사용하는 공용 HTTP 세션"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=DOWNLOAD_WORKERS, pool_maxsize=DOWNLOAD_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            _session = session
+        return _session
+
+def _host_semaphore(url):
+    """호스트별 동시 요청 수 제한"""
+    host = urlsplit(url).netloc
+    with _session_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(DOWNLOAD_PER_HOST_LIMIT)
+        return _host_semaphores[host]
+
+class DownloadIntegrityError(Exception):
+    """내려받은 파일이 불완전하거나 손상된 경우 (재시도 대상)"""
+
+# 재시도 대상 예외 (연결 오류, 응답 본문 수신 중단, 무결성 검사 실패)
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    DownloadIntegrityError
+)
+
+def backoff_delay(attempt):
+    """지수 백오프 + full jitter 대기 시간 (상한 DOWNLOAD_BACKOFF_MAX_SECONDS)"""
+    return random.uniform(0, min(DOWNLOAD_BACKOFF_MAX_SECONDS, DOWNLOAD_BACKOFF_SECONDS * (2 ** attempt)))
+
+def request_with_retry(url, session=None, consume=None, prepare_headers=None, on_range_error=None, **kwargs):
+    """호스트별 동시성 제한 + 지수 백오프(jitter) 재시도 GET 요청 (최대 DOWNLOAD_RETRIES 회)
+    
+    consume 이 주어지면 응답 본문 처리까지 호스트 동시성 제한 안에서 실행하고 그 결과를 반환합니다.
+    prepare_headers 는 매 시도마다 호출되어 추가 헤더(이어받기 Range 등)를 반환하고,
+    on_range_error 는 416 응답 시 부분 파일을 폐기하는 데 사용됩니다.
+    """
+    session = session or get_http_session()
+    kwargs.setdefault('timeout', DOWNLOAD_TIMEOUT)
+    base_headers = kwargs.pop('headers', None) or {}
+    
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        headers = dict(base_headers)
+        if prepare_headers is not None:
+            headers.update(prepare_headers())
+        try:
+            with _host_semaphore(url):
+                response = session.get(url, headers=headers, **kwargs)
+                if response.status_code == 416 and on_range_error is not None:
+                    # 이어받을 위치가 원격 파일 크기를 벗어남 -> 부분 파일 폐기 후 처음부터
+                    on_range_error()
+                    response.close()
+                    error = requests.HTTPError("416 응답 (Range 불일치)", response=response)
+                elif response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    if consume is None:
+                        return response
+                    with response:
+                        return consume(response)
+                else:
+                    response.close()
+                    error = requests.HTTPError(f"{response.status_code} 응답", response=response)
+        except RETRY_EXCEPTIONS as e:
+            error = e
+        
+        if attempt == DOWNLOAD_RETRIES:
+            raise error
+        delay = backoff_delay(attempt)
+        logger.warning(f"  재시도 {attempt + 1}/{DOWNLOAD_RETRIES} ({delay:.1f}초 후): {url} - {error}")
+        time.sleep(delay)
+
 def safe_name(name):
     """윈도우 파일명에서 특수문자 제거/변환"""
     return "".join(c if c not in r'\/:*?"<>|' else '_' for c in name)
 
 def fetch_kis_api_page_with_selenium():
     """Selenium을 사용하여 KIS API 포털에서 테이블 정보 추출"""
+    # 브라우저가 필요한 경로에서만 selenium 로드
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    
     logger.info("Selenium으로 KIS API 포털 접근 중...")
     
     options = Options()
@@ -182,8 +284,18 @@ def get_master_file_urls():
         {"name": "테마코드", "file": "theme_code.mst.zip"},
         {"name": "채권코드", "file": "bond_code.mst.zip"},
         
-        # 해외종목 (나스닥 예시)
+        # 해외종목
         {"name": "미국(나스닥)", "file": "nasmst.cod.zip"},
+        {"name": "미국(뉴욕)", "file": "nysmst.cod.zip"},
+        {"name": "미국(아멕스)", "file": "amsmst.cod.zip"},
+        {"name": "중국(상해)", "file": "shsmst.cod.zip"},
+        {"name": "중국(상해지수)", "file": "shimst.cod.zip"},
+        {"name": "중국(심천)", "file": "szsmst.cod.zip"},
+        {"name": "중국(심천지수)", "file": "szimst.cod.zip"},
+        {"name": "일본(도쿄)", "file": "tsemst.cod.zip"},
+        {"name": "홍콩", "file": "hksmst.cod.zip"},
+        {"name": "베트남(하노이)", "file": "hnxmst.cod.zip"},
+        {"name": "베트남(호치민)", "file": "hsxmst.cod.zip"},
     ]
     
     # 회원사코드는 zip이 아님
@@ -203,92 +315,239 @@ def get_master_file_urls():
     
     return result
 
-def download_files(file_info_list, download_folder):
-    """파일 다운로드 (마스터, 헤더, 샘플)"""
-    # 기존 코드 유지
+def download_files(file_info_list, download_folder, session=None, manifest=None):
+    """파일 다운로드 (마스터, 헤더, 샘플) - 공용 세션으로 동시 다운로드"""
     os.makedirs(download_folder, exist_ok=True)
+    session = session or get_http_session()
     
-    results = []
     total_files = len(file_info_list)
+    logger.info(f"{total_files}개 항목 동시 다운로드 시작 (작업자 {DOWNLOAD_WORKERS}개, 호스트당 {DOWNLOAD_PER_HOST_LIMIT}개)")
     
-    for idx, info in enumerate(file_info_list, 1):
-        logger.info(f"[{idx}/{total_files}] {info['name']} 다운로드 중...")
-        
-        files = []
-        
-        # 1. 마스터 파일 다운로드
-        fn_dl = download_single_file(
-            info['download_url'], 
-            f"{info['name']}_마스터_", 
-            download_folder
-        )
-        files.append(fn_dl)
-        
-        # 2. 헤더정보 다운로드 (GitHub)
-        fn_header = ''
-        if info['header_url'] and info['header_url'] != "#" and info['header_url'] != "":
-            fn_header = download_single_file(
-                info['header_url'],
-                f"{info['name']}_헤더_",
-                download_folder
-            )
-        files.append(fn_header)
-        
-        # 3. 샘플코드 다운로드 (GitHub)
-        fn_sample = ''
-        if info['sample_url'] and info['sample_url'] != "#" and info['sample_url'] != "":
-            fn_sample = download_single_file(
-                info['sample_url'],
-                f"{info['name']}_샘플_",
-                download_folder
-            )
-        files.append(fn_sample)
-        
+    # (항목 순번, 열 순번) -> 다운로드 작업
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix='download') as executor:
+        for idx, info in enumerate(file_info_list):
+            # 1. 마스터 파일, 2. 헤더정보 (GitHub), 3. 샘플코드 (GitHub)
+            for column, (url_key, label) in enumerate([
+                ('download_url', '마스터'), ('header_url', '헤더'), ('sample_url', '샘플')
+            ]):
+                url = info.get(url_key)
+                if url and url != '#':
+                    jobs[(idx, column)] = executor.submit(
+                        download_single_file, url, f"{info['name']}_{label}_", download_folder, session, manifest
+                    )
+    
+    results = []
+    for idx, info in enumerate(file_info_list):
+        files = [jobs[(idx, column)].result() if (idx, column) in jobs else '' for column in range(3)]
         results.append([info['name']] + files)
-        
-        # 요청 간 간격
-        time.sleep(0.5)
     
     return results
 
-def download_single_file(url, prefix, folder):
-    """단일 파일 다운로드 (마스터 파일 또는 GitHub raw 파일)"""
-    # 기존 코드 유지
+def verify_zip(path):
+    """ZIP 무결성 검사 (멤버별 CRC 를 스트리밍으로 확인, 메모리 사용량 일정)"""
+    try:
+        with zipfile.ZipFile(path, 'r') as zip_ref:
+            bad_member = zip_ref.testzip()
+    except (zipfile.BadZipFile, EOFError, OSError) as e:
+        raise DownloadIntegrityError(f"ZIP 파일 손상: {e}")
+    if bad_member is not None:
+        raise DownloadIntegrityError(f"ZIP CRC 불일치: {bad_member}")
+
+def _part_paths(file_path):
+    """부분 다운로드 파일과 이어받기 상태 파일 경로"""
+    part_path = f"{file_path}.part"
+    return part_path, f"{part_path}.json"
+
+def _load_part_state(file_path, url):
+    """이어받기 가능한 부분 파일 상태 -> dict 또는 None
+    
+    같은 URL 이고 검증자(ETag/Last-Modified)가 있을 때만 이어받습니다.
+    검증자는 If-Range 로 보내므로 원격 파일이 바뀌었다면 서버가 전체(200)를 다시 보냅니다.
+    """
+    part_path, state_path = _part_paths(file_path)
+    if not os.path.exists(part_path) or not os.path.exists(state_path):
+        return None
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if state.get('url') != url or not (state.get('etag') or state.get('last_modified')):
+        return None
+    state['offset'] = os.path.getsize(part_path)
+    if state['offset'] == 0 or (state.get('total') and state['offset'] >= state['total']):
+        return None
+    return state
+
+def _save_part_state(file_path, url, response, offset, total):
+    _, state_path = _part_paths(file_path)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'offset': offset,
+            'total': total
+        }, f)
+
+def discard_partial(file_path):
+    """부분 다운로드 파일 삭제"""
+    for path in _part_paths(file_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+def _resume_headers(file_path, url):
+    """이어받기 요청 헤더 (Range + If-Range)"""
+    state = _load_part_state(file_path, url)
+    if state is None:
+        return {}
+    return {
+        'Range': f"bytes={state['offset']}-",
+        'If-Range': state.get('etag') or state['last_modified']
+    }
+
+def _stream_to_part(response, file_path, url):
+    """응답 본문을 부분 파일(.part)에 청크 단위로 저장하며 SHA-256 계산 -> (부분 파일, 크기, 해시)
+    
+    206 응답이면 기존 부분 파일 뒤에 이어 쓰고, 전송이 중간에 끊기면 부분 파일과
+    오프셋/검증자를 남겨 다음 시도에서 Range 요청으로 이어받습니다.
+    """
+    part_path, _ = _part_paths(file_path)
+    digest = hashlib.sha256()
+    offset = 0
+    
+    if response.status_code == 206:
+        # Content-Range: bytes <start>-<end>/<total>
+        content_range = response.headers.get('Content-Range', '')
+        try:
+            range_spec, total = content_range.split(' ', 1)[1].split('/')
+            start = int(range_spec.split('-')[0])
+        except (IndexError, ValueError):
+            discard_partial(file_path)
+            raise DownloadIntegrityError(f"잘못된 Content-Range: {content_range!r}")
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if start != offset:
+            discard_partial(file_path)
+            raise DownloadIntegrityError(f"이어받기 위치 불일치: 요청 {offset:,}, 응답 {start:,}")
+        total = int(total) if total != '*' else None
+        
+        # 기존 부분 파일 해시 재계산
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        logger.info(f"  ↻ 이어받기: {os.path.basename(file_path)} ({offset:,}bytes 부터)")
+        mode = 'ab'
+    else:
+        length = response.headers.get('Content-Length')
+        total = int(length) if length and 'Content-Encoding' not in response.headers else None
+        mode = 'wb'
+    
+    size = offset
+    _save_part_state(file_path, url, response, offset, total)
+    try:
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+    except RETRY_EXCEPTIONS:
+        # 받은 데이터까지 남겨두고 다음 시도에서 이어받기
+        _save_part_state(file_path, url, response, size, total)
+        raise
+    except BaseException:
+        discard_partial(file_path)
+        raise
+    
+    try:
+        if total is not None and total != size:
+            raise DownloadIntegrityError(f"수신 크기 불일치: {size:,}/{total:,}bytes")
+        if file_path.lower().endswith('.zip'):
+            verify_zip(part_path)
+    except DownloadIntegrityError:
+        discard_partial(file_path)
+        raise
+    return part_path, size, digest.hexdigest()
+
+def download_single_file(url, prefix, folder, session=None, manifest=None):
+    """단일 파일 다운로드 (마스터 파일 또는 GitHub raw 파일)
+    
+    응답을 임시 파일로 스트리밍하면서 해시를 계산하고, ZIP 은 CRC 검사를 통과한 경우에만
+    원자적으로 교체(os.replace)하여 kis_download/ 에 게시합니다.
+    manifest 가 주어지면 ETag/Last-Modified 조건부 요청을 보내고, 304 응답이거나
+    내려받은 내용의 SHA-256 이 기존과 같으면 파일을 덮어쓰지 않고 'unchanged'로 기록합니다.
+    """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
         # GitHub URL인 경우 /blob/을 /raw/로 변환
         if 'github.com' in url and '/blob/' in url:
             url = url.replace('/blob/', '/raw/')
         
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # 파일명 결정
+        # URL에서 파일명을 알 수 있으면 요청 전에 조건부 헤더 구성
         filename = safe_name(unquote(os.path.basename(url)))
-        if not filename or filename == '' or filename == '/':
-            # Content-Disposition 헤더에서 파일명 추출 시도
-            content_disposition = response.headers.get('content-disposition', '')
-            if 'filename=' in content_disposition:
-                filename = content_disposition.split('filename=')[1].strip('"\'')
-            else:
-                # GitHub 파일인 경우 URL에서 파일명 추출
-                if 'github.com' in url:
-                    url_parts = url.split('/')
-                    filename = url_parts[-1] if url_parts else 'unknown_file'
+        request_headers = {}
+        known_path = None
+        if filename and filename != '/':
+            known_path = os.path.join(folder, f"{prefix}{filename}")
+            # 이어받을 부분 파일이 있으면 조건부 요청 대신 Range 요청
+            if manifest is not None and _load_part_state(known_path, url) is None:
+                request_headers = manifest.conditional_headers(f"{prefix}{filename}", known_path)
+        
+        def consume(response):
+            name = filename
+            # 파일명 결정
+            if not name or name == '' or name == '/':
+                # Content-Disposition 헤더에서 파일명 추출 시도
+                content_disposition = response.headers.get('content-disposition', '')
+                if 'filename=' in content_disposition:
+                    name = content_disposition.split('filename=')[1].strip('"\'')
                 else:
-                    filename = 'unknown_file'
-        
-        full_filename = f"{prefix}{filename}"
-        file_path = os.path.join(folder, full_filename)
-        
-        with open(file_path, "wb") as f:
-            f.write(response.content)
-        
-        logger.info(f"  ✓ 다운로드 성공: {full_filename}")
-        return full_filename
+                    # GitHub 파일인 경우 URL에서 파일명 추출
+                    if 'github.com' in url:
+                        url_parts = url.split('/')
+                        name = url_parts[-1] if url_parts else 'unknown_file'
+                    else:
+                        name = 'unknown_file'
+            
+            full_filename = f"{prefix}{name}"
+            file_path = os.path.join(folder, full_filename)
+            
+            if response.status_code == 304:
+                manifest.update(full_filename, url=url, status='unchanged')
+                logger.info(f"  = 변경 없음 (304): {full_filename}")
+                return full_filename
+            
+            part_path, size, sha256 = _stream_to_part(response, file_path, url)
+            
+            if manifest is not None:
+                previous = manifest.get(full_filename)
+                unchanged = previous.get('sha256') == sha256 and os.path.exists(file_path)
+                manifest.update(
+                    full_filename,
+                    url=url,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    size=size,
+                    sha256=sha256,
+                    status='unchanged' if unchanged else 'updated'
+                )
+                if unchanged:
+                    discard_partial(file_path)
+                    logger.info(f"  = 변경 없음 (해시 동일): {full_filename}")
+                    return full_filename
+            
+            stage.bytes = size
+            os.replace(part_path, file_path)
+            discard_partial(file_path)
+            logger.info(f"  ✓ 다운로드 성공: {full_filename} ({size:,}bytes)")
+            return full_filename
+        
+        with stage_timer('download', name=f"{prefix}{filename}") as stage:
+            return request_with_retry(
+                url, session=session, consume=consume, headers=request_headers, stream=True,
+                prepare_headers=(lambda: _resume_headers(known_path, url)) if known_path else None,
+                on_range_error=(lambda: discard_partial(known_path)) if known_path else None
+            )
         
     except Exception as e:
         logger.error(f"  ✗ 다운로드 실패 ({url}): {e}")
@@ -317,78 +576,149 @@ def save_csv_report(results, csv_file):
         # CSV 저장에 실패해도 전체 프로세스는 성공으로 처리
         logger.info("CSV 저장은 실패했지만 마스터 파일 다운로드는 성공")
 
-def get_master_file_urls_from_html():
-    """마스터 파일 목록을 KIS 테이블 HTML에서 추출"""
-    logger.info("KIS HTML 파일을 통한 링크 추출 시도...")
+def parse_kis_table_html(html):
+    """KIS 테이블 HTML 에서 파일 정보 목록 추출 (테이블이 없으면 빈 목록)"""
+    from bs4 import BeautifulSoup
     
     file_info_list = []
+    soup = BeautifulSoup(html, 'html.parser')
+    tables = soup.select('table.data-table')
+    
+    for table in tables:
+        rows = table.find_all('tr')
+        
+        for row in rows:
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+            
+            # 첫 번째 셀: 다운로드 링크
+            download_link = cells[0].find('a')
+            if not download_link:
+                continue
+            
+            kor_name = safe_name(download_link.text.strip())
+            url_download = download_link.get('href', '')
+            
+            if not url_download or url_download == '#':
+                continue
+            
+            # 두 번째 셀: 헤더/샘플 링크
+            url_header = ''
+            url_sample = ''
+            
+            links = cells[1].find_all('a')
+            for link in links:
+                link_text = link.text.strip()
+                href = link.get('href', '')
+                
+                if link_text == '헤더정보':
+                    url_header = href
+                elif link_text == '샘플코드':
+                    url_sample = href
+            
+            # 결과 추가
+            file_info_list.append({
+                'name': kor_name,
+                'download_url': url_download,
+                'header_url': url_header,
+                'sample_url': url_sample
+            })
+    
+    return file_info_list
+
+def get_master_file_urls_from_html(html_path='kis_table.html', use_backup=True):
+    """마스터 파일 목록을 KIS 테이블 HTML에서 추출
+    
+    use_backup=False 이면 HTML 이 없거나 파싱에 실패했을 때 정적 백업 대신 빈 목록을 반환합니다
+    (resolve_file_info_list 가 Selenium/백업 순서를 직접 결정).
+    """
+    logger.info("KIS HTML 파일을 통한 링크 추출 시도...")
+    fallback = get_static_backup_urls if use_backup else list
     
     try:
         # KIS HTML 파일 읽기 (없으면 백업 사용)
-        html_path = 'kis_table.html'
         if not os.path.exists(html_path):
-            logger.warning(f"{html_path} 파일이 없습니다. 백업 URL 사용.")
-            return get_static_backup_urls()
+            logger.warning(f"{html_path} 파일이 없습니다." + (" 백업 URL 사용." if use_backup else ""))
+            return fallback()
         
         with open(html_path, 'r', encoding='utf-8') as f:
             html = f.read()
         
-        soup = BeautifulSoup(html, 'html.parser')
-        tables = soup.select('table.data-table')
-        
-        if not tables:
-            logger.warning("HTML에서 테이블을 찾을 수 없습니다. 백업 URL 사용.")
-            return get_static_backup_urls()
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) < 2:
-                    continue
-                
-                # 첫 번째 셀: 다운로드 링크
-                download_link = cells[0].find('a')
-                if not download_link:
-                    continue
-                
-                kor_name = safe_name(download_link.text.strip())
-                url_download = download_link.get('href', '')
-                
-                if not url_download or url_download == '#':
-                    continue
-                
-                # 두 번째 셀: 헤더/샘플 링크
-                url_header = ''
-                url_sample = ''
-                
-                links = cells[1].find_all('a')
-                for link in links:
-                    link_text = link.text.strip()
-                    href = link.get('href', '')
-                    
-                    if link_text == '헤더정보':
-                        url_header = href
-                    elif link_text == '샘플코드':
-                        url_sample = href
-                
-                # 결과 추가
-                file_info = {
-                    'name': kor_name,
-                    'download_url': url_download,
-                    'header_url': url_header,
-                    'sample_url': url_sample
-                }
-                
-                file_info_list.append(file_info)
+        file_info_list = parse_kis_table_html(html)
+        if not file_info_list:
+            logger.warning("HTML에서 테이블을 찾을 수 없습니다." + (" 백업 URL 사용." if use_backup else ""))
+            return fallback()
         
         logger.info(f"HTML에서 {len(file_info_list)}개 파일 정보 추출 완료")
         return file_info_list
         
     except Exception as e:
         logger.error(f"HTML 파싱 오류: {e}")
-        return get_static_backup_urls()
+        return fallback()
+
+def load_url_manifest(path=URL_MANIFEST_FILE, max_age_hours=URL_MANIFEST_TTL_HOURS):
+    """캐시된 URL 매니페스트 로드 (없거나 만료되었으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        resolved_at = datetime.fromisoformat(cached['resolved_at'])
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"URL 매니페스트를 읽을 수 없습니다: {e}")
+        return None
+    
+    age_hours = (datetime.now() - resolved_at).total_seconds() / 3600
+    if max_age_hours is not None and age_hours > max_age_hours:
+        logger.info(f"URL 매니페스트 만료 ({age_hours:.1f}시간 경과)")
+        return None
+    return cached
+
+def save_url_manifest(file_info_list, source, path=URL_MANIFEST_FILE):
+    """URL 매니페스트 저장 (원자적 교체)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'resolved_at': datetime.now().isoformat(timespec='seconds'),
+            'source': source,
+            'files': file_info_list
+        }, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def resolve_file_info_list(refresh=False, use_selenium=False, html_path='kis_table.html'):
+    """다운로드 대상 URL 목록 결정
+    
+    1. 캐시된 URL 매니페스트 (만료 전)
+    2. 정적 HTML(kis_table.html) 파싱으로 갱신
+    3. use_selenium=True 인 경우에만 Selenium 으로 포털 조회
+    4. 정적 백업 URL 목록
+    """
+    if not refresh:
+        cached = load_url_manifest()
+        if cached and cached.get('files'):
+            logger.info(f"캐시된 URL 매니페스트 사용: {len(cached['files'])}개 항목 (출처: {cached.get('source')}, {cached['resolved_at']})")
+            return cached['files']
+    
+    # HTML 추출 결과를 그대로 매니페스트에 캐시 (실패 시 빈 목록 -> Selenium/백업)
+    file_info_list = get_master_file_urls_from_html(html_path, use_backup=False)
+    source = 'html' if file_info_list else None
+    
+    if not file_info_list and use_selenium:
+        try:
+            file_info_list = fetch_kis_api_page_with_selenium()
+            source = 'selenium'
+        except ImportError as e:
+            logger.error(f"Selenium 을 사용할 수 없습니다: {e}")
+    
+    if not file_info_list:
+        file_info_list = get_static_backup_urls()
+        source = 'static_backup'
+    
+    save_url_manifest(file_info_list, source)
+    logger.info(f"URL 매니페스트 갱신: {len(file_info_list)}개 항목 (출처: {source})")
+    return file_info_list
 
 def get_static_backup_urls():
     """정적 백업 URL (모든 방법 실패 시 마지막 수단)"""
@@ -418,8 +748,18 @@ def get_static_backup_urls():
         {"name": "테마코드", "file": "theme_code.mst.zip"},
         {"name": "채권코드", "file": "bond_code.mst.zip"},
         
-        # 해외종목 (나스닥 예시)
+        # 해외종목
         {"name": "미국(나스닥)", "file": "nasmst.cod.zip"},
+        {"name": "미국(뉴욕)", "file": "nysmst.cod.zip"},
+        {"name": "미국(아멕스)", "file": "amsmst.cod.zip"},
+        {"name": "중국(상해)", "file": "shsmst.cod.zip"},
+        {"name": "중국(상해지수)", "file": "shimst.cod.zip"},
+        {"name": "중국(심천)", "file": "szsmst.cod.zip"},
+        {"name": "중국(심천지수)", "file": "szimst.cod.zip"},
+        {"name": "일본(도쿄)", "file": "tsemst.cod.zip"},
+        {"name": "홍콩", "file": "hksmst.cod.zip"},
+        {"name": "베트남(하노이)", "file": "hnxmst.cod.zip"},
+        {"name": "베트남(호치민)", "file": "hsxmst.cod.zip"},
     ]
     
     # 회원사코드는 zip이 아님
@@ -439,13 +779,14 @@ def get_static_backup_urls():
     
     return result
 
-def main():
+def main(refresh_urls=False, use_selenium=False):
     """메인 실행 함수"""
     try:
         logger.info("=== KIS 마스터 파일 + 헤더정보 + 샘플코드 자동 다운로드 시작 ===")
+        reset_metrics()
         
-        # 1. Selenium으로 KIS API 포털에서 파일 정보 가져오기
-        file_info_list = fetch_kis_api_page_with_selenium()
+        # 1. URL 매니페스트에서 파일 정보 가져오기 (Selenium 은 명시적으로 요청한 경우에만)
+        file_info_list = resolve_file_info_list(refresh=refresh_urls, use_selenium=use_selenium)
         
         if not file_info_list:
             logger.error("다운로드할 파일 정보를 찾을 수 없습니다.")
@@ -453,7 +794,9 @@ def main():
         
         # 2. 파일 다운로드 (마스터 + 헤더 + 샘플)
         download_folder = 'kis_download'
-        results = download_files(file_info_list, download_folder)
+        manifest = DownloadManifest()
+        results = download_files(file_info_list, download_folder, manifest=manifest)
+        manifest.save()
         
         # 3. CSV 리포트 저장 (실패해도 전체 프로세스는 계속)
         csv_file = os.path.join(download_folder, 'kis_file_sets.csv')
@@ -470,8 +813,17 @@ def main():
         logger.info(f"마스터파일: {successful_masters}/{total_files}개 성공")
         logger.info(f"헤더정보: {successful_headers}/{total_files}개 성공")
         logger.info(f"샘플코드: {successful_samples}/{total_files}개 성공")
+        
+        downloaded = {name for row in results for name in row[1:] if name}
+        unchanged = [name for name in manifest.unchanged_files() if name in downloaded]
+        logger.info(f"변경 없음: {len(unchanged)}/{len(downloaded)}개 파일")
+        for name in unchanged:
+            logger.info(f"  = {name}")
         logger.info(f"저장 위치: {download_folder}")
         
+        export_metrics('download')
+        for line in format_summary(limit=5):
+            logger.info(f"  ⏱ {line}")
         return True
         
     except Exception as e:
@@ -479,7 +831,14 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='KIS 마스터 파일 다운로드')
+    parser.add_argument('--refresh-urls', action='store_true', help='캐시된 URL 매니페스트를 무시하고 다시 조회')
+    parser.add_argument('--selenium', action='store_true', help='HTML 파싱 실패 시 Selenium 으로 포털 조회')
+    args = parser.parse_args()
+    
+    success = main(refresh_urls=args.refresh_urls, use_selenium=args.selenium)
     if success:
         print("✅ KIS 마스터파일 + 헤더정보 + 샘플코드 다운로드 성공!")
     else:
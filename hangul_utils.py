@@ -0,0 +1,50 @@
+"""
+한글 처리 유틸리티 (초성 추출 등)
+"""
+
+# 초성 19자 (유니코드 한글 음절 배열 순서)
+CHOSUNG_LIST = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+CHOSUNG_SET = set(CHOSUNG_LIST)
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+# 중성(21) x 종성(28)
+SYLLABLES_PER_CHOSUNG = 588
+
+def to_chosung(text):
+    """문자열을 초성 키로 변환 (한글 음절은 초성, 그 외 문자는 대문자로 유지, 공백 제거)"""
+    if not text:
+        return ''
+
+    chars = []
+    for ch in str(text):
+        code = ord(ch)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            chars.append(CHOSUNG_LIST[(code - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSUNG])
+        elif ch.isspace():
+            continue
+        else:
+            chars.append(ch.upper())
+    return ''.join(chars)
+
+def has_chosung(text):
+    """초성 자모가 하나라도 포함되어 있는지 여부"""
+    return any(ch in CHOSUNG_SET for ch in text or '')
+
+def build_chosung_keys(names):
+    """종목명/별칭 목록에서 중복 없는 초성 키 문자열 생성 (쉼표 구분)"""
+    keys = []
+    seen = set()
+    for name in names:
+        if not name:
+            continue
+        key = to_chosung(name)
+        # 숫자 코드, 영문명 등 한글이 없는 별칭은 초성 키로 쓰지 않음
+        if not has_chosung(key) or key in seen:
+            continue
+        seen.add(key)
+        keys.append(key)
+    return ','.join(keys)
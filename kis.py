@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+KIS 종목정보 ETL 통합 CLI
+
+    python kis.py download [--refresh-urls] [--selenium]
+    python kis.py reload [--force] [--items 코스피 ELW ...] [--trace-memory]
+    python kis.py validate                 적재 전 파일 검증 (DB 접근 없음)
+    python kis.py report                   DB 검증 및 마크다운 리포트
+    python kis.py lookup 005930 [--search 삼성]
+    python kis.py manifest [--check]       다운로드/적재 상태 확인
+
+pandas, pymysql, requests 등 무거운 모듈은 해당 하위 명령을 실행할 때만 import 하므로
+lookup/manifest 같은 조회 명령은 빠르게 시작합니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+def _setup_quiet_logging(level=logging.WARNING):
+    """조회 명령용 로깅 (파일 로그를 쓰는 모듈은 import 시 각자 설정)"""
+    logging.basicConfig(level=level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+def cmd_download(args):
+    os.makedirs('logs', exist_ok=True)
+    from get_files import main as download_main
+    return download_main(refresh_urls=args.refresh_urls, use_selenium=args.selenium)
+
+def cmd_reload(args):
+    os.makedirs('logs', exist_ok=True)
+    import reload_data
+    if args.trace_memory:
+        from metrics import get_recorder
+        get_recorder().enable_memory_tracing()
+    if args.items:
+        return reload_data.reload_sets(args.items)
+    return reload_data.main(force=args.force)
+
+def cmd_validate(args):
+    """파싱 결과 적재 전 검증 (reload_data.validate_frames 와 같은 검사)"""
+    _setup_quiet_logging(logging.INFO if args.verbose else logging.WARNING)
+    import pandas as pd
+    from config import BOND_ITEM, FILE_SETS_CSV, SECTOR_MASTER_FILE, SECTOR_HEADER_FILE, THEME_MASTER_FILE, THEME_HEADER_FILE
+    from loaders.instrument_loader import InstrumentLoader
+    from loaders.member_loader import MemberLoader
+    from parsers.sector_parser import SectorParser
+    from parsers.theme_parser import ThemeParser
+    from validation.frame_validator import FrameValidator
+
+    file_mapping = pd.read_csv(FILE_SETS_CSV, encoding='utf-8')
+    validator = FrameValidator()
+    instrument_loader = InstrumentLoader(file_mapping)
+    validator.validate_instruments(instrument_loader.parse_all())
+    if instrument_loader.has_item(BOND_ITEM):
+        validator.validate_instrument_chunks(BOND_ITEM, instrument_loader.iter_chunks(BOND_ITEM))
+    validator.validate_reference(
+        member_data=MemberLoader(file_mapping).get_parser().get_data(),
+        sector_data=SectorParser(SECTOR_MASTER_FILE, SECTOR_HEADER_FILE).get_data(),
+        theme_data=ThemeParser(THEME_MASTER_FILE, THEME_HEADER_FILE).get_data()
+    )
+    summary = validator.summary()
+    for check in summary['checks']:
+        mark = '✓' if check['result'] else ('✗' if check['critical'] else '!')
+        print(f"{mark} {check['description']}: {check['value']}")
+        for sample in check['samples'][:5]:
+            print(f"    {sample}")
+    print(f"{summary['passed_checks']}/{summary['total_checks']} 통과, "
+          f"치명적 오류 {summary['critical_failures']}개, 경고 {summary['warnings']}개")
+    return summary['result']
+
+def cmd_report(args):
+    os.makedirs('logs', exist_ok=True)
+    os.makedirs('reports', exist_ok=True)
+    from validation_report import main as validation_main
+    return validation_main()
+
+def cmd_lookup(args):
+    _setup_quiet_logging()
+    from search.instrument_index import InstrumentIndex
+
+    try:
+        index = InstrumentIndex.from_snapshot(args.snapshot) if args.snapshot else InstrumentIndex.from_snapshot()
+    except FileNotFoundError as e:
+        print(f"스냅샷 파일이 없습니다: {e.filename} (python lookup_server.py --build-snapshot files 로 생성)", file=sys.stderr)
+        return False
+
+    found = True
+    results = {}
+    for code in args.codes:
+        results[code] = index.lookup(code)
+        found = found and results[code] is not None
+    if args.search:
+        results['search'] = index.search(args.search, market_type=args.market_type, limit=args.limit)
+    print(json.dumps(results, ensure_ascii=False, indent=2, default=str))
+    return found
+
+def reload_master_filenames(csv_path):
+    """kis_file_sets.csv 에서 재적재 대상 마스터 파일명 (pandas 없이 읽음)"""
+    import csv
+    from config import RELOAD_ITEMS, SECTOR_MASTER_FILE, THEME_MASTER_FILE
+
+    names = {SECTOR_MASTER_FILE, THEME_MASTER_FILE}
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            if row.get('항목명') in RELOAD_ITEMS and row.get('종목다운로드'):
+                names.add(row['종목다운로드'])
+    return sorted(names)
+
+def cmd_manifest(args):
+    _setup_quiet_logging()
+    from config import FILE_SETS_CSV
+    from download_manifest import DownloadManifest
+
+    manifest = DownloadManifest()
+    try:
+        master_files = reload_master_filenames(FILE_SETS_CSV)
+    except FileNotFoundError:
+        master_files = sorted(manifest.entries)
+
+    pending = []
+    for name in master_files:
+        entry = manifest.get(name)
+        loaded = manifest.is_loaded(name)
+        if not loaded:
+            pending.append(name)
+        if args.check and loaded:
+            continue
+        state = '적재됨' if loaded else ('미다운로드' if not entry else '적재 필요')
+        size = f"{entry['size']:,}bytes" if entry.get('size') else '-'
+        print(f"{state:<6} {name:<45} {entry.get('status', '-'):<9} {size:>14} {entry.get('checked_at', '-')}")
+    print(f"재적재 대상 {len(master_files)}개 중 적재 필요 {len(pending)}개")
+    return not (args.check and pending)
+
+def build_parser():
+    arg_parser = argparse.ArgumentParser(prog='kis', description='KIS 종목정보 ETL 통합 CLI')
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+
+    download = subparsers.add_parser('download', help='마스터 파일 다운로드')
+    download.add_argument('--refresh-urls', action='store_true', help='kis_table.html 파싱으로 URL 목록 갱신')
+    download.add_argument('--selenium', action='store_true', help='HTML 파싱 실패 시 Selenium 조회')
+    download.set_defaults(func=cmd_download)
+
+    reload = subparsers.add_parser('reload', help='DB 재적재')
+    reload.add_argument('--force', action='store_true', help='변경된 파일이 없어도 재적재')
+    reload.add_argument('--items', nargs='+', help='지정 항목만 부분 재적재 (예: 코스피 ELW 업종코드)')
+    reload.add_argument('--trace-memory', action='store_true', help='단계별 메모리 최대치 기록')
+    reload.set_defaults(func=cmd_reload)
+
+    validate = subparsers.add_parser('validate', help='적재 전 파일 검증 (DB 접근 없음)')
+    validate.add_argument('-v', '--verbose', action='store_true', help='파싱 로그 출력')
+    validate.set_defaults(func=cmd_validate)
+
+    report = subparsers.add_parser('report', help='DB 검증 및 마크다운 리포트 생성')
+    report.set_defaults(func=cmd_report)
+
+    lookup = subparsers.add_parser('lookup', help='스냅샷에서 종목 조회/검색')
+    lookup.add_argument('codes', nargs='*', help='종목코드 또는 단축코드')
+    lookup.add_argument('--search', help='종목명/별칭/초성 검색어')
+    lookup.add_argument('--market-type', help='검색 시장 구분 필터')
+    lookup.add_argument('--limit', type=int, default=20, help='검색 결과 수')
+    lookup.add_argument('--snapshot', help='스냅샷 파일 경로 (기본: kis_download/instruments_snapshot.json)')
+    lookup.set_defaults(func=cmd_lookup)
+
+    manifest = subparsers.add_parser('manifest', help='다운로드 매니페스트/적재 상태 확인')
+    manifest.add_argument('--check', action='store_true', help='적재가 필요한 파일만 출력하고 있으면 종료 코드 1')
+    manifest.set_defaults(func=cmd_manifest)
+    return arg_parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return 0 if args.func(args) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
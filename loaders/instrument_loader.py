@@ -1,6 +1,9 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from db_utils import insert_dataframe, count_records
+from config import BOND_ITEM, DERIVATIVE_ITEMS, OVERSEAS_ITEMS, OVERSEAS_PARSE_WORKERS
+from db_utils import insert_dataframe, insert_dataframe_chunks, replace_dataframe_chunks, count_records
+from metrics import stage_timer
 from parsers.domestic_stock_parser import DomesticStockParser
 
 logger = logging.getLogger('instrument_loader')
@@ -11,69 +14,247 @@ class InstrumentLoader:
     def __init__(self, file_mapping):
         self.file_mapping = file_mapping
         self.table_name = 'instruments'
+        self.parsers = {}  # 항목명 -> 파서 (파싱 결과 재사용)
     
-    def load_domestic_stocks(self):
-        """국내 주식 로드 (코스피, 코스닥, 코넥스)"""
-        total_loaded = 0
+    def get_parser(self, market):
+        """항목명에 해당하는 파서 반환 (한 번만 생성)"""
+        if market not in self.parsers:
+            row = self.file_mapping[self.file_mapping['항목명'] == market].iloc[0]
+            master_file = row['종목다운로드']
+            header_file = row['헤더정보']
+            
+            if market == BOND_ITEM:
+                from parsers.bond_parser import BondParser
+                self.parsers[market] = BondParser(master_file, header_file, market)
+            elif market in OVERSEAS_ITEMS:
+                from parsers.overseas_parser import OverseasParser
+                self.parsers[market] = OverseasParser(master_file, header_file, market)
+            elif market in DERIVATIVE_ITEMS:
+                from parsers.derivative_parser import DerivativeParser
+                self.parsers[market] = DerivativeParser(master_file, header_file, market)
+            elif market == 'ELW':
+                # ELW 파서 클래스가 구현되어 있다면 사용, 아니면 DomesticStockParser로 대체
+                try:
+                    from parsers.elw_parser import ELWParser
+                    self.parsers[market] = ELWParser(master_file, header_file, market)
+                except ImportError:
+                    logger.warning("ELW 전용 파서가 없어 DomesticStockParser를 대체 사용합니다.")
+                    self.parsers[market] = DomesticStockParser(master_file, header_file, market)
+            else:
+                self.parsers[market] = DomesticStockParser(master_file, header_file, market)
+        return self.parsers[market]
+    
+    def has_item(self, item):
+        """파일 매핑에 항목이 있는지 (다운로드하지 않은 선택 항목 확인용)"""
+        return bool((self.file_mapping['항목명'] == item).any())
+    
+    def derivative_items(self):
+        """파일 매핑에 있는 선물옵션 항목 (다운로드하지 않은 항목은 제외)"""
+        return [item for item in DERIVATIVE_ITEMS if self.has_item(item)]
+    
+    def overseas_items(self):
+        """파일 매핑에 있는 해외 거래소 항목"""
+        return [item for item in OVERSEAS_ITEMS if self.has_item(item)]
+    
+    def _parse_market(self, market):
+        try:
+            return self.get_parser(market).get_data()
+        except Exception as e:
+            logger.error(f"{market} 종목 데이터 파싱 중 오류: {e}", exc_info=True)
+            return pd.DataFrame()
+    
+    def parse_overseas(self, workers=OVERSEAS_PARSE_WORKERS, items=None):
+        """해외 거래소 마스터 동시 파싱 -> {항목명: DataFrame}
         
-        for market in ['코스피', '코스닥', '코넥스']:
-            try:
-                row = self.file_mapping[self.file_mapping['항목명'] == market].iloc[0]
-                master_file = row['종목다운로드']
-                header_file = row['헤더정보']
-                
-                logger.info(f"{market} 종목 데이터 로드 시작")
-                parser = DomesticStockParser(master_file, header_file, market)
+        pyarrow CSV 리더/pandas C 파서는 파싱 중 GIL 을 해제하므로 거래소별 파일을 스레드로 나눠 처리합니다.
+        items 를 지정하지 않으면 파일 매핑에 있는 모든 해외 거래소 항목을 파싱합니다.
+        """
+        items = self.overseas_items() if items is None else items
+        if not items:
+            return {}
+        # 파서 생성(self.parsers 갱신)은 메인 스레드에서
+        for market in items:
+            self.get_parser(market)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items))), thread_name_prefix='overseas') as executor:
+            return dict(zip(items, executor.map(self._parse_market, items)))
+    
+    def parse_markets(self, markets):
+        """지정 항목만 파싱 (DB 접근 없음) -> {항목명: DataFrame}
+        
+        채권은 전체 DataFrame 을 만들지 않도록 제외합니다 (적재 시 청크 단위로 처리).
+        """
+        overseas = [market for market in markets if market in OVERSEAS_ITEMS]
+        frames = {}
+        for market in markets:
+            if market != BOND_ITEM and market not in overseas:
+                frames[market] = self._parse_market(market)
+        frames.update(self.parse_overseas(items=overseas))
+        return frames
+    
+    def parse_all(self):
+        """적재 대상 전체 파싱 (DB 접근 없음) -> {항목명: DataFrame}"""
+        return self.parse_markets(['코스피', '코스닥', '코넥스', 'ELW'] + self.derivative_items() + self.overseas_items())
+    
+    def load_market(self, market):
+        """단일 항목(시장) 종목 로드 -> 적재 행 수"""
+        if market == BOND_ITEM:
+            return self.load_bonds()
+        try:
+            logger.info(f"{market} 종목 데이터 로드 시작")
+            data = self.get_parser(market).get_data()
+            
+            if data.empty:
+                logger.error(f"{market} 종목 데이터가 비어 있습니다.")
+                return 0
+            data = self._drop_duplicate_codes(market, data)
+            
+            # 데이터베이스에 삽입 (하위 insert 단계 지표가 시장 구분을 이어받음)
+            with stage_timer('load', market, rows=len(data)):
+                rows = insert_dataframe(self.table_name, data)
+            
+            if rows > 0:
+                logger.info(f"{market} 종목 데이터 로드 완료: {rows}개")
+            else:
+                logger.warning(f"{market} 종목 데이터 적재 실패")
+            return rows
+        except Exception as e:
+            logger.error(f"{market} 종목 데이터 로드 중 오류: {e}", exc_info=True)
+            return 0
+    
+    def _drop_duplicate_codes(self, market, data):
+        """종목코드 중복 행 제거 (먼저 나온 행 유지)
+        
+        파서는 중복을 그대로 두고 적재 전 검증기가 중복을 보고하며, 적재 단계에서만 정리합니다.
+        """
+        duplicated = data['instrument_code'].duplicated()
+        if duplicated.any():
+            samples = ', '.join(data.loc[duplicated, 'instrument_code'].astype(str).head(5))
+            logger.warning(f"{market} 중복 종목코드 {int(duplicated.sum())}건 제외 (예: {samples})")
+            data = data[~duplicated]
+        return data
+    
+    def iter_chunks(self, market):
+        """청크 단위로 처리하는 항목(채권)의 변환 청크 생성 (검증/적재 공용)"""
+        yield from self.get_parser(market).iter_chunks()
+    
+    def _unique_chunks(self, market, chunks):
+        """이전 청크에 나온 종목코드를 제외한 청크 생성 (청크 간 중복 제거, 먼저 나온 행 유지)"""
+        seen_codes = set()
+        dropped = 0
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            duplicated = chunk['instrument_code'].isin(seen_codes) | chunk['instrument_code'].duplicated()
+            dropped += int(duplicated.sum())
+            chunk = chunk[~duplicated]
+            seen_codes.update(chunk['instrument_code'])
+            yield chunk
+        if dropped:
+            logger.warning(f"{market} 중복 종목코드 {dropped}건 제외")
+    
+    def replace_market(self, market):
+        """단일 항목의 기존 행 삭제와 재적재를 한 트랜잭션으로 실행 (부분 재적재용) -> 적재 행 수
+        
+        적재 중 오류가 나면 삭제도 롤백되어 기존 종목이 그대로 남습니다.
+        """
+        try:
+            logger.info(f"{market} 종목 데이터 교체 시작")
+            parser = self.get_parser(market)
+            if market == BOND_ITEM:
+                chunks = self._unique_chunks(market, parser.iter_chunks())
+            else:
                 data = parser.get_data()
-                
                 if data.empty:
                     logger.error(f"{market} 종목 데이터가 비어 있습니다.")
-                    continue
-                
-                # 데이터베이스에 삽입
-                rows = insert_dataframe(self.table_name, data)
-                
-                if rows > 0:
-                    logger.info(f"{market} 종목 데이터 로드 완료: {rows}개")
-                    total_loaded += rows
-                else:
-                    logger.warning(f"{market} 종목 데이터 적재 실패")
-            except Exception as e:
-                logger.error(f"{market} 종목 데이터 로드 중 오류: {e}", exc_info=True)
-        
-        return total_loaded
+                    return 0
+                chunks = [self._drop_duplicate_codes(market, data)]
+            
+            with stage_timer('load', market, type(parser).__name__) as stage:
+                deleted, stage.rows = replace_dataframe_chunks(self.table_name, 'market_type = %s', (market,), chunks)
+            logger.info(f"{market} 종목 데이터 교체 완료: 삭제 {deleted}개, 적재 {stage.rows}개")
+            return stage.rows
+        except Exception as e:
+            logger.error(f"{market} 종목 데이터 교체 중 오류 (기존 데이터 유지): {e}", exc_info=True)
+            return 0
+    
+    def load_domestic_stocks(self):
+        """국내 주식 로드 (코스피, 코스닥, 코넥스)"""
+        return sum(self.load_market(market) for market in ['코스피', '코스닥', '코넥스'])
     
     def load_elw(self):
         """ELW 로드"""
         try:
             market = 'ELW'
-            row = self.file_mapping[self.file_mapping['항목명'] == market].iloc[0]
-            master_file = row['종목다운로드']
-            header_file = row['헤더정보']
-            
             logger.info(f"{market} 종목 데이터 로드 시작")
-            # ELW 파서 클래스가 구현되어 있다면 사용, 아니면 DomesticStockParser로 대체
-            try:
-                from parsers.elw_parser import ELWParser
-                parser = ELWParser(master_file, header_file, market)
-            except ImportError:
-                logger.warning("ELW 전용 파서가 없어 DomesticStockParser를 대체 사용합니다.")
-                parser = DomesticStockParser(master_file, header_file, market)
-            
-            data = parser.get_data()
+            data = self.get_parser(market).get_data()
             
             if data.empty:
                 logger.error(f"{market} 종목 데이터가 비어 있습니다.")
                 return 0
             
             # 데이터베이스에 삽입
-            rows = insert_dataframe(self.table_name, data)
+            with stage_timer('load', market, rows=len(data)):
+                rows = insert_dataframe(self.table_name, data)
             logger.info(f"{market} 종목 데이터 로드 완료: {rows}개")
             return rows
         except Exception as e:
             logger.error(f"ELW 데이터 로드 중 오류: {e}", exc_info=True)
             return 0
     
+    def load_derivatives(self, instrument_type):
+        """선물옵션 마스터에서 instrument_type(FUTURE/OPTION) 행만 로드"""
+        total = 0
+        for market in self.derivative_items():
+            try:
+                data = self.get_parser(market).get_data()
+                if data.empty:
+                    logger.error(f"{market} 종목 데이터가 비어 있습니다.")
+                    continue
+                
+                data = self._drop_duplicate_codes(market, data)
+                data = data[data['instrument_type'] == instrument_type]
+                if data.empty:
+                    continue
+                with stage_timer('load', market, rows=len(data)):
+                    rows = insert_dataframe(self.table_name, data)
+                logger.info(f"{market} {instrument_type} 데이터 로드 완료: {rows}개")
+                total += rows
+            except Exception as e:
+                logger.error(f"{market} {instrument_type} 데이터 로드 중 오류: {e}", exc_info=True)
+        return total
+    
+    def load_futures(self):
+        """선물 로드 (스프레드 포함)"""
+        return self.load_derivatives('FUTURE')
+    
+    def load_options(self):
+        """옵션 로드"""
+        return self.load_derivatives('OPTION')
+    
+    def load_bonds(self):
+        """채권 로드 (청크 단위 파싱 -> 삽입, 전체 DataFrame 을 만들지 않음)
+        
+        청크는 한 트랜잭션으로 삽입하므로 중간에 실패하면 채권은 한 건도 남지 않습니다.
+        """
+        if not self.has_item(BOND_ITEM):
+            logger.info(f"{BOND_ITEM} 파일 매핑 정보가 없어 채권 적재를 건너뜁니다.")
+            return 0
+        try:
+            logger.info(f"{BOND_ITEM} 종목 데이터 로드 시작")
+            parser = self.get_parser(BOND_ITEM)
+            with stage_timer('load', BOND_ITEM, type(parser).__name__) as stage:
+                stage.rows = insert_dataframe_chunks(self.table_name, self._unique_chunks(BOND_ITEM, parser.iter_chunks()))
+            logger.info(f"{BOND_ITEM} 종목 데이터 로드 완료: {stage.rows}개")
+            return stage.rows
+        except Exception as e:
+            logger.error(f"{BOND_ITEM} 데이터 로드 중 오류: {e}", exc_info=True)
+            return 0
+    
+    def load_overseas(self):
+        """해외 거래소 종목 로드 (파싱은 거래소별 동시 실행, 삽입은 순차)"""
+        frames = self.parse_overseas()
+        return sum(self.load_market(market) for market in frames)
+    
     def load_all(self):
         """모든 종목 데이터 로드"""
         logger.info("종목 데이터 로드 시작")
@@ -90,10 +271,21 @@ class InstrumentLoader:
         total_loaded += elw_count
         logger.info(f"ELW 총 {elw_count}개 로드 완료")
         
-        # 여기에 다른 종목 유형 로드 메서드 추가 가능
-        # self.load_futures()
-        # self.load_options()
-        # 등등...
+        # 3. 선물/옵션 (지수/주식/상품선물옵션)
+        futures_count = self.load_futures()
+        options_count = self.load_options()
+        total_loaded += futures_count + options_count
+        logger.info(f"선물 총 {futures_count}개, 옵션 총 {options_count}개 로드 완료")
+        
+        # 4. 채권 (청크 단위 스트리밍 적재)
+        bond_count = self.load_bonds()
+        total_loaded += bond_count
+        logger.info(f"채권 총 {bond_count}개 로드 완료")
+        
+        # 5. 해외주식 (거래소별 .cod 마스터)
+        overseas_count = self.load_overseas()
+        total_loaded += overseas_count
+        logger.info(f"해외주식 총 {overseas_count}개 로드 완료")
         
         # 최종 확인
         final_count = count_records(self.table_name)
@@ -11,18 +11,20 @@ class MemberLoader:
     def __init__(self, file_mapping):
         self.file_mapping = file_mapping
         self.table_name = 'member_code'
+        self.parser = None
+    
+    def get_parser(self):
+        """회원사코드 파서 반환 (한 번만 생성)"""
+        if self.parser is None:
+            row = self.file_mapping[self.file_mapping['항목명'] == '회원사코드'].iloc[0]
+            self.parser = MemberParser(row['종목다운로드'], row['헤더정보'])
+        return self.parser
     
     def load_all(self):
         """회원사 코드 데이터 로드"""
         try:
-            # 회원사코드 파일 찾기
-            row = self.file_mapping[self.file_mapping['항목명'] == '회원사코드'].iloc[0]
-            master_file = row['종목다운로드']
-            header_file = row['헤더정보']
-            
             logger.info("회원사코드 데이터 로드 시작")
-            parser = MemberParser(master_file, header_file)
-            data = parser.get_data()
+            data = self.get_parser().get_data()
             
             if data.empty:
                 logger.error("회원사코드 데이터가 비어있습니다.")
@@ -6,6 +6,7 @@
 import logging
 import pandas as pd
 from db_utils import get_connection, insert_dataframe
+from search.sector_tree import SectorTree, derive_sector_parents
 
 logger = logging.getLogger('sector_loader')
 
@@ -45,3 +46,43 @@ class SectorLoader:
         except Exception as e:
             logger.error(f"업종코드 데이터 로드 중 오류: {e}", exc_info=True)
             return 0
+    
+    def build_hierarchy(self):
+        """종목의 업종 대/중/소 분류로 업종 계층(상위업종, 중첩집합 구간) 구성 (종목 적재 이후 실행)"""
+        logger.info("업종 계층 구성 시작")
+        
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT sector_code FROM sector_code")
+                sector_codes = [row[0] for row in cursor.fetchall()]
+                
+                cursor.execute("""
+                    SELECT industry_code, industry_medium_code, industry_small_code
+                    FROM instruments
+                    WHERE industry_code IS NOT NULL AND industry_code != ''
+                """)
+                parents = derive_sector_parents(cursor.fetchall())
+                
+                # 업종코드 마스터에 있는 업종만 계층에 포함
+                known = set(sector_codes)
+                parents = {child: parent for child, parent in parents.items()
+                           if child in known and parent in known}
+                tree = SectorTree(sector_codes, parents)
+                
+                cursor.executemany("""
+                    UPDATE sector_code
+                    SET sector_type = %s, parent_code = %s, sector_depth = %s,
+                        tree_left = %s, tree_right = %s
+                    WHERE sector_code = %s
+                """, tree.to_rows())
+            conn.commit()
+            
+            logger.info(f"업종 계층 구성 완료: {len(sector_codes)}개 업종, 최상위 {len(tree.roots)}개, 상위업종 지정 {len(tree.parents)}개")
+            return tree
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"업종 계층 구성 중 오류: {e}", exc_info=True)
+            return None
+        finally:
+            conn.close()
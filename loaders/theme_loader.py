@@ -14,6 +14,7 @@ class ThemeLoader:
     
     def __init__(self):
         self.table_name = 'theme_code'
+        self.map_table_name = 'instrument_theme_map'
     
     def load_data(self, theme_parser):
         """테마코드 데이터 로드"""
@@ -29,12 +30,16 @@ class ThemeLoader:
             
             logger.info(f"테마코드 파싱 결과: {len(data)}개 레코드")
             
+            # 파서 결과는 (테마, 종목) 단위이므로 테마코드 기준으로 중복 제거
+            themes = data.drop_duplicates(subset=['theme_code']).sort_values('theme_code')
+            logger.info(f"테마코드 중복 제거: {len(data)}개 -> {len(themes)}개 테마")
+            
             # 데이터베이스에 적재
             try:
-                success = insert_dataframe(self.table_name, data)
+                success = insert_dataframe(self.table_name, themes)
                 if success:
-                    logger.info(f"테마코드 데이터 로드 완료: {len(data)}개 레코드")
-                    return len(data)
+                    logger.info(f"테마코드 데이터 로드 완료: {len(themes)}개 레코드")
+                    return len(themes)
                 else:
                     logger.error("테마코드 데이터 적재 실패")
                     return 0
@@ -45,3 +50,62 @@ class ThemeLoader:
         except Exception as e:
             logger.error(f"테마코드 데이터 로드 중 오류: {e}", exc_info=True)
             return 0
+    
+    def build_theme_map(self, theme_parser, code_map):
+        """테마 파싱 결과를 종목-테마 매핑 DataFrame으로 변환 (PK 순 정렬)
+        
+        code_map: 단축코드 -> 종목코드(instrument_code) 매핑
+        """
+        data = theme_parser.get_data()
+        if data is None or data.empty or 'stock_code' not in data.columns:
+            return pd.DataFrame(columns=['instrument_code', 'theme_code'])
+        
+        pairs = data[['stock_code', 'theme_code']].dropna()
+        pairs = pairs[pairs['stock_code'] != ''].drop_duplicates()
+        
+        pairs = pairs.assign(instrument_code=pairs['stock_code'].map(code_map))
+        unresolved = pairs['instrument_code'].isna().sum()
+        if unresolved:
+            logger.warning(f"종목코드를 찾을 수 없는 테마 매핑 {unresolved}건 제외")
+        
+        theme_map = (
+            pairs.dropna(subset=['instrument_code'])[['instrument_code', 'theme_code']]
+            .drop_duplicates()
+            .sort_values(['instrument_code', 'theme_code'])
+            .reset_index(drop=True)
+        )
+        return theme_map
+    
+    def load_theme_map(self, theme_parser):
+        """종목-테마 매핑(instrument_theme_map) 적재 (종목/테마코드 적재 이후 실행)"""
+        logger.info("종목-테마 매핑 데이터 로드 시작")
+        
+        try:
+            code_map = self._fetch_code_map()
+            theme_map = self.build_theme_map(theme_parser, code_map)
+            
+            if theme_map.empty:
+                logger.error("종목-테마 매핑 데이터가 비어 있습니다.")
+                return 0
+            
+            rows = insert_dataframe(self.map_table_name, theme_map)
+            logger.info(f"종목-테마 매핑 데이터 로드 완료: {rows}개 레코드")
+            return rows
+        except Exception as e:
+            logger.error(f"종목-테마 매핑 데이터 로드 중 오류: {e}", exc_info=True)
+            return 0
+    
+    def _fetch_code_map(self):
+        """적재된 종목의 단축코드/종목코드 -> 종목코드 매핑 조회"""
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT instrument_code, short_code FROM instruments")
+                code_map = {}
+                for instrument_code, short_code in cursor.fetchall():
+                    code_map[instrument_code] = instrument_code
+                    if short_code:
+                        code_map.setdefault(short_code, instrument_code)
+                return code_map
+        finally:
+            conn.close()
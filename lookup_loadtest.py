@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+KIS 종목 조회 서비스 부하 테스트
+keep-alive 커넥션으로 조회/일괄조회/검색 요청을 보내고 p50/p99 지연시간을 출력합니다.
+
+사용 예:
+  python lookup_loadtest.py --url http://127.0.0.1:8080 --connections 16 --requests 20000
+  python lookup_loadtest.py --spawn --source files      # 로컬 데이터로 서버를 띄워 측정
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+# 대표 조회 대상 (SampleValidator와 동일한 대표 종목/검색어)
+DEFAULT_CODES = ['005930', '000660', '035420', '051910', '207940', '373220', '122870', '247540', '086520']
+DEFAULT_QUERIES = ['삼성', 'SK', 'LG', '전자', 'ㅅㅅㅈㅈ', '에코프로', '하이닉스']
+
+def build_request_mix(index=None, codes=None, queries=None):
+    """(method, target, body) 요청 목록 생성"""
+    if index is not None and len(index):
+        codes = [r['short_code'] or r['instrument_code'] for r in random.sample(index.records, min(500, len(index)))]
+    codes = codes or DEFAULT_CODES
+    queries = queries or DEFAULT_QUERIES
+
+    requests = []
+    for code in codes:
+        requests.append(('GET', f'/instruments/{quote(code)}', b''))
+    for query in queries:
+        requests.append(('GET', f'/search?q={quote(query)}&limit=20', b''))
+    for _ in range(max(1, len(codes) // 10)):
+        batch = random.sample(codes, min(20, len(codes)))
+        requests.append(('POST', '/instruments/batch', json.dumps({'codes': batch}).encode('utf-8')))
+    return requests
+
+async def _read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    for line in head.split(b'\r\n')[1:]:
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':', 1)[1])
+    if length:
+        await reader.readexactly(length)
+    return status
+
+async def _worker(host, port, request_mix, count, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            method, target, body = random.choice(request_mix)
+            request = (
+                f'{method} {target} HTTP/1.1\r\nHost: {host}\r\n'
+                f'Content-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n'
+            ).encode('latin-1') + body
+
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status >= 500:
+                errors.append(status)
+    finally:
+        writer.close()
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+async def run_load_test(host, port, connections, total_requests, request_mix):
+    """부하 테스트 실행 후 통계 반환"""
+    latencies = []
+    errors = []
+    per_connection = max(1, total_requests // connections)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        _worker(host, port, request_mix, per_connection, latencies, errors)
+        for _ in range(connections)
+    ])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'connections': connections,
+        'elapsed_sec': round(elapsed, 3),
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 90) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0
+    }
+
+async def _spawn_and_run(args):
+    """같은 프로세스에서 서버를 띄우고 부하 테스트 실행"""
+    from lookup_server import LookupService, load_index, serve
+
+    index = load_index(args.source, args.snapshot)
+    service = LookupService(index)
+    ready = asyncio.get_running_loop().create_future()
+    server_task = asyncio.create_task(serve(service, '127.0.0.1', 0, ready=ready))
+    port = await ready
+    try:
+        return await run_load_test('127.0.0.1', port, args.connections, args.requests, build_request_mix(index))
+    finally:
+        server_task.cancel()
+
+def main():
+    from config import SNAPSHOT_FILE
+
+    parser = argparse.ArgumentParser(description='KIS 종목 조회 서비스 부하 테스트')
+    parser.add_argument('--url', default='http://127.0.0.1:8080', help='대상 서비스 주소')
+    parser.add_argument('--connections', type=int, default=16, help='동시 keep-alive 커넥션 수')
+    parser.add_argument('--requests', type=int, default=10000, help='전체 요청 수')
+    parser.add_argument('--spawn', action='store_true', help='서버를 같은 프로세스에서 띄워서 측정')
+    parser.add_argument('--source', choices=['snapshot', 'db', 'files'], default='snapshot')
+    parser.add_argument('--snapshot', default=SNAPSHOT_FILE)
+    args = parser.parse_args()
+
+    if args.spawn:
+        stats = asyncio.run(_spawn_and_run(args))
+    else:
+        url = urlsplit(args.url)
+        stats = asyncio.run(run_load_test(
+            url.hostname, url.port or 80, args.connections, args.requests, build_request_mix()
+        ))
+
+    print(f"요청 {stats['requests']:,}건 / 커넥션 {stats['connections']}개 / {stats['elapsed_sec']}초")
+    print(f"처리량: {stats['rps']:,} req/s, 오류: {stats['errors']}건")
+    print(f"지연시간 p50={stats['p50_ms']}ms p90={stats['p90_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms")
+    print(json.dumps(stats, ensure_ascii=False))
+    return stats['errors'] == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+KIS 종목 조회/검색 HTTP 서비스 (asyncio)
+
+엔드포인트:
+  GET  /health                         상태 및 세대 번호
+  GET  /instruments/{code}             종목코드/단축코드 조회
+  GET  /instruments?codes=A,B,C        일괄 조회
+  POST /instruments/batch              일괄 조회 (본문: {"codes": [...]})
+  GET  /search?q=삼성&market_type=&instrument_type=&limit=20
+                                       종목명/별칭/초성 검색
+
+모든 응답에 ETag, X-Reload-Generation 헤더를 포함하며 If-None-Match 요청에는 304로 응답합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import zlib
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from config import SNAPSHOT_FILE
+from search.instrument_index import InstrumentIndex
+from search.result_cache import SearchResultCache, make_cache_key
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('lookup_server')
+
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+MAX_BATCH_CODES = 1000
+
+STATUS_TEXT = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error'
+}
+
+def load_index(source, snapshot_path=SNAPSHOT_FILE):
+    """데이터 소스별 인덱스 생성 (db / snapshot / files)"""
+    if source == 'db':
+        return InstrumentIndex.from_db()
+    if source == 'files':
+        return InstrumentIndex.from_files()
+    return InstrumentIndex.from_snapshot(snapshot_path)
+
+class LookupService:
+    """종목 조회/검색 요청 처리기"""
+
+    def __init__(self, index, cache_size=None):
+        self.index = index
+        self.cache = SearchResultCache(
+            **({'maxsize': cache_size} if cache_size else {}),
+            generation_provider=lambda: self.index.generation
+        )
+        self.request_count = 0
+
+    def swap_index(self, index):
+        """새 세대 인덱스로 교체 (캐시는 세대 번호로 자동 무효화)"""
+        logger.info(f"인덱스 교체: 세대 {self.index.generation} -> {index.generation}")
+        self.index = index
+
+    def handle(self, method, target, body):
+        """(상태코드, 응답 객체) 반환"""
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip('/') or '/'
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if path == '/health':
+            return 200, {
+                'status': 'ok',
+                'generation': self.index.generation,
+                'instruments': len(self.index),
+                'requests': self.request_count,
+                'cache': self.cache.stats()
+            }
+
+        if path == '/instruments/batch':
+            if method != 'POST':
+                return 405, {'error': 'POST만 지원합니다.'}
+            try:
+                codes = json.loads(body or b'{}').get('codes', [])
+            except (ValueError, AttributeError):
+                return 400, {'error': '본문은 {"codes": [...]} 형식이어야 합니다.'}
+            return self._batch(codes)
+
+        if method != 'GET':
+            return 405, {'error': 'GET만 지원합니다.'}
+
+        if path == '/instruments':
+            codes = [code for code in params.get('codes', '').split(',') if code]
+            return self._batch(codes)
+
+        if path.startswith('/instruments/'):
+            code = path[len('/instruments/'):]
+            record = self.index.lookup(code)
+            if record is None:
+                return 404, {'error': f'종목을 찾을 수 없습니다: {code}'}
+            return 200, record
+
+        if path == '/search':
+            query = params.get('q', '').strip()
+            if not query:
+                return 400, {'error': 'q 파라미터가 필요합니다.'}
+            try:
+                limit = min(int(params.get('limit', 20)), 100)
+            except ValueError:
+                return 400, {'error': 'limit는 숫자여야 합니다.'}
+            market_type = params.get('market_type') or None
+            instrument_type = params.get('instrument_type') or None
+
+            key = make_cache_key(query, market_type=market_type, instrument_type=instrument_type, limit=limit)
+            results = self.cache.get_or_compute(
+                key, lambda: self.index.search(query, market_type, instrument_type, limit)
+            )
+            return 200, {'query': query, 'count': len(results), 'results': results}
+
+        return 404, {'error': f'알 수 없는 경로: {path}'}
+
+    def _batch(self, codes):
+        if not isinstance(codes, list) or len(codes) > MAX_BATCH_CODES:
+            return 400, {'error': f'codes는 최대 {MAX_BATCH_CODES}개의 목록이어야 합니다.'}
+        found = self.index.lookup_many(str(code) for code in codes)
+        return 200, {
+            'count': sum(1 for record in found.values() if record),
+            'results': found
+        }
+
+    async def handle_connection(self, reader, writer):
+        """커넥션 단위 처리 (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write_response(writer, 413, {'error': '헤더가 너무 큽니다.'}, {}, False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._write_response(writer, 400, {'error': '잘못된 요청 라인'}, {}, False)
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                body = b''
+                content_length = headers.get('content-length', '') or '0'
+                if not (content_length.isascii() and content_length.isdigit()):
+                    await self._write_response(writer, 400, {'error': '잘못된 Content-Length'}, {}, False)
+                    break
+                length = int(content_length)
+                if length > MAX_BODY_SIZE:
+                    await self._write_response(writer, 413, {'error': '본문이 너무 큽니다.'}, headers, False)
+                    break
+                if length:
+                    try:
+                        body = await asyncio.wait_for(reader.readexactly(length), KEEP_ALIVE_TIMEOUT)
+                    except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                        await self._write_response(writer, 400, {'error': '본문이 Content-Length 보다 짧습니다.'}, {}, False)
+                        break
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                self.request_count += 1
+                try:
+                    status, payload = self.handle(method.upper(), target, body)
+                except Exception as e:
+                    logger.error(f"요청 처리 오류 ({method} {target}): {e}", exc_info=True)
+                    status, payload = 500, {'error': '내부 오류'}
+
+                await self._write_response(writer, status, payload, headers, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _write_response(self, writer, status, payload, request_headers, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        generation = self.index.generation
+        etag = f'"g{generation}-{zlib.crc32(body):08x}"'
+
+        if status == 200 and request_headers.get('if-none-match') == etag:
+            status, body = 304, b''
+
+        response_headers = [
+            f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}',
+            'Content-Type: application/json; charset=utf-8',
+            f'Content-Length: {len(body)}',
+            f'ETag: {etag}',
+            f'X-Reload-Generation: {generation}',
+            'Cache-Control: no-cache',
+            f'Connection: {"keep-alive" if keep_alive else "close"}'
+        ]
+        if keep_alive:
+            response_headers.append(f'Keep-Alive: timeout={KEEP_ALIVE_TIMEOUT}')
+        writer.write(('\r\n'.join(response_headers) + '\r\n\r\n').encode('latin-1') + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            # 본문을 다 보내지 않고 끊은 클라이언트 등 (연결은 handle_connection 에서 닫음)
+            pass
+
+async def refresh_index_periodically(service, source, snapshot_path, interval):
+    """재적재 세대(또는 스냅샷 파일)가 바뀌면 인덱스를 백그라운드에서 다시 생성"""
+    from search.generation import current_generation
+
+    def signature():
+        if source == 'snapshot':
+            return os.path.getmtime(snapshot_path)
+        return current_generation()
+
+    loop = asyncio.get_running_loop()
+    last_signature = signature()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            current = signature()
+            if current != last_signature:
+                index = await loop.run_in_executor(None, load_index, source, snapshot_path)
+                service.swap_index(index)
+                last_signature = current
+        except Exception as e:
+            logger.warning(f"인덱스 갱신 실패: {e}")
+
+async def serve(service, host, port, source=None, snapshot_path=SNAPSHOT_FILE, refresh_interval=0, ready=None):
+    """서버 실행 (ready: 바인딩 완료 시 실제 포트를 전달받는 Future)"""
+    server = await asyncio.start_server(service.handle_connection, host, port, limit=MAX_HEADER_SIZE)
+    bound_port = server.sockets[0].getsockname()[1]
+    logger.info(f"조회 서비스 시작: http://{host}:{bound_port} (종목 {len(service.index):,}개, 세대 {service.index.generation})")
+    if ready is not None:
+        ready.set_result(bound_port)
+
+    refresher = None
+    if refresh_interval and source:
+        refresher = asyncio.create_task(refresh_index_periodically(service, source, snapshot_path, refresh_interval))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if refresher:
+            refresher.cancel()
+
+def main():
+    parser = argparse.ArgumentParser(description='KIS 종목 조회/검색 HTTP 서비스')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--source', choices=['snapshot', 'db', 'files'], default='snapshot',
+                        help='인덱스 데이터 소스 (기본: 스냅샷 파일)')
+    parser.add_argument('--snapshot', default=SNAPSHOT_FILE, help='스냅샷 파일 경로')
+    parser.add_argument('--build-snapshot', choices=['db', 'files'],
+                        help='지정한 소스로 스냅샷을 생성하고 종료')
+    parser.add_argument('--refresh-interval', type=int, default=0,
+                        help='세대 변경 확인 주기(초), 0이면 갱신하지 않음')
+    args = parser.parse_args()
+
+    if args.build_snapshot:
+        load_index(args.build_snapshot).save_snapshot(args.snapshot)
+        return True
+
+    if args.source == 'snapshot' and not os.path.exists(args.snapshot):
+        logger.error(f"스냅샷 파일이 없습니다: {args.snapshot} (--build-snapshot files|db 로 생성)")
+        return False
+
+    service = LookupService(load_index(args.source, args.snapshot))
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.source, args.snapshot, args.refresh_interval))
+    except KeyboardInterrupt:
+        logger.info("조회 서비스 종료")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+단계별 메모리 추적 (선택 기능, KIS_TRACE_MEMORY=1)
+metrics.stage_timer 로 측정하는 단계마다 RSS(시작/종료/프로세스 최대치)와 tracemalloc
+최대 할당량을 기록하고, 파싱/변환/적재 단계는 새로 할당되어 남은 메모리의 상위 위치를 보고합니다.
+
+tracemalloc 은 프로세스 전체를 추적하므로 동시에 실행되는 단계(작업 그래프 등)의 최대치는
+함께 집계됩니다. 단계별로 정확히 구분하려면 순차 실행(reload_data.main)에서 사용하세요.
+"""
+
+import linecache
+import logging
+import os
+import sys
+import threading
+import tracemalloc
+
+logger = logging.getLogger('memory_tracker')
+
+MB = 1024 * 1024
+
+# 상위 할당 위치를 스냅샷으로 비교할 단계 (스냅샷 비용이 커서 주요 단계만)
+SNAPSHOT_STAGES = ('parse', 'transform', 'insert')
+
+def current_rss():
+    """현재 RSS(bytes) (psutil -> /proc -> 측정 불가 시 None)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+def peak_rss():
+    """프로세스 최대 RSS(bytes) (resource 모듈이 없는 플랫폼은 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 bytes 단위
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+def to_megabytes(value):
+    return round(value / MB, 2) if value is not None else None
+
+class MemoryTracker:
+    """중첩 단계를 지원하는 tracemalloc 최대치/RSS 추적기
+
+    tracemalloc 최대치는 프로세스에 하나뿐이므로, 단계가 시작·종료될 때마다 현재 최대치를
+    진행 중인 모든 단계에 반영한 뒤 초기화(reset_peak)하여 바깥 단계의 최대치가 유지되도록 합니다.
+    """
+
+    def __init__(self, top_n=5, frames=1):
+        self.top_n = top_n
+        self.frames = frames
+        self._lock = threading.Lock()
+        self._active = []
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            logger.info("메모리 추적 시작 (tracemalloc)")
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _fold_peak(self):
+        """현재 최대치를 진행 중인 단계에 반영 후 초기화 (호출자가 잠금 보유)"""
+        current, peak = tracemalloc.get_traced_memory()
+        for state in self._active:
+            state['peak'] = max(state['peak'], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def enter(self, stage):
+        """단계 시작 -> 상태 (exit 에 전달)"""
+        self.start()
+        snapshot = tracemalloc.take_snapshot() if stage in SNAPSHOT_STAGES else None
+        with self._lock:
+            current = self._fold_peak()
+            state = {'start': current, 'peak': current, 'rss_start': current_rss(), 'snapshot': snapshot}
+            self._active.append(state)
+        return state
+
+    def exit(self, state):
+        """단계 종료 -> 메모리 지표 dict"""
+        with self._lock:
+            current = self._fold_peak()
+            self._active.remove(state)
+        result = {
+            'rss_start_mb': to_megabytes(state['rss_start']),
+            'rss_end_mb': to_megabytes(current_rss()),
+            'rss_peak_mb': to_megabytes(peak_rss()),
+            'py_peak_mb': to_megabytes(state['peak'] - state['start']),
+            'py_retained_mb': to_megabytes(current - state['start'])
+        }
+        if state['snapshot'] is not None:
+            result['top_allocations'] = self.top_allocations(state['snapshot'])
+        return result
+
+    def top_allocations(self, before):
+        """단계 시작 스냅샷 대비 증가량 상위 할당 위치"""
+        after = tracemalloc.take_snapshot()
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        top = []
+        for stat in stats:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            top.append({
+                'location': f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+                'size_mb': to_megabytes(stat.size_diff),
+                'count': stat.count_diff
+            })
+            if len(top) >= self.top_n:
+                break
+        return top
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계별 성능 지표 수집
+다운로드/압축 해제/파싱/변환/적재/검증 단계마다 경과 시간, CPU 시간, 행 수, 바이트 수,
+초당 처리 행 수를 단계·시장별로 기록하고 실행 단위 JSON 파일과
+Prometheus textfile collector 형식(.prom) 파일로 내보냅니다.
+KIS_TRACE_MEMORY=1 이면 단계별 메모리 최대치(memory_tracker)도 함께 기록합니다.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from config import METRICS_DIR, METRICS_TEXTFILE_DIR, TRACE_MEMORY, TRACE_MEMORY_TOP_N
+
+logger = logging.getLogger('metrics')
+
+PROMETHEUS_PREFIX = 'kis_etl'
+
+# 상위 단계에서 지정한 시장 구분을 하위 단계(적재 등)가 이어받음
+_current_market = contextvars.ContextVar('kis_metrics_market', default=None)
+
+class StageRecord:
+    """단계 실행 한 건"""
+
+    def __init__(self, stage, market=None, name=None, rows=None, bytes=None):
+        self.stage = stage
+        self.market = market
+        self.name = name
+        self.rows = rows
+        self.bytes = bytes
+        self.wall_sec = None
+        self.cpu_sec = None
+        self.success = True
+        self.memory = None  # 메모리 추적 시 memory_tracker 지표
+        self.started_at = datetime.now().isoformat(timespec='milliseconds')
+
+    @property
+    def rows_per_sec(self):
+        if not self.rows or not self.wall_sec:
+            return None
+        return round(self.rows / self.wall_sec, 1)
+
+    def to_dict(self):
+        return {
+            'stage': self.stage,
+            'market': self.market,
+            'name': self.name,
+            'started_at': self.started_at,
+            'wall_sec': self.wall_sec,
+            'cpu_sec': self.cpu_sec,
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'rows_per_sec': self.rows_per_sec,
+            'success': self.success,
+            'memory': self.memory
+        }
+
+class MetricsRecorder:
+    """실행 단위 단계 지표 수집기 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+        self.started_at = datetime.now()
+        self.memory = None
+        if TRACE_MEMORY:
+            self.enable_memory_tracing(TRACE_MEMORY_TOP_N)
+
+    def enable_memory_tracing(self, top_n=TRACE_MEMORY_TOP_N):
+        """단계별 메모리 추적 켜기 (tracemalloc 시작)"""
+        if self.memory is None:
+            from memory_tracker import MemoryTracker
+            self.memory = MemoryTracker(top_n)
+            self.memory.start()
+        return self.memory
+
+    @contextmanager
+    def stage(self, stage, market=None, name=None, rows=None, bytes=None):
+        """단계 측정 컨텍스트 -> StageRecord (블록 안에서 rows/bytes 지정 가능)
+
+        CPU 시간은 현재 스레드 기준(thread_time)이므로 동시에 실행되는 다른 단계의
+        CPU 사용량이 섞이지 않습니다.
+        """
+        market = market or _current_market.get()
+        record = StageRecord(stage, market, name, rows, bytes)
+        token = _current_market.set(market)
+        memory = self.memory
+        memory_state = memory.enter(stage) if memory else None
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        except BaseException:
+            record.success = False
+            raise
+        finally:
+            record.wall_sec = round(time.perf_counter() - wall_start, 6)
+            record.cpu_sec = round(time.thread_time() - cpu_start, 6)
+            if memory_state is not None:
+                record.memory = memory.exit(memory_state)
+            _current_market.reset(token)
+            with self._lock:
+                self.records.append(record)
+
+    def summary(self):
+        """(단계, 시장)별 합계 (시장 구분이 없는 단계는 대상 이름 기준: 파일명, 테이블명, 검증 항목 등)"""
+        totals = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            market = record.market or record.name or ''
+            total = totals.setdefault((record.stage, market), {
+                'stage': record.stage, 'market': market,
+                'count': 0, 'failures': 0, 'wall_sec': 0.0, 'cpu_sec': 0.0, 'rows': 0, 'bytes': 0,
+                'py_peak_mb': None, 'rss_peak_mb': None
+            })
+            total['count'] += 1
+            total['failures'] += 0 if record.success else 1
+            total['wall_sec'] += record.wall_sec or 0.0
+            total['cpu_sec'] += record.cpu_sec or 0.0
+            total['rows'] += record.rows or 0
+            total['bytes'] += record.bytes or 0
+            if record.memory:
+                for field in ['py_peak_mb', 'rss_peak_mb']:
+                    value = record.memory.get(field)
+                    if value is not None:
+                        total[field] = max(total[field] or 0.0, value)
+        for total in totals.values():
+            total['wall_sec'] = round(total['wall_sec'], 6)
+            total['cpu_sec'] = round(total['cpu_sec'], 6)
+            total['rows_per_sec'] = round(total['rows'] / total['wall_sec'], 1) if total['rows'] and total['wall_sec'] else None
+        return sorted(totals.values(), key=lambda total: (total['stage'], total['market']))
+
+    def to_dict(self, run_name):
+        with self._lock:
+            records = [record.to_dict() for record in self.records]
+        return {
+            'run': run_name,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'stages': self.summary(),
+            'memory': self.memory_report(),
+            'records': records
+        }
+
+    def memory_report(self, limit=5):
+        """메모리 추적 요약 (최대치 상위 단계와 각 단계의 상위 할당 위치, 추적하지 않으면 None)"""
+        with self._lock:
+            records = [record for record in self.records if record.memory]
+        if not records:
+            return None
+        from memory_tracker import peak_rss, to_megabytes
+        top = sorted(records, key=lambda record: record.memory.get('py_peak_mb') or 0, reverse=True)[:limit]
+        return {
+            'process_rss_peak_mb': to_megabytes(peak_rss()),
+            'top_stages': [
+                {
+                    'stage': record.stage,
+                    'market': record.market or record.name,
+                    'name': record.name,
+                    'py_peak_mb': record.memory.get('py_peak_mb'),
+                    'rss_end_mb': record.memory.get('rss_end_mb'),
+                    'top_allocations': record.memory.get('top_allocations', [])
+                }
+                for record in top
+            ]
+        }
+
+    def write_json(self, run_name, folder=METRICS_DIR):
+        """실행 지표 JSON 저장 -> 파일 경로"""
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"kis_metrics_{run_name}_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(run_name), f, ensure_ascii=False, indent=2)
+        return path
+
+    def to_prometheus(self, run_name):
+        """Prometheus 텍스트 노출 형식"""
+        metrics = [
+            ('stage_wall_seconds', 'gauge', '단계 경과 시간 합계(초)', 'wall_sec'),
+            ('stage_cpu_seconds', 'gauge', '단계 CPU 시간 합계(초)', 'cpu_sec'),
+            ('stage_rows', 'gauge', '단계 처리 행 수', 'rows'),
+            ('stage_bytes', 'gauge', '단계 처리 바이트 수', 'bytes'),
+            ('stage_rows_per_second', 'gauge', '단계 초당 처리 행 수', 'rows_per_sec'),
+            ('stage_runs', 'gauge', '단계 실행 횟수', 'count'),
+            ('stage_failures', 'gauge', '단계 실패 횟수', 'failures'),
+            ('stage_python_peak_megabytes', 'gauge', '단계 tracemalloc 최대 할당량(MB, 메모리 추적 시)', 'py_peak_mb'),
+            ('stage_rss_peak_megabytes', 'gauge', '단계 종료 시점 프로세스 최대 RSS(MB, 메모리 추적 시)', 'rss_peak_mb'),
+        ]
+        summary = self.summary()
+        lines = []
+        for metric, metric_type, help_text, field in metrics:
+            if all(total[field] is None for total in summary):
+                continue
+            full_name = f"{PROMETHEUS_PREFIX}_{metric}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for total in summary:
+                if total[field] is None:
+                    continue
+                labels = f'run="{_escape(run_name)}",stage="{_escape(total["stage"])}",market="{_escape(total["market"])}"'
+                lines.append(f"{full_name}{{{labels}}} {total[field]}")
+        lines.append(f"# HELP {PROMETHEUS_PREFIX}_last_run_timestamp_seconds 마지막 실행 완료 시각")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_last_run_timestamp_seconds gauge")
+        lines.append(f'{PROMETHEUS_PREFIX}_last_run_timestamp_seconds{{run="{_escape(run_name)}"}} {time.time():.0f}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, run_name, folder=METRICS_TEXTFILE_DIR):
+        """textfile collector 용 .prom 파일 원자적 저장 (실행 종류별 한 파일, 수집 중 반쯤 쓰인 파일 방지)"""
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{PROMETHEUS_PREFIX}_{run_name}.prom")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus(run_name))
+        os.replace(tmp_path, path)
+        return path
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+            self.started_at = datetime.now()
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+_recorder = MetricsRecorder()
+
+def get_recorder():
+    """프로세스 공용 지표 수집기"""
+    return _recorder
+
+def reset_metrics():
+    """새 실행 시작 시 호출"""
+    _recorder.clear()
+    return _recorder
+
+def stage_timer(stage, market=None, name=None, rows=None, bytes=None):
+    """공용 수집기 단계 측정 컨텍스트"""
+    return _recorder.stage(stage, market, name, rows, bytes)
+
+def export_metrics(run_name):
+    """실행 지표를 JSON/Prometheus 파일로 내보내기 -> (JSON 경로, .prom 경로) (실패 시 None)"""
+    try:
+        json_path = _recorder.write_json(run_name)
+        prom_path = _recorder.write_prometheus(run_name)
+        logger.info(f"실행 지표 저장: {json_path}, {prom_path}")
+        return json_path, prom_path
+    except OSError as e:
+        logger.warning(f"실행 지표 저장 실패: {e}")
+        return None, None
+
+def format_summary(limit=None):
+    """로그/콘솔 출력용 단계별 요약 줄 목록 (경과 시간 내림차순)"""
+    totals = sorted(_recorder.summary(), key=lambda total: total['wall_sec'], reverse=True)
+    lines = []
+    for total in totals[:limit]:
+        label = f"{total['stage']}/{total['market']}" if total['market'] else total['stage']
+        throughput = f", {total['rows_per_sec']:,.0f}행/초" if total['rows_per_sec'] else ""
+        lines.append(
+            f"{label}: {total['wall_sec']:.3f}초 (CPU {total['cpu_sec']:.3f}초, "
+            f"{total['rows']:,}행, {total['bytes']:,}bytes{throughput})"
+        )
+    return lines
+
+def format_memory_summary(limit=5):
+    """로그/콘솔 출력용 메모리 최대치 상위 단계 줄 목록 (추적하지 않으면 빈 목록)"""
+    report = _recorder.memory_report(limit)
+    if not report:
+        return []
+    lines = [f"프로세스 최대 RSS: {report['process_rss_peak_mb']}MB"]
+    for stage in report['top_stages']:
+        label = f"{stage['stage']}/{stage['market']}" if stage['market'] else stage['stage']
+        lines.append(f"{label}: Python 최대 {stage['py_peak_mb']}MB (종료 RSS {stage['rss_end_mb']}MB)")
+        for site in stage['top_allocations'][:3]:
+            lines.append(f"    {site['location']}: +{site['size_mb']}MB ({site['count']:+,}개)")
+    return lines
@@ -4,6 +4,9 @@ import pandas as pd
 import logging
 from datetime import datetime
 from config import DATA_DIR
+from hangul_utils import build_chosung_keys
+from artifact_registry import get_registry
+from metrics import stage_timer
 
 logger = logging.getLogger('base_parser')
 
@@ -41,6 +44,15 @@ class BaseParser:
         
         return self.master_file
     
+    def get_artifact(self):
+        """레지스트리에서 마스터 파일 아티팩트 조회 (실행당 한 번만 읽기/압축 해제)"""
+        return get_registry().get(self.master_file)
+    
+    def open_master(self, binary=False, encoding='cp949'):
+        """마스터 파일 스트림 (ZIP은 디스크에 풀지 않고 메모리 버퍼에서 읽음)"""
+        artifact = self.get_artifact()
+        return artifact.open_binary() if binary else artifact.open_text(encoding)
+    
     def safe_decode(self, binary_data, encoding='cp949'):
         """바이너리 데이터를 텍스트로 디코딩 (alias for decode_text)"""
         return self.decode_text(binary_data, encoding)
@@ -83,6 +95,21 @@ class BaseParser:
         except:
             return None
     
+    def add_chosung_keys(self, df):
+        """종목명/별칭의 초성 검색 키(chosung_names) 컬럼 추가"""
+        if df.empty or 'instrument_name' not in df.columns:
+            return df
+
+        def _keys(row):
+            names = [row['instrument_name']]
+            aliases = row.get('alias_names')
+            if isinstance(aliases, str) and aliases:
+                names.extend(aliases.split(','))
+            return build_chosung_keys(names)
+
+        df['chosung_names'] = df.apply(_keys, axis=1)
+        return df
+    
     def parse(self):
         """파일 파싱 구현 (하위 클래스에서 오버라이드)"""
         raise NotImplementedError("하위 클래스에서 구현해야 합니다.")
@@ -95,8 +122,19 @@ class BaseParser:
         """파싱된 데이터 반환"""
         if self.data is None:
             try:
-                parsed_data = self.parse()
-                self.data = self.transform(parsed_data)
+                # 같은 실행에서 같은 파일을 이미 파싱했다면 결과 재사용
+                artifact = self.get_artifact()
+                cache_key = (type(self).__name__, self.market_type)
+                if cache_key not in artifact.parsed:
+                    parser_name = type(self).__name__
+                    market = self.market_type or parser_name
+                    with stage_timer('parse', market, parser_name, bytes=artifact.byte_size) as stage:
+                        parsed_data = self.parse()
+                        stage.rows = len(parsed_data)
+                    with stage_timer('transform', market, parser_name) as stage:
+                        artifact.parsed[cache_key] = self.transform(parsed_data)
+                        stage.rows = len(artifact.parsed[cache_key])
+                self.data = artifact.parsed[cache_key]
             except Exception as e:
                 logger.error(f"{self.market_type} 데이터 파싱 오류: {e}", exc_info=True)
                 self.data = pd.DataFrame()  # 빈 DataFrame 반환
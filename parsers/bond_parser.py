@@ -0,0 +1,172 @@
+import logging
+import os
+from itertools import islice
+import pandas as pd
+from artifact_registry import stream_master
+from config import BOND_CHUNK_SIZE
+from hangul_utils import build_chosung_keys
+from .base_parser import BaseParser
+from .fixed_width import slice_fields, to_number, to_date, header_layout, check_record_width
+
+logger = logging.getLogger('bond_parser')
+
+# 헤더(.h) 파일이 없을 때 쓰는 기본 레이아웃 (필드명, 시작, 길이) - 바이트 기준, 350바이트 레코드
+BOND_LAYOUT = [
+    ('bond_type', 0, 2),               # 채권유형
+    ('bond_class', 2, 2),              # 채권분류코드
+    ('standard_code', 4, 12),          # 표준코드
+    ('short_code', 16, 9),             # 단축코드
+    ('name', 25, 80),                  # 한글종목명
+    ('issuer_code', 105, 10),          # 발행기관코드
+    ('issuer_name', 115, 40),          # 발행기관명
+    ('interest_payment_code', 155, 1), # 이자지급방법
+    ('interest_rate', 156, 10),        # 표면금리(%)
+    ('credit_rating', 166, 10),        # 신용등급
+    ('listing_date', 176, 8),          # 상장일
+    ('issue_date', 184, 8),            # 발행일
+    ('maturity_date', 192, 8),         # 상환일
+    ('face_value', 200, 15),           # 액면가
+]
+RECORD_SIZE = 350
+
+# 필드명 -> 헤더(.h) 설명 주석 (공백 무시, 변환에 쓰는 필드만)
+HEADER_LABELS = {
+    'standard_code': '표준코드',
+    'short_code': '단축코드',
+    'name': '한글종목명',
+    'issuer_code': '발행기관코드',
+    'issuer_name': '발행기관명',
+    'interest_payment_code': '이자지급방법',
+    'interest_rate': '표면금리',
+    'credit_rating': '신용등급',
+    'listing_date': '상장일',
+    'issue_date': '발행일',
+    'maturity_date': '상환일',
+    'face_value': '액면가',
+}
+
+# 변환 결과 컬럼 (빈 청크도 같은 컬럼을 가지도록)
+INSTRUMENT_COLUMNS = [
+    'instrument_code', 'short_code', 'instrument_name', 'instrument_name_eng', 'instrument_type',
+    'market_type', 'country_code', 'currency_code', 'listing_date', 'issue_date', 'maturity_date',
+    'face_value', 'issuer_code', 'issuer_name', 'interest_rate', 'interest_payment_type', 'credit_rating',
+    'is_elw', 'is_etf', 'is_etn', 'is_warning', 'is_caution', 'is_risk', 'is_managed',
+    'is_credit_available', 'is_foreign', 'created_at', 'updated_at', 'chosung_names',
+]
+
+# 이자지급방법 코드 -> interest_payment_type (모르는 코드는 원본 코드 유지)
+INTEREST_PAYMENT_TYPES = {'1': '이표', '2': '할인', '3': '복리', '4': '단리'}
+
+class BondParser(BaseParser):
+    """채권 마스터 파일 파서
+
+    채권은 종목 수가 많아 iter_chunks() 로 레코드 청크 단위로 파싱/변환하고,
+    검증기/로더는 청크를 처리한 뒤 바로 버립니다. get_data() 는 전체 DataFrame 이 필요한 경우에만 사용합니다.
+    파일은 아티팩트 레지스트리를 거치지 않고 ZIP 멤버를 스트림으로 읽으며, 검증 패스와 적재 패스 사이에
+    파일이 바뀌면 적재를 중단합니다. 레코드 길이가 레이아웃 폭과 다르면 ValueError 로 중단하여
+    적재 전 검증이 실패합니다.
+    """
+
+    def __init__(self, master_file, header_file=None, market_type='채권코드', chunk_size=BOND_CHUNK_SIZE):
+        super().__init__(master_file, header_file, market_type)
+        self.record_size = RECORD_SIZE
+        self.chunk_size = chunk_size
+        self.source_signature = None  # 처음 읽은 파일 서명 (멤버명, CRC, 크기)
+        self.layout = None
+
+    def resolve_layout(self):
+        """레코드 레이아웃 (헤더 파일이 있으면 헤더의 필드 오프셋과 전체 폭, 없으면 BOND_LAYOUT/RECORD_SIZE)"""
+        if self.layout is None:
+            if self.header_file and os.path.exists(self.header_file):
+                self.layout, self.record_size = header_layout(self.header_file, HEADER_LABELS)
+            else:
+                logger.warning(f"{self.market_type} 헤더 파일이 없어 기본 레이아웃({RECORD_SIZE}bytes)을 사용합니다: {self.header_file}")
+                self.layout = BOND_LAYOUT
+        return self.layout
+
+    def iter_records(self, chunk_size=None):
+        """레코드 bytes 목록을 chunk_size 개씩 생성 (라인 단위 또는 개행 없는 고정 길이)"""
+        chunk_size = chunk_size or self.chunk_size
+        self.resolve_layout()
+        with stream_master(self.master_file) as (f, signature):
+            if self.source_signature is None:
+                self.source_signature = signature
+            elif signature != self.source_signature:
+                raise ValueError(f"{self.market_type} 마스터 파일이 검증 이후 변경되었습니다: {self.master_file}")
+            has_newline = b'\n' in f.read(self.record_size + 2)
+            f.seek(0)
+            while True:
+                if has_newline:
+                    records = [line.rstrip(b'\r\n') for line in islice(f, chunk_size)]
+                else:
+                    block = f.read(self.record_size * chunk_size)
+                    # 파일 끝의 잘린 레코드도 포함해 폭 검사에서 걸러지도록 함
+                    records = [block[i:i + self.record_size] for i in range(0, len(block), self.record_size)]
+                if not records:
+                    break
+                # 빈 레코드만 있는 청크는 건너뜀 (빈 청크는 컬럼 없는 DataFrame 이 됨)
+                records = [record for record in records if record.strip()]
+                if records:
+                    check_record_width(records, self.record_size, self.market_type)
+                    yield records
+
+    def iter_chunks(self, chunk_size=None):
+        """instruments 컬럼으로 변환된 DataFrame 청크 생성"""
+        parsed = 0
+        for records in self.iter_records(chunk_size):
+            parsed += len(records)
+            chunk = self.transform(slice_fields(records, self.layout, width=self.record_size))
+            logger.info(f"채권 청크 변환: {len(chunk):,}개 (누계 {parsed:,}개 레코드)")
+            yield chunk
+
+    def parse(self):
+        """채권 마스터 파일 전체 -> 원본 필드 DataFrame"""
+        frames = [slice_fields(records, self.layout, width=self.record_size) for records in self.iter_records()]
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=[f[0] for f in self.layout])
+        logger.info(f"채권 마스터 파일 파싱 완료: {len(frame):,}개 레코드")
+        return frame
+
+    def transform(self, parsed_data):
+        """원본 필드 -> instruments 컬럼 (벡터 연산)"""
+        if parsed_data is None or parsed_data.empty:
+            return pd.DataFrame(columns=INSTRUMENT_COLUMNS)
+
+        raw = parsed_data[(parsed_data['standard_code'] != '') & (parsed_data['name'] != '')]
+        payment_type = raw['interest_payment_code'].map(INTEREST_PAYMENT_TYPES).fillna(raw['interest_payment_code'])
+
+        df = pd.DataFrame({
+            'instrument_code': raw['standard_code'],
+            # 단축코드가 없으면 표준코드 국가/상품 구분(3자리) 이후 9자리 사용
+            'short_code': raw['short_code'].where(raw['short_code'] != '', raw['standard_code'].str[3:]),
+            'instrument_name': raw['name'],
+            'instrument_name_eng': None,
+            'instrument_type': 'BOND',
+            'market_type': self.market_type,
+            'country_code': 'KOR',
+            'currency_code': 'KRW',
+            'listing_date': to_date(raw['listing_date']),
+            'issue_date': to_date(raw['issue_date']),
+            'maturity_date': to_date(raw['maturity_date']),
+            'face_value': to_number(raw['face_value'], zero_as_null=True),
+            'issuer_code': raw['issuer_code'].where(raw['issuer_code'] != ''),
+            'issuer_name': raw['issuer_name'].where(raw['issuer_name'] != ''),
+            'interest_rate': to_number(raw['interest_rate']),
+            'interest_payment_type': payment_type.where(payment_type != ''),
+            'credit_rating': raw['credit_rating'].where(raw['credit_rating'] != ''),
+            'is_elw': 'N',
+            'is_etf': 'N',
+            'is_etn': 'N',
+            'is_warning': 'N',
+            'is_caution': 'N',
+            'is_risk': 'N',
+            'is_managed': 'N',
+            'is_credit_available': 'N',
+            'is_foreign': 'N',
+            'created_at': pd.Timestamp.now(),
+            'updated_at': pd.Timestamp.now()
+        })
+
+        # 초성 검색 키 (별칭이 없으므로 고유 종목명 단위로 계산)
+        names = df['instrument_name'].unique()
+        df['chosung_names'] = df['instrument_name'].map({name: build_chosung_keys([name]) for name in names})
+        return df.reset_index(drop=True)
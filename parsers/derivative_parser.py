@@ -0,0 +1,192 @@
+import io
+import logging
+import pandas as pd
+from hangul_utils import build_chosung_keys
+from .base_parser import BaseParser
+from .fixed_width import split_records, slice_fields, to_number, header_layout, check_record_width
+
+logger = logging.getLogger('derivative_parser')
+
+# 마스터 파일 컬럼 (KIS 샘플 코드 순서: 상품종류|단축코드|표준코드|한글종목명|ATM구분|행사가|월물구분코드|기초자산 단축코드|기초자산 명)
+FIELD_NAMES = [
+    'product_kind', 'short_code', 'standard_code', 'name', 'atm_type',
+    'strike_price', 'month_code', 'underlying_code', 'underlying_name'
+]
+
+# '|' 구분자가 없는 고정 길이 파일(상품선물옵션 등)은 다운로드한 헤더(.h)에서 오프셋을 읽음
+# 필드명 -> 헤더 설명 주석 (공백 무시)
+HEADER_LABELS = {
+    'product_kind': '상품종류',
+    'short_code': '단축코드',
+    'standard_code': '표준코드',
+    'name': '한글종목명',
+    'atm_type': 'ATM구분',
+    'strike_price': '행사가',
+    'month_code': '월물구분코드',
+    'underlying_code': '기초자산 단축코드',
+    'underlying_name': '기초자산 명',
+}
+
+# 항목명 -> 상품 분류 (instrument_subtype 접두어)
+ITEM_CATEGORIES = {
+    '지수선물옵션': 'INDEX',
+    '주식선물옵션': 'STOCK',
+    '상품선물옵션': 'COMMODITY',
+}
+
+# 단축코드 첫 자리 -> 상품 구분 (구 코드 1~4, 신 코드 A~D)
+KIND_CODES = {
+    '1': 'FUTURE', 'A': 'FUTURE',
+    '2': 'CALL', 'B': 'CALL',
+    '3': 'PUT', 'C': 'PUT',
+    '4': 'SPREAD', 'D': 'SPREAD',
+}
+
+# 단축코드 연도/월 코드 (연도: I/O/U 제외 알파벳, A=2006 / 월: 1~9, A~C)
+YEAR_CODES = {ch: 2006 + i for i, ch in enumerate('ABCDEFGHJKLMNPQRSTVWXYZ')}
+MONTH_CODES = {ch: i + 1 for i, ch in enumerate('123456789ABC')}
+
+# 최종거래일 규칙: (요일 0=월요일, 해당 월의 n번째)
+SECOND_THURSDAY = (3, 2)
+THIRD_TUESDAY = (1, 3)
+THIRD_MONDAY = (0, 3)
+
+# 상품코드(단축코드 2~3번째 자리) -> (계약승수, 선물 호가단위, 옵션 최소 호가단위, 최종거래일 규칙)
+PRODUCT_SPECS = {
+    '01': (250000, 0.05, 0.01, SECOND_THURSDAY),   # 코스피200
+    '05': (50000, 0.02, 0.01, SECOND_THURSDAY),    # 미니코스피200
+    '06': (10000, 0.1, 0.1, SECOND_THURSDAY),      # 코스닥150
+    '65': (1000000, 0.01, None, THIRD_TUESDAY),    # 3년 국채
+    '66': (1000000, 0.01, None, THIRD_TUESDAY),    # 5년 국채
+    '67': (1000000, 0.01, None, THIRD_TUESDAY),    # 10년 국채
+    '75': (10000, 0.1, 0.1, THIRD_MONDAY),         # 미국달러
+    '76': (10000, 0.1, None, THIRD_MONDAY),        # 엔 (100엔당 가격)
+    '77': (10000, 0.1, None, THIRD_MONDAY),        # 유로
+    '78': (100000, 0.01, None, THIRD_MONDAY),      # 위안
+}
+
+# 주식선물옵션은 기초주식마다 상품코드가 달라 공통 규격 사용 (호가단위는 가격대별이라 비움)
+STOCK_SPEC = (10, None, None, SECOND_THURSDAY)
+
+class DerivativeParser(BaseParser):
+    """국내 선물옵션 마스터 파일 파서 (지수/주식/상품선물옵션)
+
+    레코드마다 dict 를 만들지 않고 파일 전체를 컬럼 단위로 잘라 변환합니다.
+    계약승수/호가단위/최종거래일은 마스터 파일에 없으므로 단축코드의 상품코드와 월물 코드에서
+    거래소 상품 규격으로 계산합니다 (휴장일 조정 없음).
+    """
+
+    def __init__(self, master_file, header_file, market_type):
+        super().__init__(master_file, header_file, market_type)
+        self.category = ITEM_CATEGORIES.get(market_type, 'INDEX')
+
+    def parse(self):
+        """선물옵션 마스터 파일 -> 원본 필드 DataFrame ('|' 구분 또는 헤더 레이아웃의 고정 길이)"""
+        data = self.get_artifact().data
+        records = split_records(data)
+        logger.info(f"{self.market_type} 마스터 파일 파싱 시작: 총 {len(records):,}개 레코드")
+        if not records:
+            return pd.DataFrame(columns=FIELD_NAMES)
+
+        if b'|' in records[0]:
+            frame = pd.read_csv(
+                io.BytesIO(b'\n'.join(records)), sep='|', header=None, names=FIELD_NAMES,
+                usecols=range(len(FIELD_NAMES)), dtype=str, encoding='cp949',
+                keep_default_na=False, quoting=3, encoding_errors='replace'
+            )
+            frame = frame.apply(lambda column: column.str.strip())
+        else:
+            # 레이아웃을 추정하지 않음: 헤더가 없거나 레코드 폭이 다르면 ValueError (적재 전 검증 실패)
+            layout, width = header_layout(self.header_file, HEADER_LABELS)
+            check_record_width(records, width, self.market_type)
+            frame = slice_fields(records, layout, width=width)
+
+        logger.info(f"{self.market_type} 마스터 파일 파싱 완료: {len(frame):,}개 레코드")
+        return frame
+
+    def contract_specs(self, short_code):
+        """단축코드 -> 상품 규격 DataFrame (contract_size, future_tick, option_tick, weekday, nth)"""
+        if self.category == 'STOCK':
+            specs = pd.DataFrame([STOCK_SPEC] * len(short_code), index=short_code.index)
+        else:
+            product = short_code.str[1:3]
+            specs = pd.DataFrame(
+                [PRODUCT_SPECS.get(code, (None, None, None, SECOND_THURSDAY)) for code in product],
+                index=short_code.index
+            )
+        specs.columns = ['contract_size', 'future_tick', 'option_tick', 'rule']
+        specs['weekday'] = specs['rule'].str[0]
+        specs['nth'] = specs['rule'].str[1]
+        return specs.drop(columns='rule')
+
+    def last_trading_dates(self, short_code, specs):
+        """단축코드 월물(연도/월 코드) -> 최종거래일 (해당 월 n번째 요일)"""
+        year = short_code.str[3].map(YEAR_CODES)
+        month = short_code.str[4].map(MONTH_CODES)
+        month_start = pd.to_datetime(
+            pd.DataFrame({'year': year, 'month': month, 'day': 1}), errors='coerce'
+        )
+        weekday = month_start.dt.weekday
+        offset = (specs['weekday'] - weekday) % 7 + 7 * (specs['nth'] - 1)
+        dates = month_start + pd.to_timedelta(offset, unit='D')
+        return dates.dt.date.where(dates.notna(), None)
+
+    def transform(self, parsed_data):
+        """원본 필드 -> instruments 컬럼 (벡터 연산)"""
+        if parsed_data is None or parsed_data.empty:
+            logger.warning(f"{self.market_type} 변환할 데이터 없음")
+            return pd.DataFrame()
+
+        raw = parsed_data[parsed_data['short_code'] != ''].reset_index(drop=True)
+        short_code = raw['short_code']
+        kind = short_code.str[0].map(KIND_CODES)
+        # 단축코드로 구분할 수 없으면 상품종류 필드 사용
+        kind = kind.fillna(raw['product_kind'].map(KIND_CODES))
+        is_option = kind.isin(['CALL', 'PUT'])
+
+        specs = self.contract_specs(short_code)
+        last_trading_date = self.last_trading_dates(short_code, specs)
+
+        df = pd.DataFrame({
+            'instrument_code': raw['standard_code'].where(raw['standard_code'] != '', short_code),
+            'short_code': short_code,
+            'instrument_name': raw['name'],
+            'instrument_name_eng': None,
+            'instrument_type': is_option.map({True: 'OPTION', False: 'FUTURE'}),
+            'instrument_subtype': self.category + '_' + kind.fillna('FUTURE').replace({'CALL': 'OPTION', 'PUT': 'OPTION'}),
+            'market_type': self.market_type,
+            'country_code': 'KOR',
+            'currency_code': 'KRW',
+            'listing_date': None,
+            'maturity_date': last_trading_date,
+            'last_trading_date': last_trading_date,
+            'underlying_code': raw['underlying_code'].where(raw['underlying_code'] != ''),
+            'underlying_asset': raw['underlying_name'].where(raw['underlying_name'] != ''),
+            'exercise_type': kind.map({'CALL': '콜', 'PUT': '풋'}),
+            'strike_price': to_number(raw['strike_price'], zero_as_null=True).where(is_option),
+            'contract_size': specs['contract_size'].astype('Int64'),
+            'price_tick': specs['option_tick'].where(is_option, specs['future_tick']),
+            'is_elw': 'N',
+            'is_etf': 'N',
+            'is_etn': 'N',
+            'is_warning': 'N',
+            'is_caution': 'N',
+            'is_risk': 'N',
+            'is_managed': 'N',
+            'is_credit_available': 'N',
+            'is_foreign': 'N',
+            'created_at': pd.Timestamp.now(),
+            'updated_at': pd.Timestamp.now()
+        })
+
+        # 종목코드 중복은 제거하지 않음 (적재 전 검증에서 보고, 로더에서 정리)
+        df = df[df['instrument_name'] != ''].copy()
+
+        # 초성 검색 키 (별칭이 없으므로 고유 종목명 단위로 계산)
+        names = df['instrument_name'].unique()
+        df['chosung_names'] = df['instrument_name'].map({name: build_chosung_keys([name]) for name in names})
+
+        counts = df['instrument_type'].value_counts().to_dict()
+        logger.info(f"{self.market_type} 변환 완료: {len(df)}개 유효 레코드 (선물 {counts.get('FUTURE', 0)}개, 옵션 {counts.get('OPTION', 0)}개)")
+
+        return df
@@ -16,15 +16,13 @@ class DomesticStockParser(BaseParser):
     
     def parse(self):
         """국내주식 마스터 파일 파싱"""
-        extracted_file = self.extract_if_zip()
-        
-        if not os.path.exists(extracted_file):
-            logger.error(f"파일이 존재하지 않음: {extracted_file}")
+        if not os.path.exists(self.master_file):
+            logger.error(f"파일이 존재하지 않음: {self.master_file}")
             return []
             
         # 샘플 코드와 동일하게 텍스트 모드로 파싱
         result = []
-        with open(extracted_file, mode="r", encoding="cp949") as f:
+        with self.open_master() as f:
             lines = f.readlines()
             total_records = len(lines)
             
@@ -71,8 +69,10 @@ class DomesticStockParser(BaseParser):
                 industry_small = back_part[offset:offset+4].strip()
                 offset += 4
                 
-                # 업종코드는 대분류 코드 사용
+                # 업종코드는 대분류 코드 사용 (중/소분류는 업종 계층 구성용으로 별도 보관)
                 industry_code = industry_large
+                industry_medium_code = self._normalize_industry_code(industry_medium)
+                industry_small_code = self._normalize_industry_code(industry_small)
                 
                 # 나머지 필드들 스킵하여 필요한 위치로 이동
                 # 제조업(1) + 저유동성(1) + ... + SRI(1) = 26개 1바이트 필드들 스킵
@@ -164,6 +164,8 @@ class DomesticStockParser(BaseParser):
                     'listing_date': parsed_listing_date,
                     'face_value': face_value,
                     'industry_code': industry_code,
+                    'industry_medium_code': industry_medium_code,
+                    'industry_small_code': industry_small_code,
                     'is_warning': 'Y' if is_warning else 'N',
                     'is_managed': 'Y' if is_managed else 'N',
                     'is_etf': is_etf,
@@ -213,6 +215,9 @@ class DomesticStockParser(BaseParser):
             lambda row: self._generate_aliases(row), axis=1
         )
         
+        # 초성 검색 키 생성 (예: 삼성전자 -> ㅅㅅㅈㅈ)
+        df = self.add_chosung_keys(df)
+        
         # 삼성전자 등 주요 종목 검증
         if self.market_type == '코스피':
             samsung = df[df['short_code'] == '005930']
@@ -223,6 +228,12 @@ class DomesticStockParser(BaseParser):
         
         return df
     
+    def _normalize_industry_code(self, code):
+        """업종 중/소분류 코드 정리 (공백/0000은 분류 없음)"""
+        if not code or not code.strip('0'):
+            return None
+        return code
+    
     def _generate_aliases(self, row):
         """별칭 생성"""
         aliases = []
@@ -1,4 +1,4 @@
-ㅎimport pandas as pd
+import pandas as pd
 import struct
 import os
 import logging
@@ -17,13 +17,11 @@ class ELWParser(BaseParser):
     
     def parse(self):
         """ELW 마스터 파일 파싱"""
-        extracted_file = self.extract_if_zip()
-        
         result = []
         record_count = 0
         
         try:
-            with open(extracted_file, 'rb') as f:
+            with self.open_master(binary=True) as f:
                 file_data = f.read()
                 total_records = len(file_data) // self.record_size
                 
@@ -138,6 +136,9 @@ class ELWParser(BaseParser):
         df['instrument_name'] = df['instrument_name'].astype(str)
         df['market_type'] = df['market_type'].astype(str)
         
+        # 초성 검색 키 생성
+        df = self.add_chosung_keys(df)
+        
         logger.info(f"ELW 변환 완료: {len(df)}개 유효 레코드")
         
         return df
@@ -0,0 +1,126 @@
+"""
+고정 길이(바이트) 마스터 레코드 벡터 파싱 도구
+레코드를 (레코드 수 x 레코드 길이) uint8 행렬로 만든 뒤 필드별 열 구간을 한 번에 잘라
+DataFrame 으로 변환합니다. cp949 한글 필드도 바이트 오프셋 기준으로 자르므로
+레코드마다 dict 를 만드는 파서보다 수천~수만 건 파일에서 훨씬 빠릅니다.
+"""
+
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# KIS 헤더(.h) 파일의 크기 상수와 char 배열 필드 선언 (예: char shrn_iscd[SZ_SHRNCODE]; /* 단축코드 */)
+HEADER_DEFINE = re.compile(r'#define\s+(\w+)\s+(\d+)')
+HEADER_FIELD = re.compile(r'char\s+(\w+)\s*\[\s*(\w+)\s*\]\s*;[ \t]*(?:/\*(.*?)\*/|//([^\n]*))?')
+
+def split_records(data, record_size=None):
+    """마스터 파일 바이트 -> 레코드 bytes 목록
+
+    개행이 있으면 라인 단위(CR/LF 제거), 개행 없는 고정 길이 파일은 record_size 단위로 나눕니다.
+    빈 라인은 제외합니다.
+    """
+    if b'\n' in data or not record_size:
+        return [line for line in data.splitlines() if line.strip()]
+    count = len(data) // record_size
+    return [data[i * record_size:(i + 1) * record_size] for i in range(count)]
+
+def byte_matrix(records, width=None):
+    """레코드 목록 -> (레코드 수, width) uint8 행렬 (짧은 레코드는 공백으로 채움)"""
+    width = width or max((len(record) for record in records), default=1)
+    if not records:
+        return np.empty((0, width), dtype=np.uint8)
+    # numpy 'S' 배열은 짧은 값을 NUL 로 채우므로 공백으로 바꿔 필드 strip 과 같게 처리
+    matrix = np.array(records, dtype=f'S{width}').view(np.uint8).reshape(len(records), width)
+    matrix = matrix.copy()
+    matrix[matrix == 0] = ord(' ')
+    return matrix
+
+def column_bytes(matrix, start, length):
+    """행렬의 [start, start+length) 바이트 구간 -> bytes Series"""
+    end = min(start + length, matrix.shape[1])
+    if start >= end:
+        return pd.Series([b''] * matrix.shape[0], dtype=object)
+    block = np.ascontiguousarray(matrix[:, start:end])
+    return pd.Series(block.view(f'S{end - start}').ravel(), dtype=object)
+
+def slice_fields(records, specs, encoding='cp949', width=None):
+    """고정 길이 레코드 -> 필드별 문자열 DataFrame
+
+    specs: [(필드명, 시작 오프셋, 길이), ...] (바이트 기준)
+    값은 디코딩 후 앞뒤 공백을 제거하며, 빈 문자열은 그대로 둡니다.
+    """
+    matrix = byte_matrix(records, width)
+    columns = {}
+    for name, start, length in specs:
+        raw = column_bytes(matrix, start, length)
+        columns[name] = raw.str.decode(encoding, errors='replace').str.strip()
+    return pd.DataFrame(columns)
+
+def to_number(series, zero_as_null=False):
+    """숫자 문자열 Series -> float Series (빈값/형식 오류는 NaN)"""
+    values = pd.to_numeric(series.replace('', np.nan), errors='coerce')
+    if zero_as_null:
+        values = values.where(values != 0)
+    return values
+
+def to_date(series, fmt='%Y%m%d'):
+    """YYYYMMDD 문자열 Series -> date 객체 Series (빈값/'00000000'/형식 오류는 NaT)"""
+    values = pd.to_datetime(series.where(series.str.strip('0 ') != ''), format=fmt, errors='coerce')
+    return values.dt.date.where(values.notna(), None)
+
+def read_header_fields(header_path):
+    """KIS 헤더(.h) 파일 -> [(C 필드명, 설명 주석, 시작, 길이)] (선언 순서대로 바이트 오프셋 누적)"""
+    if not header_path or not os.path.exists(header_path):
+        raise ValueError(f"헤더 파일이 없음: {header_path}")
+    with open(header_path, 'rb') as f:
+        data = f.read()
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('cp949', errors='replace')
+
+    sizes = {name: int(value) for name, value in HEADER_DEFINE.findall(text)}
+    fields = []
+    offset = 0
+    for name, size, block_comment, line_comment in HEADER_FIELD.findall(text):
+        length = int(size) if size.isdigit() else sizes.get(size)
+        if length is None:
+            raise ValueError(f"헤더 필드 크기를 알 수 없음: {name}[{size}] ({header_path})")
+        fields.append((name, (block_comment or line_comment).strip(), offset, length))
+        offset += length
+    if not fields:
+        raise ValueError(f"헤더에서 필드 선언을 찾을 수 없음: {header_path}")
+    return fields
+
+def header_layout(header_path, labels):
+    """헤더 필드 설명 주석으로 찾은 레이아웃 -> ([(필드명, 시작, 길이)], 레코드 폭)
+
+    labels: {필드명: 헤더 설명 주석} (공백 무시 비교). 하나라도 없으면 ValueError.
+    """
+    fields = read_header_fields(header_path)
+    offsets = {}
+    for _, label, start, length in fields:
+        offsets.setdefault(''.join(label.split()), (start, length))
+
+    layout = []
+    missing = []
+    for name, label in labels.items():
+        found = offsets.get(''.join(label.split()))
+        if found is None:
+            missing.append(label)
+        else:
+            layout.append((name, *found))
+    if missing:
+        raise ValueError(f"헤더에 필요한 필드가 없음: {missing} ({header_path})")
+    _, _, start, length = fields[-1]
+    return layout, start + length
+
+def check_record_width(records, width, name=''):
+    """레코드 길이가 레이아웃 폭과 다르면 ValueError (레이아웃이 파일과 맞지 않음)"""
+    mismatched = [len(record) for record in records if len(record) != width]
+    if mismatched:
+        raise ValueError(
+            f"{name} 레코드 길이가 레이아웃 폭({width}bytes)과 다름: "
+            f"{len(mismatched):,}/{len(records):,}개 레코드 (예: {mismatched[0]}bytes)"
+        )
@@ -19,7 +19,7 @@ class MemberParser(BaseParser):
             return []
             
         result = []
-        with open(self.master_file, 'rb') as f:
+        with self.open_master(binary=True) as f:
             file_data = f.read()
             total_records = len(file_data) // self.record_size
             
@@ -0,0 +1,156 @@
+import io
+import logging
+import numpy as np
+import pandas as pd
+from hangul_utils import build_chosung_keys
+from .base_parser import BaseParser
+
+logger = logging.getLogger('overseas_parser')
+
+# 해외 마스터(.cod) 탭 구분 컬럼 (KIS 샘플 코드 순서)
+OVERSEAS_COLUMNS = [
+    'national_code', 'exchange_id', 'exchange_code', 'exchange_name', 'symbol', 'realtime_symbol',
+    'korea_name', 'english_name', 'security_type', 'currency', 'float_position', 'data_type',
+    'base_price', 'bid_order_size', 'ask_order_size', 'market_start_time', 'market_end_time',
+    'dr_yn', 'dr_country_code', 'industry_code', 'index_member_yn', 'tick_size_type',
+    'etp_type', 'tick_size_type_detail'
+]
+
+# 국가코드(2자리) -> country_code(3자리)
+COUNTRY_CODES = {'US': 'USA', 'CN': 'CHN', 'JP': 'JPN', 'HK': 'HKG', 'VN': 'VNM'}
+
+# Security type (1:Index, 2:Stock, 3:ETP, 4:Warrant) -> instrument_type
+SECURITY_TYPES = {'1': 'INDEX', '2': 'STOCK', '3': 'ETF', '4': 'WARRANT'}
+
+def decode_cp949(data, name=''):
+    """cp949 bytes -> str (엄격 디코딩, 실패 시 대체 문자로 디코딩하고 대체 건수를 경고)"""
+    try:
+        return data.decode('cp949')
+    except UnicodeDecodeError as e:
+        text = data.decode('cp949', errors='replace')
+        logger.warning(f"{name} cp949 디코딩 오류: {text.count(chr(0xFFFD))}개 문자를 대체 문자로 변환 (첫 위치 {e.start}바이트)")
+        return text
+
+def tab_field_counts(text):
+    """라인별 탭 구분 필드 수 (벡터 연산) -> (필드 수 배열, 빈 라인 마스크)"""
+    buf = np.frombuffer(text, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord('\n'))
+    line_count = len(newlines) + (1 if len(buf) and buf[-1] != ord('\n') else 0)
+    tabs = np.flatnonzero(buf == ord('\t'))
+    counts = np.bincount(np.searchsorted(newlines, tabs), minlength=line_count)[:line_count] + 1
+
+    starts = np.concatenate(([0], newlines + 1))[:line_count]
+    ends = np.concatenate((newlines, [len(buf)]))[:line_count]
+    lengths = ends - starts
+    # CRLF 파일의 빈 라인은 '\r' 한 글자
+    blank = (lengths == 0) | ((lengths == 1) & (buf[np.minimum(starts, len(buf) - 1)] == ord('\r')))
+    return counts, blank
+
+def read_tab_delimited(data, columns, name=''):
+    """탭 구분 텍스트(bytes) -> 문자열 DataFrame
+
+    pyarrow 가 설치되어 있으면 멀티스레드 CSV 리더를 사용하고, 없으면 pandas C 파서를 사용합니다.
+    cp949 원본은 먼저 UTF-8 로 변환하여 pyarrow 의 UTF-8 경로(GIL 해제)를 그대로 사용합니다.
+    필드 수가 컬럼 수와 다른 라인은 두 엔진 모두 파싱 전에 같은 기준으로 제외하고 건수를 경고합니다.
+    """
+    text = decode_cp949(data, name).encode('utf-8')
+
+    counts, blank = tab_field_counts(text)
+    bad = ~blank & (counts != len(columns))
+    if bad.any():
+        bad_lines = np.flatnonzero(bad)
+        logger.warning(
+            f"{name} 필드 수가 {len(columns)}개가 아닌 라인 {len(bad_lines)}개 제외 "
+            f"(라인 번호 예: {', '.join(str(i + 1) for i in bad_lines[:5])})"
+        )
+        lines = text.split(b'\n')[:len(bad)]
+        text = b'\n'.join(line for line, skip in zip(lines, bad) if not skip)
+    if (blank | bad).all():
+        return pd.DataFrame(columns=columns, dtype=str)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa_csv = None
+
+    if pa_csv is not None:
+        table = pa_csv.read_csv(
+            pa.BufferReader(text),
+            read_options=pa_csv.ReadOptions(column_names=columns, use_threads=True),
+            parse_options=pa_csv.ParseOptions(delimiter='\t', quote_char=False),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in columns},
+                strings_can_be_null=False, quoted_strings_can_be_null=False
+            )
+        )
+        return table.to_pandas()
+
+    return pd.read_csv(
+        io.BytesIO(text), sep='\t', header=None, names=columns,
+        dtype=str, keep_default_na=False, quoting=3, encoding='utf-8'
+    )
+
+class OverseasParser(BaseParser):
+    """해외 거래소 마스터(.cod) 파서 (나스닥/뉴욕/아멕스/상해/심천/도쿄/홍콩/하노이/호치민)
+
+    market_type 은 항목명('미국(나스닥)' 등)을 그대로 사용하고, 거래소/국가/통화는
+    exchange_code/country_code/currency_code 컬럼으로 구분합니다.
+    """
+
+    def parse(self):
+        """탭 구분 마스터 파일 -> 원본 필드 DataFrame"""
+        frame = read_tab_delimited(self.get_artifact().data, OVERSEAS_COLUMNS, self.market_type)
+        frame = frame.fillna('').apply(lambda column: column.str.strip())
+        logger.info(f"{self.market_type} 마스터 파일 파싱 완료: {len(frame):,}개 레코드")
+        return frame
+
+    def transform(self, parsed_data):
+        """원본 필드 -> instruments 컬럼 (벡터 연산)"""
+        if parsed_data is None or parsed_data.empty:
+            logger.warning(f"{self.market_type} 변환할 데이터 없음")
+            return pd.DataFrame()
+
+        raw = parsed_data[parsed_data['symbol'] != ''].reset_index(drop=True)
+        exchange_code = raw['exchange_code']
+        # 심볼은 거래소 간 중복될 수 있어 실시간 심볼(예: DNASAAPL) 또는 거래소코드+심볼을 종목코드로 사용
+        instrument_code = raw['realtime_symbol'].where(raw['realtime_symbol'] != '', exchange_code + raw['symbol'])
+        name = raw['korea_name'].where(raw['korea_name'] != '', raw['english_name'])
+        etp_type = raw['etp_type']
+        yes_no = {True: 'Y', False: 'N'}
+
+        df = pd.DataFrame({
+            'instrument_code': instrument_code.str[:20],
+            'short_code': raw['symbol'].str[:12],
+            'instrument_name': name,
+            'instrument_name_eng': raw['english_name'].where(raw['english_name'] != ''),
+            'instrument_type': raw['security_type'].map(SECURITY_TYPES).fillna('STOCK'),
+            'market_type': self.market_type,
+            'country_code': raw['national_code'].map(COUNTRY_CODES).fillna(raw['national_code'].str[:3]),
+            'currency_code': raw['currency'].where(raw['currency'] != ''),
+            'exchange_code': exchange_code.where(exchange_code != ''),
+            'price_decimal': pd.to_numeric(raw['float_position'], errors='coerce').fillna(0).astype(int),
+            'trading_hours': (raw['market_start_time'] + '-' + raw['market_end_time']).where(raw['market_start_time'] != ''),
+            'is_etf': (etp_type == '001').map(yes_no),
+            'is_etn': (etp_type == '002').map(yes_no),
+            'is_dr': (raw['dr_yn'] == 'Y').map(yes_no),
+            'is_index': (raw['security_type'] == '1').map(yes_no),
+            'is_elw': 'N',
+            'is_warning': 'N',
+            'is_caution': 'N',
+            'is_risk': 'N',
+            'is_managed': 'N',
+            'is_credit_available': 'N',
+            'is_foreign': 'N',
+            'created_at': pd.Timestamp.now(),
+            'updated_at': pd.Timestamp.now()
+        })
+        # 종목코드 중복은 제거하지 않음 (적재 전 검증에서 보고, 로더에서 정리)
+        df = df[df['instrument_name'] != ''].copy()
+
+        # 초성 검색 키 (한글 종목명이 있는 경우만 의미 있음, 고유 종목명 단위로 계산)
+        names = df['instrument_name'].unique()
+        df['chosung_names'] = df['instrument_name'].map({name: build_chosung_keys([name]) for name in names})
+
+        logger.info(f"{self.market_type} 변환 완료: {len(df)}개 유효 레코드")
+        return df.reset_index(drop=True)
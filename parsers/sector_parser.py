@@ -12,13 +12,11 @@ class SectorParser(BaseParser):
     
     def parse(self):
         """업종코드 마스터 파일 파싱"""
-        extracted_file = self.extract_if_zip()
-        
         result = []
         record_count = 0
         
         try:
-            with open(extracted_file, mode="r", encoding="cp949") as f:
+            with self.open_master() as f:
                 for row in f:
                     record_count += 1
                     
@@ -37,8 +35,10 @@ class SectorParser(BaseParser):
                         record = {
                             'sector_code': sector_code,
                             'sector_name': sector_name.strip(),
-                            'sector_level': 1,  # 기본값
-                            'parent_sector_code': None,  # 기본값
+                            # 계층 정보(대/중/소, 상위업종, 중첩집합 구간)는 종목 적재 후
+                            # SectorLoader.build_hierarchy()에서 종목의 업종 분류로 구성
+                            'sector_type': None,
+                            'parent_code': None,
                             'is_active': 'Y',
                             'created_at': pd.Timestamp.now(),
                             'updated_at': pd.Timestamp.now()
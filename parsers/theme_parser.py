@@ -12,13 +12,11 @@ class ThemeParser(BaseParser):
     
     def parse(self):
         """테마코드 마스터 파일 파싱"""
-        extracted_file = self.extract_if_zip()
-        
         result = []
         record_count = 0
         
         try:
-            with open(extracted_file, mode="r", encoding="cp949") as f:
+            with self.open_master() as f:
                 for row in f:
                     record_count += 1
                     
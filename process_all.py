@@ -3,6 +3,9 @@
 KIS 데이터 전체 프로세스 실행
 1. 데이터 재적재
 2. 검증 및 마크다운 리포트 생성
+
+--dag 옵션 사용 시 (다운로드 →) 파싱 → 적재 → 검증을 작업 그래프로 실행하여
+독립된 단계는 동시에 처리하고, --resume 으로 실패한 지점부터 재개합니다.
 """
 
 import logging
@@ -22,6 +25,163 @@ logging.basicConfig(
 
 logger = logging.getLogger('kis_process')
 
+def build_pipeline(file_mapping, download=False):
+    """재적재 파이프라인 작업 그래프 구성
+    
+    항목별 (다운로드 →) 파싱 노드는 서로 독립적으로 실행되고, 적재 전 검증과 테이블 초기화 이후
+    항목별 적재가 동시에 진행됩니다. 파싱 노드는 결과가 메모리에만 있으므로 체크포인트하지 않습니다.
+    """
+    from config import BOND_ITEM, DATA_DIR, DERIVATIVE_ITEMS, OVERSEAS_ITEMS
+    from task_graph import TaskGraph
+    from download_manifest import DownloadManifest
+    from loaders.member_loader import MemberLoader
+    from loaders.instrument_loader import InstrumentLoader
+    from reload_data import (
+        RELOAD_ITEMS, create_sector_parser, create_theme_parser, reload_master_files, validate_frames
+    )
+    
+    graph = TaskGraph('kis_reload')
+    manifest = DownloadManifest()
+    member_loader = MemberLoader(file_mapping)
+    instrument_loader = InstrumentLoader(file_mapping)
+    sector_parser = create_sector_parser()
+    theme_parser = create_theme_parser()
+    # 선물옵션/해외주식은 파일 매핑에 있는 항목만 (다운로드하지 않은 항목은 건너뜀)
+    # 채권은 파싱 노드 없이 적재 노드에서 청크 단위로 파싱하며 삽입
+    markets = [item for item in RELOAD_ITEMS if item not in ['회원사코드', BOND_ITEM] + DERIVATIVE_ITEMS + OVERSEAS_ITEMS]
+    markets += instrument_loader.derivative_items() + instrument_loader.overseas_items()
+    bond_items = [BOND_ITEM] if instrument_loader.has_item(BOND_ITEM) else []
+    # 다운로드/파싱/적재 노드는 모두 같은 항목 목록에서 생성 (매핑에 없는 항목은 다운로드하지 않음)
+    items = ['회원사코드'] + markets + bond_items + ['업종코드', '테마코드']
+    
+    # 1. 다운로드 (항목별)
+    download_nodes = {}
+    if download:
+        def resolve_urls(_):
+            from get_files import resolve_file_info_list
+            return {info['name']: info for info in resolve_file_info_list()}
+        graph.add('resolve_urls', resolve_urls, checkpoint=False)
+        
+        def make_download(item):
+            def task(results):
+                from get_files import download_files
+                info = results['resolve_urls'].get(item)
+                if info is None:
+                    raise RuntimeError(f"{item} 다운로드 URL 을 찾을 수 없습니다.")
+                row = download_files([info], DATA_DIR, manifest=manifest)[0]
+                manifest.save()
+                return bool(row[1])
+            return task
+        
+        for item in items:
+            download_nodes[item] = graph.add(f'download:{item}', make_download(item), ['resolve_urls'])
+    
+    def deps_for(item):
+        return [download_nodes[item]] if item in download_nodes else []
+    
+    # 2. 파싱 (항목별, 체크포인트 없음)
+    graph.add('parse:회원사코드', lambda _: member_loader.get_parser().get_data(), deps_for('회원사코드'), checkpoint=False)
+    graph.add('parse:업종코드', lambda _: sector_parser.get_data(), deps_for('업종코드'), checkpoint=False)
+    graph.add('parse:테마코드', lambda _: theme_parser.get_data(), deps_for('테마코드'), checkpoint=False)
+    for market in markets:
+        graph.add(f'parse:{market}', lambda _, m=market: instrument_loader.get_parser(m).get_data(),
+                  deps_for(market), checkpoint=False)
+    parse_nodes = [name for name in graph.tasks if name.startswith('parse:')]
+    
+    # 3. 적재 전 검증 -> 테이블 초기화 (채권은 검증 단계에서 청크 단위로 읽으므로 다운로드 이후 실행)
+    graph.add('validate_frames', lambda _: validate_frames(member_loader, instrument_loader, sector_parser, theme_parser),
+              parse_nodes + [dep for item in bond_items for dep in deps_for(item)], checkpoint=False)
+    
+    def truncate(_):
+        from db_utils import truncate_tables
+        return truncate_tables()
+    graph.add('truncate', truncate, ['validate_frames'])
+    
+    # 4. 항목별 적재
+    def load_sector(_):
+        from loaders.sector_loader import SectorLoader
+        return SectorLoader().load_data(sector_parser) > 0
+    
+    def load_theme(_):
+        from loaders.theme_loader import ThemeLoader
+        return ThemeLoader().load_data(theme_parser) > 0
+    
+    graph.add('load:회원사코드', lambda _: member_loader.load_all(), ['truncate', 'parse:회원사코드'])
+    graph.add('load:업종코드', load_sector, ['truncate', 'parse:업종코드'])
+    graph.add('load:테마코드', load_theme, ['truncate', 'parse:테마코드'])
+    for market in markets:
+        graph.add(f'load:{market}', lambda _, m=market: instrument_loader.load_market(m) > 0,
+                  ['truncate', f'parse:{market}'])
+    instrument_loads = [f'load:{market}' for market in markets]
+    for item in bond_items:
+        graph.add(f'load:{item}', lambda _: instrument_loader.load_bonds() > 0, ['truncate'] + deps_for(item))
+        instrument_loads.append(f'load:{item}')
+    
+    # 5. 업종 계층 / 종목-테마 매핑 (종목 적재 이후)
+    def build_hierarchy(_):
+        from loaders.sector_loader import SectorLoader
+        return SectorLoader().build_hierarchy() is not None
+    
+    def load_theme_map(_):
+        from loaders.theme_loader import ThemeLoader
+        return ThemeLoader().load_theme_map(theme_parser) > 0
+    
+    graph.add('sector_hierarchy', build_hierarchy, ['load:업종코드'] + instrument_loads)
+    graph.add('theme_map', load_theme_map, ['load:테마코드', 'parse:테마코드'] + instrument_loads)
+    
+    # 6. 세대 번호 갱신 및 적재 완료 기록
+    def publish(_):
+        from search.generation import bump_generation
+        bump_generation()
+        manifest.mark_loaded(reload_master_files(file_mapping))
+        manifest.save()
+        return True
+    graph.add('publish', publish, ['load:회원사코드', 'sector_hierarchy', 'theme_map'] + instrument_loads)
+    
+    # 7. 검증 및 리포트
+    def validate(_):
+        from validation_report import main as validation_main
+        return validation_main()
+    graph.add('validation_report', validate, ['publish'])
+    
+    return graph
+
+def print_stage_metrics(run_name, limit=5):
+    """단계별 성능 지표 저장 후 소요 시간 상위 단계 출력"""
+    from metrics import export_metrics, format_summary, format_memory_summary
+    
+    json_path, prom_path = export_metrics(run_name)
+    for line in format_summary(limit=limit):
+        print(f"   ⏱ {line}")
+    for line in format_memory_summary(limit=3):
+        print(f"   🧠 {line}")
+    if json_path:
+        print(f"📈 단계별 지표: {json_path}")
+
+def run_pipeline(resume=False, download=False, workers=4):
+    """작업 그래프로 전체 프로세스 실행"""
+    import pandas as pd
+    from artifact_registry import reset_registry
+    from config import FILE_SETS_CSV, PIPELINE_CHECKPOINT_FILE
+    from metrics import reset_metrics
+    
+    reset_registry()
+    reset_metrics()
+    file_mapping = pd.read_csv(FILE_SETS_CSV, encoding='utf-8')
+    graph = build_pipeline(file_mapping, download=download)
+    result = graph.run(max_workers=workers, checkpoint_path=PIPELINE_CHECKPOINT_FILE, resume=resume)
+    
+    print(f"⏱️  실행 시간: {result['elapsed_sec']:.2f}초 (작업 합계 {result['total_task_sec']:.2f}초, "
+          f"임계 경로 {result['critical_path_sec']:.2f}초)")
+    print(f"🧭 임계 경로: {' → '.join(result['critical_path'])}")
+    if result['resumed']:
+        print(f"↻ 체크포인트로 생략: {len(result['resumed'])}개 노드")
+    print_stage_metrics('pipeline')
+    if not result['success']:
+        print(f"❌ 실패: {', '.join(result['failed'])} / 생략: {', '.join(result['skipped'])}")
+        print("   --resume 옵션으로 실패한 지점부터 다시 실행할 수 있습니다.")
+    return result['success']
+
 def main():
     """전체 프로세스 실행"""
     
@@ -63,6 +223,7 @@ def main():
         
         print("🎉 KIS 데이터 처리 완료!")
         print(f"⏱️  총 소요시간: {elapsed}")
+        print_stage_metrics('process')
         print()
         
         # 생성된 리포트 파일 목록
@@ -78,5 +239,17 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='KIS 데이터 전체 프로세스 실행')
+    parser.add_argument('--dag', action='store_true', help='작업 그래프로 동시 실행')
+    parser.add_argument('--resume', action='store_true', help='체크포인트에서 재개 (--dag)')
+    parser.add_argument('--download', action='store_true', help='마스터 파일 다운로드부터 실행 (--dag)')
+    parser.add_argument('--workers', type=int, default=4, help='동시 실행 작업 수 (--dag)')
+    args = parser.parse_args()
+    
+    if args.dag:
+        success = run_pipeline(resume=args.resume, download=args.download, workers=args.workers)
+    else:
+        success = main()
     sys.exit(0 if success else 1)
@@ -1,12 +1,14 @@
 import logging
-import pandas as pd
 import os
-from config import FILE_SETS_CSV
-from db_utils import truncate_tables
-from loaders.member_loader import MemberLoader
-from loaders.instrument_loader import InstrumentLoader
-from parsers.domestic_stock_parser import DomesticStockParser
-from parsers.member_parser import MemberParser
+import time
+from config import (
+    BOND_ITEM, DERIVATIVE_ITEMS, FILE_SETS_CSV, OVERSEAS_ITEMS, RELOAD_ITEMS, SECTOR_MASTER_FILE, SECTOR_HEADER_FILE, THEME_MASTER_FILE, THEME_HEADER_FILE
+)
+from artifact_registry import reset_registry
+from metrics import stage_timer, reset_metrics, export_metrics, format_summary, format_memory_summary
+from download_manifest import DownloadManifest
+
+# pandas/DB/로더 모듈은 재적재를 실행할 때만 import (CLI 등 빠른 시작용)
 
 # 로깅 설정
 logging.basicConfig(
@@ -22,40 +24,135 @@ console.setFormatter(formatter)
 logging.getLogger('').addHandler(console)
 logger = logging.getLogger('reload_main')
 
-def main():
-    """KIS 종목정보 재적재 실행"""
+MARKET_ITEMS = ['코스피', '코스닥', '코넥스', 'ELW'] + DERIVATIVE_ITEMS + [BOND_ITEM] + OVERSEAS_ITEMS
+
+def reload_master_files(file_mapping):
+    """재적재에 사용하는 마스터 파일명 목록"""
+    rows = file_mapping[file_mapping['항목명'].isin(RELOAD_ITEMS)]
+    return sorted(set(rows['종목다운로드'].dropna()) | {SECTOR_MASTER_FILE, THEME_MASTER_FILE})
+
+def master_file_items(file_mapping):
+    """마스터/헤더 파일명 -> 재적재 항목명 (회원사코드/시장/업종코드/테마코드)"""
+    items = {SECTOR_MASTER_FILE: '업종코드', THEME_MASTER_FILE: '테마코드'}
+    rows = file_mapping[file_mapping['항목명'].isin(RELOAD_ITEMS)]
+    for _, row in rows.iterrows():
+        for column in ['종목다운로드', '헤더정보']:
+            if isinstance(row[column], str) and row[column]:
+                items[row[column]] = row['항목명']
+    return items
+
+def create_sector_parser():
+    from parsers.sector_parser import SectorParser
+    return SectorParser(
+        master_file=SECTOR_MASTER_FILE,
+        header_file=SECTOR_HEADER_FILE
+    )
+
+def create_theme_parser():
+    from parsers.theme_parser import ThemeParser
+    return ThemeParser(
+        master_file=THEME_MASTER_FILE,
+        header_file=THEME_HEADER_FILE
+    )
+
+def validate_frames(member_loader, instrument_loader, sector_parser, theme_parser, items=None):
+    """파싱된 DataFrame 적재 전 검증 (치명적 오류가 없으면 True)
+    
+    items 를 지정하면(부분 재적재) 해당 항목과 그 항목이 참조하는 업종/테마 프레임만 파싱하여 검증합니다.
+    """
+    from validation.frame_validator import FrameValidator
+    
+    logger.info("적재 전 데이터 검증 시작" + (f": {sorted(items)}" if items is not None else ""))
+    started = time.perf_counter()
+    
+    validator = FrameValidator()
+    if items is None:
+        frames = instrument_loader.parse_all()
+        stream_items = [BOND_ITEM] if instrument_loader.has_item(BOND_ITEM) else []
+        member_data = member_loader.get_parser().get_data()
+        sector_data = sector_parser.get_data()
+        theme_data = theme_parser.get_data()
+    else:
+        markets = [market for market in MARKET_ITEMS if market in items]
+        frames = instrument_loader.parse_markets(markets)
+        stream_items = [BOND_ITEM] if BOND_ITEM in items else []
+        member_data = member_loader.get_parser().get_data() if '회원사코드' in items else None
+        sector_data = sector_parser.get_data() if markets or '업종코드' in items else None
+        theme_data = theme_parser.get_data() if markets or '테마코드' in items else None
+    with stage_timer('validate', name='frame_validator') as stage:
+        if frames:
+            validator.validate_instruments(frames)
+        # 채권은 전체 DataFrame 을 만들지 않고 청크 단위로 검증 (테이블 초기화 전)
+        streamed_rows = sum(
+            validator.validate_instrument_chunks(item, instrument_loader.iter_chunks(item)) for item in stream_items
+        )
+        validator.validate_reference(member_data=member_data, sector_data=sector_data, theme_data=theme_data)
+        stage.rows = sum(len(frame) for frame in frames.values()) + streamed_rows
+    summary = validator.summary()
+    
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        f"적재 전 데이터 검증 완료 ({elapsed_ms:.1f}ms): {summary['passed_checks']}/{summary['total_checks']} 통과, "
+        f"치명적 오류 {summary['critical_failures']}개, 경고 {summary['warnings']}개"
+    )
+    return summary['result']
+
+def main(force=False):
+    """KIS 종목정보 재적재 실행 (force=False 이면 적재 이후 변경된 파일이 없을 때 생략)"""
+    import pandas as pd
+    from db_utils import truncate_tables
+    from loaders.member_loader import MemberLoader
+    from loaders.instrument_loader import InstrumentLoader
+    
     try:
         logger.info("\n" + "="*60)
         logger.info("KIS 종목정보 데이터 재적재 시작")
         logger.info("="*60)
         
+        # 새 실행: 마스터 파일은 이번 실행에서 한 번만 읽어 파서/검증기가 공유
+        reset_registry()
+        reset_metrics()
+        
         # 1. 파일 매핑 정보 로드
         file_mapping = pd.read_csv(FILE_SETS_CSV, encoding='utf-8')
         logger.info(f"파일 매핑 정보 로드 완료: {len(file_mapping)}개 항목")
         
-        # 2. 테이블 초기화
+        # 다운로드 매니페스트 기준으로 마지막 적재 이후 변경 여부 확인
+        manifest = DownloadManifest()
+        master_files = reload_master_files(file_mapping)
+        changed_files = [name for name in master_files if not manifest.is_loaded(name)]
+        if not force and not changed_files:
+            logger.info(f"마지막 적재 이후 변경된 마스터 파일이 없어 재적재를 생략합니다 ({len(master_files)}개 파일)")
+            return True
+        logger.info(f"변경된 마스터 파일: {len(changed_files)}/{len(master_files)}개 {changed_files}")
+        
+        # 2. 파싱 및 적재 전 검증 (DB 접근 없음, 실패 시 테이블 초기화하지 않음)
+        member_loader = MemberLoader(file_mapping)
+        instrument_loader = InstrumentLoader(file_mapping)
+        sector_parser = create_sector_parser()
+        theme_parser = create_theme_parser()
+        
+        if not validate_frames(member_loader, instrument_loader, sector_parser, theme_parser):
+            logger.error("적재 전 검증 실패: 테이블을 초기화하지 않고 재적재를 중단합니다.")
+            return False
+        
+        # 3. 테이블 초기화
         logger.info("모든 테이블 초기화 시작")
         if not truncate_tables():
             logger.error("테이블 초기화 실패")
             return False
         logger.info("모든 테이블 초기화 완료")
         
-        # 3. 참조 테이블 적재
+        # 4. 참조 테이블 적재
         logger.info("참조 테이블 적재 시작")
         # 회원사 코드 적재
-        member_loader = MemberLoader(file_mapping)
         member_result = member_loader.load_all()
         logger.info(f"회원사 코드 적재 {'성공' if member_result else '실패'}")
         
         # 업종코드 적재
         try:
-            from parsers.sector_parser import SectorParser
             from loaders.sector_loader import SectorLoader
             
-            sector_parser = SectorParser(
-                master_file='업종코드_마스터_idxcode.mst.zip',
-                header_file='업종코드_헤더_업종코드정보.h'
-            )
             sector_loader = SectorLoader()
             sector_count = sector_loader.load_data(sector_parser)
             sector_result = sector_count > 0
@@ -63,16 +160,12 @@ def main():
         except Exception as e:
             logger.error(f"업종코드 적재 오류: {e}")
             sector_result = False
+            sector_loader = None
         
         # 테마코드 적재
         try:
-            from parsers.theme_parser import ThemeParser
             from loaders.theme_loader import ThemeLoader
             
-            theme_parser = ThemeParser(
-                master_file='테마코드_마스터_theme_code.mst.zip',
-                header_file='테마코드_헤더_테마코드정보.h'
-            )
             theme_loader = ThemeLoader()
             theme_count = theme_loader.load_data(theme_parser)
             theme_result = theme_count > 0
@@ -80,15 +173,39 @@ def main():
         except Exception as e:
             logger.error(f"테마코드 적재 오류: {e}")
             theme_result = False
+            theme_loader = None
         
-        # 4. 종목 테이블 적재
+        # 5. 종목 테이블 적재 (검증 단계의 파싱 결과 재사용)
         logger.info("종목 테이블 적재 시작")
-        instrument_loader = InstrumentLoader(file_mapping)
         instrument_result = instrument_loader.load_all()
         logger.info(f"종목 테이블 적재 {'성공' if instrument_result else '실패'}")
         
-        # 5. 결과 요약
+        # 6. 업종 계층 및 종목-테마 매핑 적재 (종목/참조 테이블 적재 이후)
+        if sector_result and instrument_result:
+            sector_loader.build_hierarchy()
+        
+        if theme_result and instrument_result:
+            theme_map_count = theme_loader.load_theme_map(theme_parser)
+            logger.info(f"종목-테마 매핑 적재 {'성공' if theme_map_count > 0 else '실패'}: {theme_map_count}개")
+        
+        # 7. 결과 요약
         overall_success = member_result and instrument_result
+        
+        # 검색 인덱스/캐시 무효화를 위한 세대 번호 갱신
+        if overall_success:
+            from search.generation import bump_generation
+            bump_generation()
+            
+            manifest.mark_loaded(master_files)
+            manifest.save()
+        
+        # 단계별 성능 지표 (JSON + Prometheus textfile)
+        export_metrics('reload')
+        for line in format_summary(limit=10):
+            logger.info(f"  ⏱ {line}")
+        for line in format_memory_summary():
+            logger.info(f"  🧠 {line}")
+        
         logger.info("\n" + "="*60)
         logger.info(f"KIS 종목정보 데이터 재적재 {'성공' if overall_success else '일부 실패'}")
         logger.info("="*60)
@@ -98,6 +215,101 @@ def main():
         logger.error(f"데이터 재적재 중 오류 발생: {e}", exc_info=True)
         return False
 
+def reload_sets(items, file_mapping=None):
+    """변경된 항목만 부분 재적재 (전체 Truncate 없음)
+
+    items 는 '회원사코드', '업종코드', '테마코드' 또는 시장 항목명('코스피' 등)입니다.
+    시장은 해당 market_type 행 삭제와 재적재를 한 트랜잭션으로 실행하고(실패 시 기존 행 유지),
+    종목/테마가 바뀌면 종목-테마 매핑과 업종 계층을 다시 구성합니다.
+    적재 전 검증은 재적재 항목과 그 항목이 참조하는 프레임만 파싱하여 수행합니다.
+    """
+    import pandas as pd
+    from db_utils import clear_table
+    from loaders.member_loader import MemberLoader
+    from loaders.instrument_loader import InstrumentLoader
+    
+    items = set(items)
+    markets = [market for market in MARKET_ITEMS if market in items]
+    try:
+        logger.info(f"부분 재적재 시작: {sorted(items)}")
+        started = time.perf_counter()
+        reset_registry()
+        reset_metrics()
+        
+        if file_mapping is None:
+            file_mapping = pd.read_csv(FILE_SETS_CSV, encoding='utf-8')
+        
+        member_loader = MemberLoader(file_mapping)
+        instrument_loader = InstrumentLoader(file_mapping)
+        sector_parser = create_sector_parser()
+        theme_parser = create_theme_parser()
+        
+        if not validate_frames(member_loader, instrument_loader, sector_parser, theme_parser, items):
+            logger.error("적재 전 검증 실패: 부분 재적재를 중단합니다.")
+            return False
+        
+        results = {}
+        if '회원사코드' in items:
+            clear_table('member_code')
+            results['회원사코드'] = member_loader.load_all()
+        
+        if '업종코드' in items:
+            from loaders.sector_loader import SectorLoader
+            clear_table('sector_code')
+            results['업종코드'] = SectorLoader().load_data(sector_parser) > 0
+        
+        if '테마코드' in items:
+            from loaders.theme_loader import ThemeLoader
+            # 종목-테마 매핑은 ON DELETE CASCADE 로 함께 삭제됨
+            clear_table('theme_code')
+            results['테마코드'] = ThemeLoader().load_data(theme_parser) > 0
+        
+        for market in markets:
+            results[market] = instrument_loader.replace_market(market) > 0
+        
+        # 종목/업종이 바뀌면 업종 계층, 종목/테마가 바뀌면 종목-테마 매핑 재구성
+        if markets or '업종코드' in items:
+            from loaders.sector_loader import SectorLoader
+            results['업종계층'] = SectorLoader().build_hierarchy() is not None
+        
+        if markets or '테마코드' in items:
+            from loaders.theme_loader import ThemeLoader
+            results['종목-테마 매핑'] = ThemeLoader().load_theme_map(theme_parser) > 0
+        
+        success = all(results.values())
+        if success:
+            from search.generation import bump_generation
+            bump_generation()
+            
+            file_items = master_file_items(file_mapping)
+            manifest = DownloadManifest()
+            manifest.mark_loaded(name for name, item in file_items.items() if item in items)
+            manifest.save()
+        
+        export_metrics('reload_sets')
+        elapsed = time.perf_counter() - started
+        failed = [name for name, ok in results.items() if not ok]
+        logger.info(f"부분 재적재 {'성공' if success else '일부 실패'} ({elapsed:.1f}초): {sorted(items)}" +
+                    (f", 실패 {failed}" if failed else ""))
+        return success
+    except Exception as e:
+        logger.error(f"부분 재적재 중 오류 발생: {e}", exc_info=True)
+        return False
+    finally:
+        # 감시 프로세스(watch_reload)에서 다음 변경까지 마스터 바이트/파싱 결과를 들고 있지 않도록 비움
+        reset_registry()
+
 if __name__ == "__main__":
-    success = main()
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description='KIS 종목정보 재적재')
+    arg_parser.add_argument('--force', action='store_true', help='변경된 파일이 없어도 재적재')
+    arg_parser.add_argument('--trace-memory', action='store_true', help='단계별 메모리 최대치/상위 할당 위치 기록 (KIS_TRACE_MEMORY)')
+    args = arg_parser.parse_args()
+    
+    if args.trace_memory:
+        from metrics import get_recorder
+        get_recorder().enable_memory_tracing()
+    
+    success = main(force=args.force)
     exit(0 if success else 1)
@@ -0,0 +1 @@
+# KIS 종목정보 검색 모듈
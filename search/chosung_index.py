@@ -0,0 +1,95 @@
+import bisect
+import logging
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_utils import to_chosung, build_chosung_keys
+
+logger = logging.getLogger('chosung_index')
+
+class ChosungIndex:
+    """초성 접두어 검색 인덱스 (정렬 배열 + 이진 탐색)"""
+    
+    def __init__(self):
+        self._keys = []   # 정렬된 초성 키
+        self._codes = []  # 키에 대응하는 종목코드
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def build(self, records):
+        """(종목코드, 초성키 문자열) 목록으로 인덱스 생성"""
+        entries = set()
+        for instrument_code, chosung_names in records:
+            if not instrument_code or not chosung_names:
+                continue
+            for key in chosung_names.split(','):
+                if key:
+                    entries.add((key, instrument_code))
+        
+        entries = sorted(entries)
+        self._keys = [entry[0] for entry in entries]
+        self._codes = [entry[1] for entry in entries]
+        logger.info(f"초성 인덱스 생성 완료: {len(self._keys):,}개 키")
+        return self
+    
+    @classmethod
+    def from_dataframe(cls, df):
+        """파서 결과 DataFrame으로 인덱스 생성"""
+        if df is None or df.empty:
+            return cls()
+        
+        if 'chosung_names' in df.columns:
+            keys = df['chosung_names']
+        else:
+            keys = df.apply(
+                lambda row: build_chosung_keys([row['instrument_name']] + str(row.get('alias_names') or '').split(',')),
+                axis=1
+            )
+        return cls().build(zip(df['instrument_code'], keys))
+    
+    @classmethod
+    def from_db(cls):
+        """instruments 테이블로 인덱스 생성"""
+        from db_utils import get_connection
+        
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT instrument_code, instrument_name, alias_names, chosung_names
+                    FROM instruments
+                """)
+                rows = cursor.fetchall()
+        finally:
+            conn.close()
+        
+        records = []
+        for instrument_code, name, aliases, chosung_names in rows:
+            # 초성 컬럼이 비어있는 과거 데이터는 즉석에서 계산
+            if not chosung_names:
+                chosung_names = build_chosung_keys([name] + (aliases or '').split(','))
+            records.append((instrument_code, chosung_names))
+        return cls().build(records)
+    
+    def search(self, query, limit=20):
+        """초성 접두어 검색 (예: 'ㅅㅅㅈ' -> 삼성전자, 삼성전기 ...)"""
+        prefix = to_chosung(query)
+        if not prefix:
+            return []
+        
+        results = []
+        seen = set()
+        i = bisect.bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            code = self._codes[i]
+            if code not in seen:
+                seen.add(code)
+                results.append(code)
+                if limit and len(results) >= limit:
+                    break
+            i += 1
+        return results
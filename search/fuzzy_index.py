@@ -0,0 +1,172 @@
+import logging
+import threading
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search.generation import current_generation
+
+logger = logging.getLogger('fuzzy_index')
+
+def normalize_name(name):
+    """비교용 종목명 정규화 (공백 제거, 대문자)"""
+    return ''.join(str(name).split()).upper() if name else ''
+
+def edit_distance(a, b, max_distance=None):
+    """레벤슈타인 편집거리 (max_distance 초과가 확정되면 max_distance + 1 반환)"""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,                # 삭제
+                current[j - 1] + 1,             # 삽입
+                previous[j - 1] + (ca != cb)    # 치환
+            ))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+def _deletes(term, max_distance):
+    """term에서 최대 max_distance개 문자를 삭제한 변형 집합 (SymSpell 방식)"""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for word in frontier:
+            if len(word) <= 1:
+                continue
+            for i in range(len(word)):
+                next_frontier.add(word[:i] + word[i + 1:])
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+class DeletionIndex:
+    """삭제 변형 기반 편집거리 후보 인덱스 (SymSpell 방식)"""
+
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self.deletes = {}  # 삭제 변형 -> 원래 term 목록
+        self.size = 0
+
+    def add(self, term):
+        self.size += 1
+        for variant in _deletes(term, self.max_distance):
+            self.deletes.setdefault(variant, []).append(term)
+
+    def find(self, term, max_distance):
+        """max_distance 이내의 (거리, term) 목록 반환"""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in _deletes(term, max_distance):
+            candidates.update(self.deletes.get(variant, ()))
+
+        results = []
+        for candidate in candidates:
+            distance = edit_distance(term, candidate, max_distance)
+            if distance <= max_distance:
+                results.append((distance, candidate))
+        return results
+
+class FuzzyNameIndex:
+    """오타 허용 종목명 검색 인덱스 (instrument_name, alias_names 대상)"""
+
+    def __init__(self, generation=None, max_distance=2):
+        self.generation = generation
+        self.deletion_index = DeletionIndex(max_distance)
+        self.term_map = {}  # 정규화된 이름 -> {종목코드: 원래 종목명}
+
+    def build(self, records):
+        """(종목코드, 종목명, 별칭문자열) 목록으로 인덱스 생성"""
+        for instrument_code, name, aliases in records:
+            if not instrument_code or not name:
+                continue
+            names = [name] + [alias for alias in str(aliases or '').split(',') if alias]
+            for term_source in names:
+                term = normalize_name(term_source)
+                # 숫자 코드 별칭은 퍼지 매칭 대상에서 제외
+                if not term or term.isdigit():
+                    continue
+                if term not in self.term_map:
+                    self.term_map[term] = {}
+                    self.deletion_index.add(term)
+                self.term_map[term].setdefault(instrument_code, name)
+
+        logger.info(f"퍼지 이름 인덱스 생성 완료: {self.deletion_index.size:,}개 이름 (세대: {self.generation})")
+        return self
+
+    @classmethod
+    def from_dataframe(cls, df, generation=None):
+        """파서 결과 DataFrame으로 인덱스 생성"""
+        index = cls(generation)
+        if df is None or df.empty:
+            return index
+        aliases = df['alias_names'] if 'alias_names' in df.columns else [None] * len(df)
+        return index.build(zip(df['instrument_code'], df['instrument_name'], aliases))
+
+    @classmethod
+    def from_db(cls, generation=None):
+        """instruments 테이블로 인덱스 생성"""
+        from db_utils import get_connection
+
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT instrument_code, instrument_name, alias_names FROM instruments")
+                rows = cursor.fetchall()
+        finally:
+            conn.close()
+        return cls(generation).build(rows)
+
+    def search(self, query, max_distance=2, top_k=5):
+        """편집거리 max_distance 이내 상위 top_k 후보 반환"""
+        term = normalize_name(query)
+        if not term:
+            return []
+
+        candidates = []
+        for distance, matched in self.deletion_index.find(term, max_distance):
+            for instrument_code, name in self.term_map[matched].items():
+                candidates.append({
+                    'instrument_code': instrument_code,
+                    'instrument_name': name,
+                    'matched_name': matched,
+                    'distance': distance
+                })
+
+        # 거리 -> 종목명 순 정렬 후 종목코드 기준 중복 제거
+        candidates.sort(key=lambda c: (c['distance'], c['instrument_name'], c['instrument_code']))
+        results = []
+        seen = set()
+        for candidate in candidates:
+            if candidate['instrument_code'] in seen:
+                continue
+            seen.add(candidate['instrument_code'])
+            results.append(candidate)
+            if len(results) >= top_k:
+                break
+        return results
+
+_index_lock = threading.Lock()
+_cached_index = None
+
+def get_fuzzy_index():
+    """재적재 세대별로 한 번만 생성되는 퍼지 인덱스 반환"""
+    global _cached_index
+    generation = current_generation()
+    with _index_lock:
+        if _cached_index is None or _cached_index.generation != generation:
+            _cached_index = FuzzyNameIndex.from_db(generation)
+        return _cached_index
@@ -0,0 +1,29 @@
+import os
+import logging
+import sys
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GENERATION_FILE
+
+logger = logging.getLogger('generation')
+
+def current_generation():
+    """현재 재적재 세대 번호 반환 (재적재 이력이 없으면 0)"""
+    try:
+        with open(GENERATION_FILE, 'r', encoding='utf-8') as f:
+            return int(f.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+def bump_generation():
+    """재적재 완료 후 세대 번호 증가"""
+    generation = current_generation() + 1
+    os.makedirs(os.path.dirname(GENERATION_FILE), exist_ok=True)
+    tmp_file = GENERATION_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(str(generation))
+    os.replace(tmp_file, GENERATION_FILE)
+    logger.info(f"재적재 세대 번호 갱신: {generation}")
+    return generation
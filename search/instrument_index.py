@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import sys
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SNAPSHOT_FILE
+from hangul_utils import build_chosung_keys, has_chosung
+from search.chosung_index import ChosungIndex
+from search.generation import current_generation
+
+logger = logging.getLogger('instrument_index')
+
+# 인덱스/스냅샷에 포함하는 컬럼
+INDEX_COLUMNS = [
+    'instrument_code', 'short_code', 'instrument_name', 'instrument_name_eng',
+    'instrument_type', 'market_type', 'alias_names', 'chosung_names',
+    'industry_code', 'listing_date'
+]
+
+class InstrumentIndex:
+    """종목 조회/검색용 인메모리 인덱스 (instruments 테이블 또는 스냅샷 기반)"""
+
+    def __init__(self, records, generation=None):
+        self.generation = generation if generation is not None else current_generation()
+        self.records = []
+        self.by_code = {}   # 종목코드/단축코드 -> 레코드
+        self._haystacks = []  # 검색용 정규화 문자열 (종목명 + 별칭)
+
+        normalized = []
+        for record in records:
+            record = {col: record.get(col) for col in INDEX_COLUMNS}
+            if not record['instrument_code']:
+                continue
+            if not record['chosung_names']:
+                record['chosung_names'] = build_chosung_keys(
+                    [record['instrument_name']] + (record['alias_names'] or '').split(',')
+                )
+            normalized.append(record)
+
+        # 검색 결과 정렬 기준(시장구분, 종목명)으로 미리 정렬
+        normalized.sort(key=lambda r: (r['market_type'] or '', r['instrument_name'] or ''))
+        for record in normalized:
+            self.records.append(record)
+            self.by_code[record['instrument_code']] = record
+            if record['short_code']:
+                self.by_code.setdefault(record['short_code'], record)
+            self._haystacks.append(
+                ' '.join(filter(None, [record['instrument_name'], record['alias_names']])).upper()
+            )
+
+        self.chosung_index = ChosungIndex().build(
+            (r['instrument_code'], r['chosung_names']) for r in self.records
+        )
+        logger.info(f"종목 인덱스 생성 완료: {len(self.records):,}개 종목 (세대: {self.generation})")
+
+    def __len__(self):
+        return len(self.records)
+
+    @classmethod
+    def from_db(cls):
+        """instruments 테이블로 인덱스 생성"""
+        from db_utils import get_connection
+
+        generation = current_generation()
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT {', '.join(INDEX_COLUMNS)} FROM instruments")
+                rows = cursor.fetchall()
+        finally:
+            conn.close()
+
+        records = [dict(zip(INDEX_COLUMNS, row)) for row in rows]
+        for record in records:
+            if record['listing_date'] is not None:
+                record['listing_date'] = str(record['listing_date'])
+        return cls(records, generation)
+
+    @classmethod
+    def from_files(cls, file_mapping=None):
+        """kis_download 마스터 파일을 직접 파싱하여 인덱스 생성 (DB 불필요)"""
+        import pandas as pd
+        from config import FILE_SETS_CSV
+        from parsers.domestic_stock_parser import DomesticStockParser
+        from parsers.elw_parser import ELWParser
+
+        if file_mapping is None:
+            file_mapping = pd.read_csv(FILE_SETS_CSV, encoding='utf-8')
+
+        records = []
+        for market, parser_class in [('코스피', DomesticStockParser), ('코스닥', DomesticStockParser),
+                                     ('코넥스', DomesticStockParser), ('ELW', ELWParser)]:
+            rows = file_mapping[file_mapping['항목명'] == market]
+            if rows.empty:
+                logger.warning(f"{market} 파일 매핑 정보가 없습니다.")
+                continue
+            row = rows.iloc[0]
+            data = parser_class(row['종목다운로드'], row['헤더정보'], market).get_data()
+            if data.empty:
+                continue
+            data = data.reindex(columns=INDEX_COLUMNS)
+            data = data.astype(object).where(data.notna(), None)
+            for record in data.to_dict('records'):
+                if record['listing_date'] is not None:
+                    record['listing_date'] = str(record['listing_date'])
+                records.append(record)
+        return cls(records)
+
+    @classmethod
+    def from_snapshot(cls, path=SNAPSHOT_FILE):
+        """JSON 스냅샷 파일로 인덱스 생성"""
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        logger.info(f"스냅샷 로드: {path}")
+        return cls(snapshot['records'], snapshot.get('generation', 0))
+
+    def save_snapshot(self, path=SNAPSHOT_FILE):
+        """현재 인덱스를 JSON 스냅샷으로 저장"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'generation': self.generation, 'records': self.records}, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+        logger.info(f"스냅샷 저장: {path} ({len(self.records):,}개 종목)")
+
+    def lookup(self, code):
+        """종목코드 또는 단축코드로 조회"""
+        code = str(code).strip()
+        return self.by_code.get(code) or self.by_code.get(code.upper())
+
+    def lookup_many(self, codes):
+        """여러 종목코드 일괄 조회 -> {코드: 레코드 또는 None}"""
+        return {code: self.lookup(code) for code in codes}
+
+    def search(self, query, market_type=None, instrument_type=None, limit=20):
+        """종목명/별칭 검색 (초성 질의는 초성 인덱스, 그 외는 부분 일치)"""
+        query = ' '.join(str(query or '').split())
+        if not query:
+            return []
+
+        if has_chosung(query):
+            candidates = [self.by_code[code] for code in self.chosung_index.search(query, limit=0)]
+        else:
+            needle = query.upper()
+            prefix_matches = []
+            other_matches = []
+            for record, haystack in zip(self.records, self._haystacks):
+                if needle not in haystack:
+                    continue
+                name = (record['instrument_name'] or '').upper()
+                (prefix_matches if name.startswith(needle) else other_matches).append(record)
+            candidates = prefix_matches + other_matches
+
+        results = []
+        for record in candidates:
+            if market_type and record['market_type'] != market_type:
+                continue
+            if instrument_type and record['instrument_type'] != instrument_type:
+                continue
+            results.append(record)
+            if limit and len(results) >= limit:
+                break
+        return results
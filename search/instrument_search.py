@@ -0,0 +1,62 @@
+import logging
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_utils import get_connection
+from search.result_cache import SearchResultCache, make_cache_key, normalize_query
+
+logger = logging.getLogger('instrument_search')
+
+class InstrumentSearcher:
+    """종목명/별칭 검색기 (결과 캐시 사용)"""
+    
+    def __init__(self, cache=None, connection_factory=None):
+        self.cache = cache if cache is not None else SearchResultCache()
+        self.get_connection = connection_factory or get_connection
+    
+    def search(self, query, market_type=None, instrument_type=None, limit=100):
+        """종목명/별칭 부분 일치 검색 -> [(종목코드, 종목명, 시장구분), ...]
+        
+        캐시 키와 DB 검색에 같은 정규화 검색어를 사용하므로 공백/대소문자만 다른 검색어는 같은 결과를 받습니다
+        (utf8mb4 기본 콜레이션의 LIKE 는 대소문자를 구분하지 않음).
+        """
+        query = normalize_query(query)
+        key = make_cache_key(query, market_type=market_type, instrument_type=instrument_type, limit=limit)
+        return self.cache.get_or_compute(
+            key, lambda: self._search_db(query, market_type, instrument_type, limit)
+        )
+    
+    def _search_db(self, query, market_type, instrument_type, limit):
+        """DB 검색 실행"""
+        conditions = ["(instrument_name LIKE %s OR alias_names LIKE %s)"]
+        params = [f'%{query}%', f'%{query}%']
+        if market_type:
+            conditions.append("market_type = %s")
+            params.append(market_type)
+        if instrument_type:
+            conditions.append("instrument_type = %s")
+            params.append(instrument_type)
+        params.extend([f'{query}%', limit])
+        
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT instrument_code, instrument_name, market_type
+                    FROM instruments
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY 
+                        CASE WHEN instrument_name LIKE %s THEN 1 ELSE 2 END,
+                        market_type,
+                        instrument_name
+                    LIMIT %s
+                """, params)
+                return tuple(cursor.fetchall())
+        finally:
+            conn.close()
+    
+    def cache_stats(self):
+        return self.cache.stats()
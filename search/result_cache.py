@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SEARCH_CACHE_SIZE
+from search.generation import current_generation
+
+logger = logging.getLogger('result_cache')
+
+def normalize_query(query):
+    """검색어 정규화 (연속 공백 축약 + 대문자), 캐시 키와 실제 검색에 같은 값을 사용"""
+    return ' '.join(str(query or '').split()).upper()
+
+def make_cache_key(query, **filters):
+    """정규화된 검색어 + 필터로 캐시 키 생성"""
+    normalized = normalize_query(query)
+    return (normalized, tuple(sorted((k, v) for k, v in filters.items() if v is not None)))
+
+class SearchResultCache:
+    """재적재 세대 기반으로 무효화되는 LRU 검색 결과 캐시"""
+    
+    def __init__(self, maxsize=SEARCH_CACHE_SIZE, ttl_seconds=None, generation_provider=current_generation):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds  # 선택적 안전장치 (기본은 세대 번호로만 무효화)
+        self.generation_provider = generation_provider
+        self._entries = OrderedDict()  # key -> (generation, 저장시각, 결과)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def get(self, key, generation=None):
+        """캐시 조회 (세대가 다르거나 만료된 항목은 제거 후 None 반환)"""
+        if generation is None:
+            generation = self.generation_provider()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            entry_generation, stored_at, value = entry
+            expired = self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds
+            if entry_generation != generation or expired:
+                del self._entries[key]
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value, generation=None):
+        """캐시 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        if generation is None:
+            generation = self.generation_provider()
+        
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def get_or_compute(self, key, compute):
+        """캐시에 없으면 compute()로 계산 후 저장"""
+        generation = self.generation_provider()
+        value = self.get(key, generation)
+        if value is None:
+            value = compute()
+            self.put(key, value, generation)
+        return value
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """적중/미스/제거 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0.0
+            }
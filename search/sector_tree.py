@@ -0,0 +1,169 @@
+import bisect
+import logging
+from collections import Counter
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger('sector_tree')
+
+SECTOR_TYPES = {1: '대', 2: '중', 3: '소'}
+
+def derive_sector_parents(industry_rows):
+    """종목별 (대, 중, 소) 업종 분류에서 업종 -> 상위업종 관계 도출 (다수결)"""
+    votes = {}
+    for large, medium, small in industry_rows:
+        chain = [code for code in (large, medium, small) if code]
+        for parent, child in zip(chain, chain[1:]):
+            if parent != child:
+                votes.setdefault(child, Counter())[parent] += 1
+
+    parents = {}
+    for child, counter in votes.items():
+        parent, _ = counter.most_common(1)[0]
+        if len(counter) > 1:
+            logger.warning(f"업종 {child}의 상위업종이 여러 개입니다: {dict(counter)} -> {parent} 사용")
+        parents[child] = parent
+    return parents
+
+class SectorTree:
+    """업종 계층 트리 (중첩집합 구간으로 하위 업종/종목 범위 조회)
+
+    하위 업종 전체 = tree_left 가 [left, right] 구간에 속하는 업종이므로 DB에서도
+    sector_code.tree_left BETWEEN :left AND :right 한 번의 범위 조회로 처리됩니다.
+    """
+
+    def __init__(self, sector_codes, parents):
+        self.parents = {}
+        self.children = {}
+        self.intervals = {}  # 업종코드 -> (left, right, depth)
+
+        sector_codes = set(sector_codes) | set(parents) | set(parents.values())
+        for code in sector_codes:
+            parent = parents.get(code)
+            if parent and parent in sector_codes:
+                self.parents[code] = parent
+                self.children.setdefault(parent, []).append(code)
+        for child_list in self.children.values():
+            child_list.sort()
+
+        self.roots = sorted(code for code in sector_codes if code not in self.parents)
+        self._number_nodes(sector_codes)
+
+        # 구간 시작 위치 기준 정렬 배열 (범위 조회용)
+        ordered = sorted(self.intervals.items(), key=lambda item: item[1][0])
+        self._left_keys = [interval[0] for _, interval in ordered]
+        self._left_codes = [code for code, _ in ordered]
+
+        self._instrument_lefts = []
+        self._instrument_codes = []
+
+    def _number_nodes(self, sector_codes):
+        """DFS로 중첩집합 구간 부여"""
+        counter = 0
+        visited = set()
+        for root in self.roots:
+            stack = [(root, 1, False)]
+            while stack:
+                code, depth, closing = stack.pop()
+                if closing:
+                    counter += 1
+                    left, _, node_depth = self.intervals[code]
+                    self.intervals[code] = (left, counter, node_depth)
+                    continue
+                if code in visited:
+                    continue
+                visited.add(code)
+                counter += 1
+                self.intervals[code] = (counter, None, depth)
+                stack.append((code, depth, True))
+                for child in reversed(self.children.get(code, [])):
+                    stack.append((child, depth + 1, False))
+
+        # 순환 참조 등으로 방문되지 않은 업종은 최상위로 취급
+        for code in sorted(sector_codes - visited):
+            logger.warning(f"업종 {code}가 순환 참조로 트리에 포함되지 않아 최상위로 처리합니다.")
+            self.parents.pop(code, None)
+            counter += 1
+            self.intervals[code] = (counter, counter + 1, 1)
+            counter += 1
+
+    @classmethod
+    def from_db(cls):
+        """sector_code / instruments 테이블로 트리 생성 (종목 포함)"""
+        from db_utils import get_connection
+
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT sector_code, parent_code FROM sector_code")
+                sector_rows = cursor.fetchall()
+                cursor.execute("""
+                    SELECT instrument_code, industry_code, industry_medium_code, industry_small_code
+                    FROM instruments
+                    WHERE industry_code IS NOT NULL AND industry_code != ''
+                """)
+                instrument_rows = cursor.fetchall()
+        finally:
+            conn.close()
+
+        parents = {code: parent for code, parent in sector_rows if parent}
+        tree = cls([code for code, _ in sector_rows], parents)
+        tree.attach_instruments(
+            (instrument_code, small or medium or large)
+            for instrument_code, large, medium, small in instrument_rows
+        )
+        return tree
+
+    def attach_instruments(self, assignments):
+        """(종목코드, 가장 세분화된 업종코드) 목록을 구간 시작 위치 순으로 정렬하여 보관"""
+        entries = []
+        for instrument_code, sector_code in assignments:
+            interval = self.intervals.get(sector_code)
+            if interval:
+                entries.append((interval[0], instrument_code))
+        entries.sort()
+        self._instrument_lefts = [left for left, _ in entries]
+        self._instrument_codes = [code for _, code in entries]
+        return self
+
+    def depth(self, sector_code):
+        interval = self.intervals.get(sector_code)
+        return interval[2] if interval else None
+
+    def sector_type(self, sector_code):
+        return SECTOR_TYPES.get(self.depth(sector_code))
+
+    def path(self, sector_code):
+        """최상위 업종부터 해당 업종까지의 경로"""
+        path = []
+        while sector_code:
+            path.append(sector_code)
+            sector_code = self.parents.get(sector_code)
+        return list(reversed(path))
+
+    def _range(self, keys, sector_code):
+        interval = self.intervals.get(sector_code)
+        if not interval:
+            return 0, 0
+        left, right, _ = interval
+        return bisect.bisect_left(keys, left), bisect.bisect_right(keys, right)
+
+    def subtree(self, sector_code):
+        """해당 업종과 모든 하위 업종 (깊이 무관)"""
+        start, end = self._range(self._left_keys, sector_code)
+        return self._left_codes[start:end]
+
+    def instruments_under(self, sector_code):
+        """해당 업종 및 모든 하위 업종에 속한 종목 (한 번의 구간 조회)"""
+        start, end = self._range(self._instrument_lefts, sector_code)
+        return self._instrument_codes[start:end]
+
+    def to_rows(self):
+        """sector_code 갱신용 (sector_type, parent_code, depth, left, right, sector_code) 목록"""
+        rows = []
+        for code, (left, right, depth) in sorted(self.intervals.items()):
+            rows.append((SECTOR_TYPES.get(depth), self.parents.get(code), depth, left, right, code))
+        return rows
@@ -0,0 +1,98 @@
+import logging
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger('theme_index')
+
+class ThemeIndex:
+    """테마 -> 종목 역색인 (종목 순번 비트맵 기반 집합 연산)"""
+
+    def __init__(self, pairs):
+        """pairs: (종목코드, 테마코드) 목록"""
+        pairs = list(pairs)
+        self.instrument_codes = sorted({instrument_code for instrument_code, _ in pairs})
+        self._ordinals = {code: i for i, code in enumerate(self.instrument_codes)}
+        self._bitmaps = {}        # 테마코드 -> 종목 비트맵 (int)
+        self._instrument_themes = {}  # 종목코드 -> 테마코드 집합
+
+        for instrument_code, theme_code in pairs:
+            bit = 1 << self._ordinals[instrument_code]
+            self._bitmaps[theme_code] = self._bitmaps.get(theme_code, 0) | bit
+            self._instrument_themes.setdefault(instrument_code, set()).add(theme_code)
+
+        logger.info(f"테마 역색인 생성 완료: {len(self._bitmaps):,}개 테마, {len(self.instrument_codes):,}개 종목")
+
+    @classmethod
+    def from_dataframe(cls, theme_map):
+        """instrument_theme_map 형식 DataFrame으로 생성"""
+        return cls(zip(theme_map['instrument_code'], theme_map['theme_code']))
+
+    @classmethod
+    def from_db(cls):
+        """instrument_theme_map 테이블로 생성"""
+        from db_utils import get_connection
+
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT instrument_code, theme_code FROM instrument_theme_map")
+                return cls(cursor.fetchall())
+        finally:
+            conn.close()
+
+    @property
+    def theme_codes(self):
+        return sorted(self._bitmaps)
+
+    def _decode(self, bitmap):
+        """비트맵 -> 종목코드 목록 (종목코드 오름차순)"""
+        codes = []
+        while bitmap:
+            low_bit = bitmap & -bitmap
+            codes.append(self.instrument_codes[low_bit.bit_length() - 1])
+            bitmap ^= low_bit
+        return codes
+
+    def instruments_in_theme(self, theme_code):
+        return self._decode(self._bitmaps.get(theme_code, 0))
+
+    def _intersect(self, theme_codes):
+        """테마 비트맵 교집합"""
+        theme_codes = list(theme_codes)
+        if not theme_codes:
+            return 0
+        bitmap = self._bitmaps.get(theme_codes[0], 0)
+        for theme_code in theme_codes[1:]:
+            if not bitmap:
+                break
+            bitmap &= self._bitmaps.get(theme_code, 0)
+        return bitmap
+
+    def instruments_in_all(self, theme_codes):
+        """모든 테마에 속한 종목 (A ∩ B ∩ ...)"""
+        return self._decode(self._intersect(theme_codes))
+
+    def instruments_in_any(self, theme_codes):
+        """하나 이상의 테마에 속한 종목 (A ∪ B ∪ ...)"""
+        bitmap = 0
+        for theme_code in theme_codes:
+            bitmap |= self._bitmaps.get(theme_code, 0)
+        return self._decode(bitmap)
+
+    def instruments_excluding(self, theme_codes, excluded_theme_codes):
+        """theme_codes 교집합에서 excluded_theme_codes 종목 제외 (A ∩ B - C)"""
+        bitmap = self._intersect(theme_codes)
+        for theme_code in excluded_theme_codes:
+            bitmap &= ~self._bitmaps.get(theme_code, 0)
+        return self._decode(bitmap)
+
+    def count_in_all(self, theme_codes):
+        """교집합 종목 수 (목록 생성 없이 계산)"""
+        return bin(self._intersect(theme_codes)).count('1')
+
+    def themes_of(self, instrument_code):
+        """종목이 속한 테마코드 목록"""
+        return sorted(self._instrument_themes.get(instrument_code, ()))
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+의존성 기반 작업 그래프 실행기
+노드(작업) 간 의존성을 따라 독립된 작업은 동시에 실행하고, 완료된 노드를
+체크포인트 파일에 기록하여 실패한 실행을 중단된 지점부터 재개합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+logger = logging.getLogger('task_graph')
+
+class TaskGraphError(Exception):
+    """그래프 정의 오류 (순환 의존성, 없는 노드 참조 등)"""
+
+class Task:
+    """작업 노드
+
+    func(results) 형태로 호출되며 results 는 의존 노드 이름 -> 결과 값입니다.
+    checkpoint=False 인 노드(파싱 등 결과가 메모리에만 있는 작업)는 기록되지 않으며,
+    재개 시 아직 실행할 하위 노드가 필요로 할 때만 다시 실행됩니다.
+    """
+
+    def __init__(self, name, func, deps=(), checkpoint=True):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.checkpoint = checkpoint
+
+class TaskGraph:
+    """작업 그래프"""
+
+    def __init__(self, name='pipeline'):
+        self.name = name
+        self.tasks = {}
+
+    def add(self, name, func, deps=(), checkpoint=True):
+        if name in self.tasks:
+            raise TaskGraphError(f"중복 노드: {name}")
+        self.tasks[name] = Task(name, func, deps, checkpoint)
+        return name
+
+    def topological_order(self):
+        """위상 정렬 (순환 의존성/없는 노드 검사)"""
+        for task in self.tasks.values():
+            missing = [dep for dep in task.deps if dep not in self.tasks]
+            if missing:
+                raise TaskGraphError(f"{task.name}: 존재하지 않는 의존 노드 {missing}")
+
+        order = []
+        state = {}  # 이름 -> 'visiting' | 'done'
+        for root in sorted(self.tasks):
+            stack = [(root, False)]
+            while stack:
+                name, expanded = stack.pop()
+                if expanded:
+                    state[name] = 'done'
+                    order.append(name)
+                    continue
+                if state.get(name) == 'done':
+                    continue
+                if state.get(name) == 'visiting':
+                    raise TaskGraphError(f"순환 의존성: {name}")
+                state[name] = 'visiting'
+                stack.append((name, True))
+                for dep in self.tasks[name].deps:
+                    if state.get(dep) != 'done':
+                        if state.get(dep) == 'visiting':
+                            raise TaskGraphError(f"순환 의존성: {name} -> {dep}")
+                        stack.append((dep, False))
+        return order
+
+    def critical_path(self, durations):
+        """노드별 소요 시간 기준 최장 경로 -> (경로, 합계 초)"""
+        best = {}
+        for name in self.topological_order():
+            deps = self.tasks[name].deps
+            prev = max(deps, key=lambda dep: best[dep][1]) if deps else None
+            base_path, base_time = best[prev] if prev else ([], 0.0)
+            best[name] = (base_path + [name], base_time + durations.get(name, 0.0))
+        if not best:
+            return [], 0.0
+        return max(best.values(), key=lambda item: item[1])
+
+    def _nodes_to_run(self, completed):
+        """재개 시 실행할 노드 (완료 체크포인트 노드 제외, 필요한 비체크포인트 노드 포함)"""
+        pending = {name for name, task in self.tasks.items() if not (task.checkpoint and name in completed)}
+        needed = set()
+        stack = [name for name in pending if self.tasks[name].checkpoint]
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            needed.add(name)
+            stack.extend(dep for dep in self.tasks[name].deps if dep in pending)
+        return needed
+
+    def run(self, max_workers=4, checkpoint_path=None, resume=False):
+        """그래프 실행 -> {'success', 'results', 'failed', 'skipped', 'durations', 'critical_path', ...}"""
+        self.topological_order()
+        checkpoint = Checkpoint(checkpoint_path, self.name) if checkpoint_path else None
+        completed = checkpoint.load() if (checkpoint and resume) else {}
+        if checkpoint and not resume:
+            checkpoint.reset()
+
+        to_run = self._nodes_to_run(completed)
+        if completed:
+            logger.info(f"체크포인트에서 재개: 완료 {len(completed)}개 노드 생략, {len(to_run)}개 노드 실행")
+
+        results = {}
+        durations = {}
+        failed = {}
+        skipped = []
+        done = {name for name in self.tasks if name not in to_run}
+        remaining = set(to_run)
+        running = {}
+        lock = threading.Lock()
+        started = time.perf_counter()
+
+        def execute(task):
+            task_start = time.perf_counter()
+            try:
+                return task.func({dep: results.get(dep) for dep in task.deps})
+            finally:
+                with lock:
+                    durations[task.name] = round(time.perf_counter() - task_start, 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.name) as executor:
+            while remaining or running:
+                # 실패한 노드에 의존하는 노드는 실행하지 않음
+                blocked = {
+                    name for name in remaining
+                    if any(dep in failed or dep in skipped for dep in self.tasks[name].deps)
+                }
+                while blocked:
+                    for name in sorted(blocked):
+                        remaining.discard(name)
+                        skipped.append(name)
+                        logger.warning(f"⤼ {name}: 의존 노드 실패로 생략")
+                    blocked = {
+                        name for name in remaining
+                        if any(dep in skipped for dep in self.tasks[name].deps)
+                    }
+
+                ready = sorted(
+                    name for name in remaining
+                    if all(dep in done for dep in self.tasks[name].deps)
+                )
+                for name in ready:
+                    remaining.discard(name)
+                    logger.info(f"▶ {name} 시작")
+                    running[executor.submit(execute, self.tasks[name])] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        if results[name] is False:
+                            raise RuntimeError("작업이 실패(False)를 반환했습니다.")
+                        done.add(name)
+                        logger.info(f"✓ {name} 완료 ({durations.get(name, 0):.2f}초)")
+                        if checkpoint and self.tasks[name].checkpoint:
+                            checkpoint.mark(name, durations.get(name))
+                    except Exception as e:
+                        failed[name] = str(e)
+                        logger.error(f"✗ {name} 실패: {e}", exc_info=True)
+
+        path, path_seconds = self.critical_path(durations)
+        success = not failed and not skipped
+        if checkpoint and success:
+            checkpoint.reset()
+
+        return {
+            'success': success,
+            'results': results,
+            'failed': failed,
+            'skipped': skipped,
+            'resumed': sorted(name for name in completed if name not in to_run),
+            'durations': durations,
+            'elapsed_sec': round(time.perf_counter() - started, 4),
+            'critical_path': path,
+            'critical_path_sec': round(path_seconds, 4),
+            'total_task_sec': round(sum(durations.values()), 4)
+        }
+
+class Checkpoint:
+    """완료 노드 기록 파일 (원자적 갱신)"""
+
+    def __init__(self, path, graph_name):
+        self.path = path
+        self.graph_name = graph_name
+        self._lock = threading.Lock()
+        self.completed = {}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"체크포인트를 읽을 수 없어 처음부터 실행합니다: {e}")
+            return {}
+        if data.get('graph') != self.graph_name:
+            return {}
+        self.completed = data.get('completed', {})
+        return dict(self.completed)
+
+    def mark(self, name, duration=None):
+        with self._lock:
+            self.completed[name] = {
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'duration': duration
+            }
+            self._write()
+
+    def reset(self):
+        with self._lock:
+            self.completed = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'graph': self.graph_name, 'completed': self.completed}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,122 @@
+import zipfile
+
+import pandas as pd
+import pytest
+
+from loaders.instrument_loader import InstrumentLoader
+from parsers.bond_parser import BOND_LAYOUT, INSTRUMENT_COLUMNS, RECORD_SIZE, BondParser
+from validation.frame_validator import FrameValidator
+
+
+def bond_record(standard_code, short_code, name):
+    """BOND_LAYOUT 오프셋대로 채운 350바이트 채권 레코드"""
+    values = {
+        'bond_type': '01',
+        'bond_class': '11',
+        'standard_code': standard_code,
+        'short_code': short_code,
+        'name': name,
+        'issuer_code': '00001',
+        'issuer_name': '국고',
+        'interest_payment_code': '1',
+        'interest_rate': '3.2500',
+        'credit_rating': 'AAA',
+        'listing_date': '20200110',
+        'issue_date': '20200110',
+        'maturity_date': '20300110',
+        'face_value': '000000000010000',
+    }
+    record = bytearray(b' ' * RECORD_SIZE)
+    for field, start, length in BOND_LAYOUT:
+        record[start:start + length] = values[field].encode('cp949')[:length].ljust(length, b' ')
+    return bytes(record)
+
+
+def write_bond_zip(tmp_path, lines):
+    path = tmp_path / 'bond_code.mst.zip'
+    with zipfile.ZipFile(path, 'w') as zip_ref:
+        zip_ref.writestr('bond_code.mst', b'\n'.join(lines) + b'\n')
+    return str(path)
+
+
+@pytest.fixture
+def blank_first_bond_file(tmp_path):
+    """빈 레코드 2건 뒤에 정상 레코드 2건이 있는 채권 마스터 ZIP"""
+    lines = [
+        b' ' * RECORD_SIZE,
+        b' ' * RECORD_SIZE,
+        bond_record('KR6000010001', '000010000', '국고채권01'),
+        bond_record('KR6000020000', '000020000', '국고채권02'),
+    ]
+    return write_bond_zip(tmp_path, lines)
+
+
+def test_blank_chunk_is_not_yielded(blank_first_bond_file):
+    parser = BondParser(blank_first_bond_file, chunk_size=2)
+
+    chunks = list(parser.iter_chunks())
+
+    assert len(chunks) == 1
+    assert chunks[0]['instrument_code'].tolist() == ['KR6000010001', 'KR6000020000']
+
+
+def test_empty_transform_keeps_instrument_columns():
+    frame = BondParser('bond_code.mst.zip').transform(pd.DataFrame())
+
+    assert frame.empty
+    assert list(frame.columns) == INSTRUMENT_COLUMNS
+
+
+def test_unique_chunks_skips_empty_chunks():
+    loader = InstrumentLoader(pd.DataFrame(columns=['항목명', '종목다운로드', '헤더정보']))
+    empty = pd.DataFrame(columns=INSTRUMENT_COLUMNS)
+    chunk = pd.DataFrame({'instrument_code': ['KR6000010001', 'KR6000010001', 'KR6000020000']})
+
+    chunks = list(loader._unique_chunks('채권코드', [empty, chunk]))
+
+    assert len(chunks) == 1
+    assert chunks[0]['instrument_code'].tolist() == ['KR6000010001', 'KR6000020000']
+
+
+def test_chunk_validation_counts_rows_after_blank_chunk(blank_first_bond_file):
+    validator = FrameValidator(verbose=False)
+
+    rows = validator.validate_instrument_chunks('채권코드', BondParser(blank_first_bond_file, chunk_size=2).iter_chunks())
+
+    assert rows == 2
+    assert all(entry['result'] for entry in validator.checks)
+
+
+def test_record_width_mismatch_fails_validation(tmp_path):
+    # 기본 레이아웃(350바이트)보다 짧은 레코드 -> 오프셋을 신뢰할 수 없으므로 검증 실패
+    path = write_bond_zip(tmp_path, [bond_record('KR6000010001', '000010000', '국고채권01')[:349]])
+    validator = FrameValidator(verbose=False)
+
+    rows = validator.validate_instrument_chunks('채권코드', BondParser(path).iter_chunks())
+
+    assert rows == 0
+    assert [entry['check'] for entry in validator.checks if not entry['result']] == ['instruments_frame_missing']
+
+
+def test_header_file_offsets_override_default_layout(tmp_path):
+    # 헤더에 선두 필드가 하나 더 있어 모든 오프셋이 5바이트 밀린 레이아웃
+    labels = [
+        ('seq', '일련번호', 5), ('standard', '표준코드', 12), ('short', '단축코드', 9), ('name', '한글종목명', 80),
+        ('issuer_code', '발행기관코드', 10), ('issuer_name', '발행기관명', 40), ('payment', '이자지급방법', 1),
+        ('rate', '표면금리', 10), ('rating', '신용등급', 10), ('listing', '상장일', 8), ('issue', '발행일', 8),
+        ('maturity', '상환일', 8), ('face', '액면가', 15),
+    ]
+    header = tmp_path / 'bond_code.h'
+    header.write_text('\n'.join(f"    char    {name}[{size}];    /* {label} */" for name, label, size in labels),
+                      encoding='cp949')
+    values = ['00001', 'KR6000010001', '000010000', '국고채권01', '00001', '국고', '1', '3.2500', 'AAA',
+              '20200110', '20200110', '20300110', '000000000010000']
+    record = b''.join(value.encode('cp949').ljust(size, b' ') for value, (_, _, size) in zip(values, labels))
+    parser = BondParser(write_bond_zip(tmp_path, [record]), str(header))
+
+    chunk = next(parser.iter_chunks())
+
+    assert parser.record_size == len(record)
+    assert chunk['instrument_code'].tolist() == ['KR6000010001']
+    assert chunk['instrument_name'].tolist() == ['국고채권01']
+    assert chunk['face_value'].tolist() == [10000]
@@ -0,0 +1,84 @@
+import zipfile
+
+import pytest
+
+from parsers.derivative_parser import DerivativeParser
+
+HEADER = """
+#define SZ_SHRNCODE 9
+#define SZ_STNDCODE 12
+
+typedef struct
+{
+    char    prdt_kind[1];                   /* 상품종류 */
+    char    shrn_iscd[SZ_SHRNCODE];         /* 단축코드 */
+    char    stnd_iscd[SZ_STNDCODE];         /* 표준코드 */
+    char    kor_isnm[41];                   /* 한글종목명 */
+    char    atm_cls_code[1];                /* ATM구분 */
+    char    acpr[9];                        /* 행사가 */
+    char    mmsc_cls_code[1];               /* 월물구분코드 */
+    char    bast_shrn_iscd[SZ_SHRNCODE];    /* 기초자산 단축코드 */
+    char    bast_isnm[40];                  /* 기초자산 명 */
+} FO_COM_CODE;
+"""
+
+SIZES = [1, 9, 12, 41, 1, 9, 1, 9, 40]
+
+
+def fixed_record(*values):
+    return b''.join(value.encode('cp949')[:size].ljust(size, b' ') for value, size in zip(values, SIZES))
+
+
+def write_master(tmp_path, records):
+    path = tmp_path / 'fo_com_code.mst.zip'
+    with zipfile.ZipFile(path, 'w') as zip_ref:
+        zip_ref.writestr('fo_com_code.mst', b'\n'.join(records) + b'\n')
+    return str(path)
+
+
+def write_header(tmp_path, text=HEADER):
+    path = tmp_path / 'fo_com_code.h'
+    path.write_text(text, encoding='cp949')
+    return str(path)
+
+
+@pytest.fixture
+def records():
+    return [
+        fixed_record('1', '175W3000', 'KR4175W30000', '미국달러 F 202603', '0', '0', '1', '', ''),
+        fixed_record('2', '275W3115', 'KR4275W31157', '미국달러 C 202603 1150.0', '1', '1150.00', '1', '', ''),
+    ]
+
+
+def test_fixed_width_file_uses_header_offsets(tmp_path, records):
+    parser = DerivativeParser(write_master(tmp_path, records), write_header(tmp_path), '상품선물옵션')
+
+    frame = parser.parse()
+
+    assert frame['short_code'].tolist() == ['175W3000', '275W3115']
+    assert frame['standard_code'].tolist() == ['KR4175W30000', 'KR4275W31157']
+    assert frame['name'].tolist() == ['미국달러 F 202603', '미국달러 C 202603 1150.0']
+    assert frame['strike_price'].tolist() == ['0', '1150.00']
+
+
+def test_fixed_width_file_without_header_is_not_guessed(tmp_path, records):
+    parser = DerivativeParser(write_master(tmp_path, records), None, '상품선물옵션')
+
+    with pytest.raises(ValueError, match='헤더 파일'):
+        parser.parse()
+    assert parser.get_data().empty
+
+
+def test_header_missing_field_fails(tmp_path, records):
+    header = write_header(tmp_path, HEADER.replace('/* 행사가 */', '/* 예비 */'))
+
+    with pytest.raises(ValueError, match='행사가'):
+        DerivativeParser(write_master(tmp_path, records), header, '상품선물옵션').parse()
+
+
+def test_record_width_mismatch_fails(tmp_path, records):
+    parser = DerivativeParser(write_master(tmp_path, [record + b'  ' for record in records]),
+                              write_header(tmp_path), '상품선물옵션')
+
+    with pytest.raises(ValueError, match='레이아웃 폭'):
+        parser.parse()
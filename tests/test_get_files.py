@@ -0,0 +1,267 @@
+import http.server
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+pytest.importorskip('requests')
+
+import get_files  # noqa: E402
+from download_manifest import DownloadManifest  # noqa: E402
+
+
+class Route:
+    """스탠드인 서버의 경로별 응답 설정"""
+
+    def __init__(self, body, etag=None, delay=0, fail_with=(), truncate_first=None):
+        self.body = body
+        self.etag = etag
+        self.delay = delay                    # 응답 전 대기 (초)
+        self.fail_with = list(fail_with)      # 처음 요청들에 돌려줄 상태 코드
+        self.truncate_first = truncate_first  # 첫 200 응답을 이 바이트 수만 보내고 연결 종료
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        route = self.server.routes[self.path]
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(self.headers)))
+        time.sleep(route.delay)
+
+        if route.fail_with:
+            self._send(route.fail_with.pop(0))
+            return
+        if route.etag and self.headers.get('If-None-Match') == route.etag:
+            self._send(304)
+            return
+
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') == route.etag:
+            start = int(range_header.split('=')[1].split('-')[0])
+            if start >= len(route.body):
+                self._send(416, {'Content-Range': f"bytes */{len(route.body)}"})
+                return
+            status = 206
+            extra = {'Content-Range': f"bytes {start}-{len(route.body) - 1}/{len(route.body)}"}
+        else:
+            status, extra = 200, {}
+
+        body = route.body[start:]
+        self.send_response(status)
+        for key, value in extra.items():
+            self.send_header(key, value)
+        if route.etag:
+            self.send_header('ETag', route.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status == 200 and route.truncate_first is not None:
+            # 전송 중 연결 끊김 재현
+            self.wfile.write(body[:route.truncate_first])
+            self.wfile.flush()
+            route.truncate_first = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def _send(self, status, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.routes = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def requests_for(self, path):
+        return [headers for request_path, headers in self.requests if request_path == path]
+
+
+def zip_bytes(member, data):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zip_ref:
+        zip_ref.writestr(member, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def server():
+    stand_in = StandInServer()
+    thread = threading.Thread(target=stand_in.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fast_download(monkeypatch):
+    """백오프를 줄이고 청크를 작게 해 부분 파일이 남도록 설정"""
+    monkeypatch.setattr(get_files, 'DOWNLOAD_BACKOFF_SECONDS', 0.01)
+    monkeypatch.setattr(get_files, 'DOWNLOAD_CHUNK_SIZE', 64 * 1024)
+
+
+def test_download_files_runs_concurrently(server, tmp_path):
+    delays = [0.5, 0.5, 0.5, 0.8]
+    file_info_list = []
+    for i, delay in enumerate(delays):
+        server.routes[f'/m{i}.zip'] = Route(zip_bytes(f'm{i}.mst', b'x' * 1000), delay=delay)
+        file_info_list.append({'name': f'항목{i}', 'download_url': server.url(f'/m{i}.zip')})
+
+    started = time.perf_counter()
+    results = get_files.download_files(file_info_list, str(tmp_path))
+    elapsed = time.perf_counter() - started
+
+    assert [row[1] for row in results] == [f'항목{i}_마스터_m{i}.zip' for i in range(len(delays))]
+    # 순차 실행이면 합계(2.3초), 동시 실행이면 가장 느린 파일(0.8초)에 가까움
+    assert max(delays) <= elapsed < max(delays) + 0.5
+
+
+def test_retries_429_and_5xx_with_backoff(server, tmp_path, monkeypatch):
+    body = zip_bytes('a.mst', b'a' * 1000)
+    server.routes['/a.zip'] = Route(body, fail_with=[429, 503])
+    delays = []
+    original = get_files.backoff_delay
+    monkeypatch.setattr(get_files.random, 'uniform', lambda low, high: high)
+    monkeypatch.setattr(get_files, 'backoff_delay', lambda attempt: delays.append(original(attempt)) or delays[-1])
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == 'x_a.zip'
+    assert (tmp_path / 'x_a.zip').read_bytes() == body
+    assert len(server.requests_for('/a.zip')) == 3
+    assert delays == [0.01, 0.02]
+
+
+def test_gives_up_after_retries(server, tmp_path, monkeypatch):
+    server.routes['/a.zip'] = Route(b'', fail_with=[503] * 10)
+    monkeypatch.setattr(get_files, 'DOWNLOAD_RETRIES', 2)
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == ''
+    assert len(server.requests_for('/a.zip')) == 3
+    assert os.listdir(tmp_path) == []
+
+
+def test_not_modified_response_keeps_file(server, tmp_path):
+    server.routes['/a.zip'] = Route(zip_bytes('a.mst', b'a' * 1000), etag='"v1"')
+    manifest = DownloadManifest(str(tmp_path / 'manifest.json'))
+    folder = str(tmp_path / 'download')
+    os.makedirs(folder)
+
+    assert get_files.download_single_file(server.url('/a.zip'), 'x_', folder, manifest=manifest) == 'x_a.zip'
+    assert manifest.get('x_a.zip')['status'] == 'updated'
+    published = os.path.join(folder, 'x_a.zip')
+    os.utime(published, (1_000_000_000, 1_000_000_000))
+
+    assert get_files.download_single_file(server.url('/a.zip'), 'x_', folder, manifest=manifest) == 'x_a.zip'
+
+    assert server.requests_for('/a.zip')[-1].get('If-None-Match') == '"v1"'
+    assert manifest.get('x_a.zip')['status'] == 'unchanged'
+    assert os.path.getmtime(published) == 1_000_000_000
+
+
+def test_same_hash_is_not_republished(server, tmp_path):
+    # 검증자(ETag)가 없어 매번 200 으로 전체를 받는 경우
+    server.routes['/a.zip'] = Route(zip_bytes('a.mst', b'a' * 1000))
+    manifest = DownloadManifest(str(tmp_path / 'manifest.json'))
+    folder = str(tmp_path / 'download')
+    os.makedirs(folder)
+
+    get_files.download_single_file(server.url('/a.zip'), 'x_', folder, manifest=manifest)
+    published = os.path.join(folder, 'x_a.zip')
+    os.utime(published, (1_000_000_000, 1_000_000_000))
+    get_files.download_single_file(server.url('/a.zip'), 'x_', folder, manifest=manifest)
+
+    assert manifest.get('x_a.zip')['status'] == 'unchanged'
+    assert os.path.getmtime(published) == 1_000_000_000
+    assert sorted(os.listdir(folder)) == ['x_a.zip']
+
+
+def test_interrupted_download_resumes_with_range(server, tmp_path):
+    body = zip_bytes('a.mst', os.urandom(1_000_000))
+    server.routes['/a.zip'] = Route(body, etag='"v1"', truncate_first=300_000)
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == 'x_a.zip'
+    assert (tmp_path / 'x_a.zip').read_bytes() == body
+    first, second = server.requests_for('/a.zip')
+    assert 'Range' not in first
+    assert second['Range'].startswith('bytes=') and int(second['Range'][6:-1]) > 0
+    assert second['If-Range'] == '"v1"'
+    assert sorted(os.listdir(tmp_path)) == ['x_a.zip']
+
+
+def write_partial(folder, filename, url, data, etag, total=None):
+    """이전 실행이 남긴 부분 파일과 이어받기 상태"""
+    file_path = os.path.join(folder, filename)
+    part_path, state_path = get_files._part_paths(file_path)
+    with open(part_path, 'wb') as f:
+        f.write(data)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'etag': etag, 'last_modified': None, 'offset': len(data), 'total': total}, f)
+
+
+def test_range_not_satisfiable_restarts_from_scratch(server, tmp_path):
+    body = zip_bytes('a.mst', b'a' * 1000)
+    server.routes['/a.zip'] = Route(body, etag='"v1"')
+    write_partial(str(tmp_path), 'x_a.zip', server.url('/a.zip'), b'\0' * (len(body) + 500), '"v1"')
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == 'x_a.zip'
+    assert (tmp_path / 'x_a.zip').read_bytes() == body
+    first, second = server.requests_for('/a.zip')
+    assert first['Range'] == f"bytes={len(body) + 500}-"
+    assert 'Range' not in second
+    assert sorted(os.listdir(tmp_path)) == ['x_a.zip']
+
+
+def test_changed_remote_file_ignores_partial(server, tmp_path):
+    # If-Range 검증자가 달라 서버가 전체(200)를 보내면 부분 파일을 덮어씀
+    body = zip_bytes('a.mst', b'b' * 1000)
+    server.routes['/a.zip'] = Route(body, etag='"v2"')
+    write_partial(str(tmp_path), 'x_a.zip', server.url('/a.zip'), body[:100], '"v1"', total=len(body))
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == 'x_a.zip'
+    assert (tmp_path / 'x_a.zip').read_bytes() == body
+    assert server.requests_for('/a.zip')[0]['If-Range'] == '"v1"'
+
+
+def test_corrupt_zip_is_never_published(server, tmp_path):
+    good = zip_bytes('a.mst', b'a' * 1000)
+    corrupt = good.replace(b'a' * 1000, b'a' * 999 + b'b')
+    server.routes['/a.zip'] = Route(corrupt)
+    (tmp_path / 'x_a.zip').write_bytes(good)
+
+    result = get_files.download_single_file(server.url('/a.zip'), 'x_', str(tmp_path))
+
+    assert result == ''
+    assert len(server.requests_for('/a.zip')) == get_files.DOWNLOAD_RETRIES + 1
+    # 기존 파일은 그대로 두고 부분 파일도 남기지 않음
+    assert (tmp_path / 'x_a.zip').read_bytes() == good
+    assert sorted(os.listdir(tmp_path)) == ['x_a.zip']
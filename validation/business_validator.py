@@ -7,15 +7,19 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db_utils import get_connection
+from validation.check_engine import AggregateCheckEngine
 
 logger = logging.getLogger('business_validator')
 
 class BusinessValidator:
     """비즈니스 로직 검증기"""
     
+    def __init__(self, connection_factory=None):
+        self.get_connection = connection_factory or get_connection
+    
     def validate_market_distribution(self):
         """시장별 종목 분포 검증"""
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 cursor.execute("""
@@ -65,85 +69,89 @@ class BusinessValidator:
         finally:
             conn.close()
     
-    def validate_code_formats(self):
-        """종목코드 형식 검증"""
+    # (항목명, 오류 조건, 설명)
+    CODE_FORMAT_CHECKS = [
+        (
+            'domestic_stock_code_format',
+            """market_type IN ('KOSPI', 'KOSDAQ', 'KONEX')
+               AND instrument_type = 'STOCK'
+               AND (LENGTH(instrument_code) != 6 
+                    OR instrument_code NOT REGEXP '^[0-9]{6}$')""",
+            '국내 주식 코드 형식 검증 (6자리 숫자)'
+        ),
+        (
+            'short_code_length',
+            """short_code IS NOT NULL 
+               AND (LENGTH(short_code) < 3 OR LENGTH(short_code) > 12)""",
+            '단축코드 길이 검증 (3-12자)'
+        ),
+        (
+            'instrument_name_length',
+            """instrument_name IS NOT NULL 
+               AND (LENGTH(instrument_name) < 2 OR LENGTH(instrument_name) > 100)""",
+            '종목명 길이 검증 (2-100자)'
+        ),
+        (
+            'market_type_validity',
+            "market_type NOT IN ('KOSPI', 'KOSDAQ', 'KONEX', 'NYSE', 'NASDAQ', 'TSE', 'HKEX', 'SSE', 'ELW')",
+            '시장 유형 유효성 검증'
+        ),
+    ]
+    
+    # (항목명, 대상 조건, 값 존재 조건, 통과 기준(%), 설명)
+    COMPLETENESS_CHECKS = [
+        (
+            'listing_date_completeness',
+            "instrument_type = 'STOCK'",
+            "listing_date IS NOT NULL",
+            80.0,
+            '주식 상장일 정보 완성도 (80% 이상 목표)'
+        ),
+        (
+            'industry_code_completeness',
+            "instrument_type = 'STOCK' AND market_type IN ('KOSPI', 'KOSDAQ')",
+            "industry_code IS NOT NULL AND industry_code != ''",
+            70.0,
+            '국내 주식 업종코드 정보 완성도 (70% 이상 목표)'
+        ),
+    ]
+    
+    def register_code_format_checks(self, engine):
+        """종목코드 형식 검증 항목을 집계 엔진에 등록"""
+        for name, condition, _ in self.CODE_FORMAT_CHECKS:
+            engine.register_count('instruments', name, condition)
+    
+    def register_completeness_checks(self, engine):
+        """데이터 완성도 검증 항목을 집계 엔진에 등록"""
+        for name, scope, present, _, _ in self.COMPLETENESS_CHECKS:
+            engine.register_count('instruments', f'{name}_with_data', f"({scope}) AND ({present})")
+            engine.register_count('instruments', f'{name}_total', scope)
+    
+    def validate_code_formats(self, aggregates=None):
+        """종목코드 형식 검증
+        
+        aggregates: 집계 엔진 실행 결과 (없으면 이 검증 항목만 단독 실행)
+        """
+        if aggregates is None:
+            engine = AggregateCheckEngine()
+            self.register_code_format_checks(engine)
+            aggregates = engine.run()
+        
         checks = []
-        conn = get_connection()
-        try:
-            with conn.cursor() as cursor:
-                # 1. 국내 주식 코드 형식 (6자리 숫자)
-                cursor.execute("""
-                    SELECT 'domestic_stock_code_format' as check_name,
-                           COUNT(*) as invalid_count
-                    FROM instruments
-                    WHERE market_type IN ('KOSPI', 'KOSDAQ', 'KONEX')
-                      AND instrument_type = 'STOCK'
-                      AND (LENGTH(instrument_code) != 6 
-                           OR instrument_code NOT REGEXP '^[0-9]{6}$')
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'invalid_count': result[1],
-                    'description': '국내 주식 코드 형식 검증 (6자리 숫자)'
-                })
-                
-                # 2. 단축코드 길이 검사
-                cursor.execute("""
-                    SELECT 'short_code_length' as check_name,
-                           COUNT(*) as invalid_count
-                    FROM instruments
-                    WHERE short_code IS NOT NULL 
-                      AND (LENGTH(short_code) < 3 OR LENGTH(short_code) > 12)
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'invalid_count': result[1],
-                    'description': '단축코드 길이 검증 (3-12자)'
-                })
-                
-                # 3. 종목명 길이 검사
-                cursor.execute("""
-                    SELECT 'instrument_name_length' as check_name,
-                           COUNT(*) as invalid_count
-                    FROM instruments
-                    WHERE instrument_name IS NOT NULL 
-                      AND (LENGTH(instrument_name) < 2 OR LENGTH(instrument_name) > 100)
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'invalid_count': result[1],
-                    'description': '종목명 길이 검증 (2-100자)'
-                })
-                
-                # 4. 시장 유형 유효성 검사
-                cursor.execute("""
-                    SELECT 'market_type_validity' as check_name,
-                           COUNT(*) as invalid_count
-                    FROM instruments
-                    WHERE market_type NOT IN ('KOSPI', 'KOSDAQ', 'KONEX', 'NYSE', 'NASDAQ', 'TSE', 'HKEX', 'SSE', 'ELW')
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'invalid_count': result[1],
-                    'description': '시장 유형 유효성 검증'
-                })
-                
-        finally:
-            conn.close()
+        for name, _, description in self.CODE_FORMAT_CHECKS:
+            invalid_count = aggregates[f'instruments.{name}']
+            checks.append({
+                'check': name,
+                'result': invalid_count == 0,
+                'invalid_count': invalid_count,
+                'description': description
+            })
         
         return checks
     
     def validate_alias_quality(self):
         """별칭 품질 검증"""
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 # 별칭이 있는 종목 비율
@@ -179,52 +187,28 @@ class BusinessValidator:
         finally:
             conn.close()
     
-    def validate_data_completeness(self):
-        """데이터 완성도 검증"""
+    def validate_data_completeness(self, aggregates=None):
+        """데이터 완성도 검증
+        
+        aggregates: 집계 엔진 실행 결과 (없으면 이 검증 항목만 단독 실행)
+        """
+        if aggregates is None:
+            engine = AggregateCheckEngine()
+            self.register_completeness_checks(engine)
+            aggregates = engine.run()
+        
         checks = []
-        conn = get_connection()
-        try:
-            with conn.cursor() as cursor:
-                # 1. 상장일 정보 완성도
-                cursor.execute("""
-                    SELECT 'listing_date_completeness' as check_name,
-                           COUNT(CASE WHEN listing_date IS NOT NULL THEN 1 END) as with_date,
-                           COUNT(*) as total,
-                           ROUND(COUNT(CASE WHEN listing_date IS NOT NULL THEN 1 END) * 100.0 / COUNT(*), 2) as percentage
-                    FROM instruments
-                    WHERE instrument_type = 'STOCK'
-                """)
-                result = cursor.fetchone()
-                percentage = result[3] if result[3] is not None else 0.0
-                checks.append({
-                    'check': result[0],
-                    'result': percentage >= 80.0,  # 80% 이상이면 통과
-                    'with_data': result[1],
-                    'total': result[2],
-                    'percentage': percentage,
-                    'description': '주식 상장일 정보 완성도 (80% 이상 목표)'
-                })
-                
-                cursor.execute("""
-                    SELECT 'industry_code_completeness' as check_name,
-                           COUNT(CASE WHEN industry_code IS NOT NULL AND industry_code != '' THEN 1 END) as with_code,
-                           COUNT(*) as total,
-                           ROUND(COUNT(CASE WHEN industry_code IS NOT NULL AND industry_code != '' THEN 1 END) * 100.0 / COUNT(*), 2) as percentage
-                    FROM instruments
-                    WHERE instrument_type = 'STOCK' AND market_type IN ('KOSPI', 'KOSDAQ')
-                """)
-                result = cursor.fetchone()
-                percentage = result[3] if result[3] is not None else 0.0
-                checks.append({
-                    'check': result[0],
-                    'result': percentage >= 70.0,  # 70% 이상이면 통과
-                    'with_data': result[1],
-                    'total': result[2],
-                    'percentage': percentage,
-                    'description': '국내 주식 업종코드 정보 완성도 (70% 이상 목표)'
-                })
-                
-        finally:
-            conn.close()
+        for name, _, _, threshold, description in self.COMPLETENESS_CHECKS:
+            with_data = aggregates[f'instruments.{name}_with_data']
+            total = aggregates[f'instruments.{name}_total']
+            percentage = round(with_data * 100.0 / total, 2) if total else 0.0
+            checks.append({
+                'check': name,
+                'result': percentage >= threshold,
+                'with_data': with_data,
+                'total': total,
+                'percentage': percentage,
+                'description': description
+            })
         
         return checks
@@ -0,0 +1,66 @@
+import logging
+import sys
+import os
+from collections import OrderedDict
+from decimal import Decimal
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_utils import get_connection
+
+logger = logging.getLogger('check_engine')
+
+class AggregateCheckEngine:
+    """검증 항목을 테이블별 조건부 집계 쿼리 하나로 묶어 실행하는 엔진
+
+    검증 항목이 늘어나도 테이블당 한 번만 스캔합니다.
+    """
+
+    def __init__(self):
+        self._checks = OrderedDict()  # 테이블 -> OrderedDict(항목명 -> 집계식)
+
+    def register(self, table, name, expression):
+        """집계식 등록 (예: COUNT(*) - COUNT(DISTINCT instrument_code))"""
+        self._checks.setdefault(table, OrderedDict())[name] = expression
+
+    def register_count(self, table, name, condition):
+        """조건을 만족하는 행 수 집계 등록"""
+        self.register(table, name, f"COALESCE(SUM(CASE WHEN ({condition}) THEN 1 ELSE 0 END), 0)")
+
+    def register_total(self, table, name='total'):
+        """전체 행 수 집계 등록 (항목명은 '{table}.{name}'으로 조회)"""
+        self.register(table, name, "COUNT(*)")
+
+    def compile(self):
+        """테이블별 SELECT 쿼리 목록 반환 -> [(table, [항목명...], sql)]"""
+        queries = []
+        for table, checks in self._checks.items():
+            names = list(checks)
+            select_list = ',\n       '.join(checks[name] for name in names)
+            queries.append((table, names, f"SELECT {select_list}\nFROM {table}"))
+        return queries
+
+    def run(self, conn=None):
+        """등록된 모든 항목 실행 -> {항목명: 값, '{table}.{항목명}': 값}"""
+        own_connection = conn is None
+        if own_connection:
+            conn = get_connection()
+
+        results = {}
+        try:
+            with conn.cursor() as cursor:
+                for table, names, sql in self.compile():
+                    cursor.execute(sql)
+                    row = cursor.fetchone()
+                    for name, value in zip(names, row):
+                        # MySQL SUM() 결과(Decimal)를 정수로 변환
+                        if isinstance(value, Decimal):
+                            value = int(value)
+                        results[name] = value
+                        results[f"{table}.{name}"] = value
+                    logger.info(f"{table}: {len(names)}개 검증 항목을 1회 스캔으로 집계")
+        finally:
+            if own_connection:
+                conn.close()
+        return results
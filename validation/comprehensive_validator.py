@@ -1,5 +1,7 @@
 import logging
+import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 import os
@@ -7,58 +9,113 @@ import os
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config import OVERSEAS_ITEMS, VALIDATION_WORKERS
+from db_utils import ConnectionPool, get_connection
+from metrics import stage_timer
 from .file_analyzer import FileAnalyzer
 from .db_validator import DatabaseValidator
 from .business_validator import BusinessValidator
 from .sample_validator import SampleValidator
+from .check_engine import AggregateCheckEngine
 
 logger = logging.getLogger('comprehensive_validator')
 
 class ComprehensiveValidator:
     """통합 검증 실행기"""
     
-    def __init__(self):
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or VALIDATION_WORKERS
+        self.pool = None
         self.file_analyzer = FileAnalyzer()
-        self.db_validator = DatabaseValidator()
-        self.business_validator = BusinessValidator()
-        self.sample_validator = SampleValidator()
+        self.db_validator = DatabaseValidator(connection_factory=self._get_connection)
+        self.business_validator = BusinessValidator(connection_factory=self._get_connection)
+        self.sample_validator = SampleValidator(connection_factory=self._get_connection)
         self.validation_report = {}
+        self.check_durations = {}
+    
+    def _get_connection(self):
+        """검증 실행 중에는 풀(일관된 스냅샷)에서, 그 외에는 새 연결 반환"""
+        if self.pool is not None:
+            return self.pool.get_connection()
+        return get_connection()
+    
+    def _timed(self, name, func, *args):
+        """검증 항목 실행 후 소요 시간 기록 (단계 지표 'validate')"""
+        started = time.perf_counter()
+        try:
+            with stage_timer('validate', name=name):
+                return func(*args)
+        finally:
+            self.check_durations[name] = round(time.perf_counter() - started, 4)
+    
+    def _run_concurrently(self, executor, tasks):
+        """{항목명: (함수, 인자...)} 동시 실행 -> {항목명: 결과}"""
+        futures = {
+            name: executor.submit(self._timed, name, task[0], *task[1:])
+            for name, task in tasks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
     
     def run_full_validation(self, file_mapping):
-        """전체 검증 실행"""
+        """전체 검증 실행 (독립 검증 항목은 작업자 풀에서 동시 실행)"""
         logger.info("=" * 60)
         logger.info("KIS 데이터 통합 검증 시작")
         logger.info("=" * 60)
         start_time = datetime.now()
+        self.check_durations = {}
         
         try:
-            # 1. 파일 분석
-            logger.info("1️⃣  원시 파일 분석 중...")
-            file_stats = self.file_analyzer.analyze_all_files(file_mapping)
+            # 모든 작업자가 같은 시점의 데이터를 읽도록 일관된 스냅샷 연결 풀 사용
+            self.pool = ConnectionPool(self.max_workers, consistent_snapshot=True)
+            
+            # instruments 대상 검증 항목은 조건부 집계로 묶어 1회 스캔
+            engine = AggregateCheckEngine()
+            self.db_validator.register_data_type_checks(engine)
+            self.business_validator.register_code_format_checks(engine)
+            self.business_validator.register_completeness_checks(engine)
             
-            # 2. 데이터베이스 기본 검증
-            logger.info("2️⃣  데이터베이스 기본 검증 중...")
-            db_stats = self.db_validator.count_table_records()
-            data_type_checks = self.db_validator.check_data_types()
-            integrity_checks = self.db_validator.check_referential_integrity()
+            def run_aggregates():
+                conn = self._get_connection()
+                try:
+                    return engine.run(conn)
+                finally:
+                    conn.close()
             
-            # 3. 비즈니스 로직 검증
-            logger.info("3️⃣  비즈니스 로직 검증 중...")
-            market_validation, market_distribution = self.business_validator.validate_market_distribution()
-            code_format_checks = self.business_validator.validate_code_formats()
-            alias_stats = self.business_validator.validate_alias_quality()
-            completeness_checks = self.business_validator.validate_data_completeness()
+            # 1~4. 파일 분석, DB/비즈니스/샘플 검증 동시 실행
+            logger.info(f"원시 파일 분석 및 DB/비즈니스/샘플 검증 동시 실행 (작업자 {self.max_workers}개)")
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='validation') as executor:
+                results = self._run_concurrently(executor, {
+                    'file_analysis': (self.file_analyzer.analyze_all_files, file_mapping),
+                    'table_counts': (self.db_validator.count_table_records,),
+                    'aggregate_checks': (run_aggregates,),
+                    'referential_integrity': (self.db_validator.check_referential_integrity,),
+                    'market_distribution': (self.business_validator.validate_market_distribution,),
+                    'alias_quality': (self.business_validator.validate_alias_quality,),
+                    'known_instruments': (self.sample_validator.validate_known_instruments,),
+                    'search_functionality': (self.sample_validator.validate_search_functionality,),
+                    'etf_samples': (self.sample_validator.validate_etf_samples,),
+                    'market_coverage': (self.sample_validator.validate_market_coverage,),
+                })
             
-            # 4. 샘플 데이터 검증
-            logger.info("4️⃣  샘플 데이터 검증 중...")
-            known_stock_checks = self.sample_validator.validate_known_instruments()
-            search_checks = self.sample_validator.validate_search_functionality()
-            etf_validation = self.sample_validator.validate_etf_samples()
-            market_coverage = self.sample_validator.validate_market_coverage()
+            file_stats = results['file_analysis']
+            db_stats = results['table_counts']
+            aggregates = results['aggregate_checks']
+            integrity_checks = results['referential_integrity']
+            market_validation, market_distribution = results['market_distribution']
+            alias_stats = results['alias_quality']
+            known_stock_checks = results['known_instruments']
+            search_checks = results['search_functionality']
+            etf_validation = results['etf_samples']
+            market_coverage = results['market_coverage']
+            
+            # 집계 결과 판정 (추가 쿼리 없음)
+            data_type_checks = self._timed('data_types', self.db_validator.check_data_types, aggregates)
+            code_format_checks = self._timed('code_formats', self.business_validator.validate_code_formats, aggregates)
+            completeness_checks = self._timed('data_completeness', self.business_validator.validate_data_completeness, aggregates)
             
             # 5. 파일 vs DB 레코드 수 비교
             logger.info("5️⃣  파일-DB 레코드 수 비교 중...")
-            count_comparison = self._compare_file_db_counts(file_stats, db_stats)
+            count_comparison = self._timed('count_comparison', self._compare_file_db_counts, file_stats, db_stats)
             
             # 검증 결과 종합
             end_time = datetime.now()
@@ -67,7 +124,9 @@ class ComprehensiveValidator:
                 'metadata': {
                     'timestamp': end_time.isoformat(),
                     'duration': str(end_time - start_time),
-                    'validation_version': '1.0'
+                    'validation_version': '1.0',
+                    'workers': self.max_workers,
+                    'check_durations': dict(sorted(self.check_durations.items(), key=lambda item: -item[1]))
                 },
                 'file_analysis': {
                     'file_stats': file_stats,
@@ -103,6 +162,10 @@ class ComprehensiveValidator:
         except Exception as e:
             logger.error(f"검증 실행 중 오류 발생: {e}", exc_info=True)
             raise
+        finally:
+            if self.pool is not None:
+                self.pool.close()
+                self.pool = None
     
     def _compare_file_db_counts(self, file_stats, db_stats):
         """파일과 DB 레코드 수 비교"""
@@ -114,10 +177,15 @@ class ComprehensiveValidator:
             '코스닥': 'instruments', 
             '코넥스': 'instruments',
             'ELW': 'instruments',
+            '지수선물옵션': 'instruments',
+            '주식선물옵션': 'instruments',
+            '상품선물옵션': 'instruments',
+            '채권코드': 'instruments',
             '회원사코드': 'member_code',
             '업종코드': 'sector_code',
             '테마코드': 'theme_code'
         }
+        file_to_db_mapping.update({item: 'instruments' for item in OVERSEAS_ITEMS})
         
         instruments_total_expected = 0
         instruments_breakdown = {}
@@ -142,6 +210,7 @@ class ComprehensiveValidator:
                         'difference': db_count - file_count,
                         'tolerance': tolerance,
                         'is_match': is_match,
+                        'file_sha256': file_stats[item_name].get('sha256'),
                         'match_percentage': round((min(file_count, db_count) / max(file_count, db_count)) * 100, 2) if max(file_count, db_count) > 0 else 0
                     }
                     
@@ -271,7 +340,11 @@ class ComprehensiveValidator:
         
         logger.info(f"📊 전체 상태: {status_emoji.get(overall['overall_status'], '❓')} {overall['overall_status']}")
         logger.info(f"📈 성공률: {overall['success_rate']}% ({overall['passed_checks']}/{overall['total_checks']})")
-        logger.info(f"⏱️  검증 시간: {report['metadata']['duration']}")
+        logger.info(f"⏱️  검증 시간: {report['metadata']['duration']} (작업자 {report['metadata']['workers']}개)")
+        
+        # 검증 항목별 소요 시간 (상위 5개)
+        for name, seconds in list(report['metadata']['check_durations'].items())[:5]:
+            logger.info(f"  ⏱️  {name}: {seconds:.3f}초")
         
         if overall['critical_failures'] > 0:
             logger.warning(f"⚠️  심각한 오류: {overall['critical_failures']}개")
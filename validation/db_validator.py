@@ -7,14 +7,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db_utils import get_connection
+from validation.check_engine import AggregateCheckEngine
 
 logger = logging.getLogger('db_validator')
 
 class DatabaseValidator:
     """데이터베이스 검증기"""
     
-    def __init__(self):
+    def __init__(self, connection_factory=None):
         self.db_stats = {}
+        self.get_connection = connection_factory or get_connection
     
     def count_table_records(self):
         """각 테이블의 레코드 수 조회"""
@@ -27,7 +29,7 @@ class DatabaseValidator:
         ]
         
         results = {}
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 for table in tables:
@@ -45,112 +47,86 @@ class DatabaseValidator:
         self.db_stats = results
         return results
     
-    def check_data_types(self):
-        """데이터 타입 및 제약조건 검증"""
+    # (항목명, 조건, 설명) - 조건을 만족하는 행은 오류로 집계
+    # 조건식은 CASE WHEN 안에 삽입되므로 SQL 주석(--)을 쓰지 않음 (단축코드는 ELW 제외 필수)
+    DATA_TYPE_CHECKS = [
+        (
+            'instruments_required_fields',
+            """instrument_code IS NULL 
+               OR instrument_code = ''
+               OR instrument_name IS NULL 
+               OR instrument_name = ''
+               OR instrument_type IS NULL 
+               OR instrument_type = ''
+               OR market_type IS NULL
+               OR market_type = ''
+               OR (instrument_type != 'ELW' AND short_code IS NULL)
+               OR (instrument_type != 'ELW' AND short_code = '')""",
+            '필수 필드 NULL/빈값 검사 (ELW 제외)'
+        ),
+        (
+            'instruments_date_format',
+            """(listing_date IS NOT NULL AND listing_date < '1900-01-01')
+               OR (maturity_date IS NOT NULL AND maturity_date < '1900-01-01')
+               OR (listing_date IS NOT NULL AND listing_date > CURDATE() + INTERVAL 10 YEAR)""",
+            '날짜 형식 유효성 검사'
+        ),
+        (
+            'instruments_flag_values',
+            """is_etf NOT IN ('Y', 'N')
+               OR is_warning NOT IN ('Y', 'N')
+               OR is_managed NOT IN ('Y', 'N')
+               OR is_elw NOT IN ('Y', 'N')
+               OR is_foreign NOT IN ('Y', 'N')""",
+            '플래그 필드 값 검증 (Y/N)'
+        ),
+        (
+            'instruments_numeric_fields',
+            """(face_value IS NOT NULL AND face_value < 0)
+               OR (issue_cnt IS NOT NULL AND issue_cnt < 0)
+               OR (strike_price IS NOT NULL AND strike_price < 0)""",
+            '숫자 필드 유효성 검사 (음수 체크)'
+        ),
+    ]
+    
+    def register_data_type_checks(self, engine):
+        """데이터 타입 검증 항목을 집계 엔진에 등록"""
+        # 1. Primary Key 중복 검사
+        engine.register('instruments', 'instruments_pk_duplicate',
+                        "COUNT(*) - COUNT(DISTINCT instrument_code)")
+        # 2~5. 필수 필드, 날짜, 플래그, 숫자 필드 검사
+        for name, condition, _ in self.DATA_TYPE_CHECKS:
+            engine.register_count('instruments', name, condition)
+    
+    def check_data_types(self, aggregates=None):
+        """데이터 타입 및 제약조건 검증
+        
+        aggregates: 집계 엔진 실행 결과 (없으면 이 검증 항목만 단독 실행)
+        """
+        if aggregates is None:
+            engine = AggregateCheckEngine()
+            self.register_data_type_checks(engine)
+            aggregates = engine.run()
+        
+        descriptions = [('instruments_pk_duplicate', '종목코드 중복 검사')]
+        descriptions += [(name, description) for name, _, description in self.DATA_TYPE_CHECKS]
+        
         checks = []
-        conn = get_connection()
-        try:
-            with conn.cursor() as cursor:
-                # 1. Primary Key 중복 검사
-                cursor.execute("""
-                    SELECT 'instruments_pk_duplicate' as check_name,
-                           COUNT(*) - COUNT(DISTINCT instrument_code) as duplicate_count
-                    FROM instruments
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'value': result[1],
-                    'description': '종목코드 중복 검사'
-                })
-                
-                # 2. 필수 필드 NULL 검사 (ELW 특성 고려)
-                cursor.execute("""
-                    SELECT 'instruments_required_fields' as check_name,
-                           COUNT(*) as null_count
-                    FROM instruments 
-                    WHERE instrument_code IS NULL 
-                       OR instrument_code = ''
-                       OR instrument_name IS NULL 
-                       OR instrument_name = ''
-                       OR instrument_type IS NULL 
-                       OR instrument_type = ''
-                       OR market_type IS NULL
-                       OR market_type = ''
-                       OR (instrument_type != 'ELW' AND short_code IS NULL)  -- ELW 제외 단축코드 필수
-                       OR (instrument_type != 'ELW' AND short_code = '')     -- ELW 제외 단축코드 필수
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'value': result[1],
-                    'description': '필수 필드 NULL/빈값 검사 (ELW 제외)'
-                })
-                
-                # 3. 날짜 형식 검사
-                cursor.execute("""
-                    SELECT 'instruments_date_format' as check_name,
-                           COUNT(*) as invalid_date_count
-                    FROM instruments 
-                    WHERE (listing_date IS NOT NULL AND listing_date < '1900-01-01')
-                       OR (maturity_date IS NOT NULL AND maturity_date < '1900-01-01')
-                       OR (listing_date IS NOT NULL AND listing_date > CURDATE() + INTERVAL 10 YEAR)
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'value': result[1],
-                    'description': '날짜 형식 유효성 검사'
-                })
-                
-                # 4. 플래그 필드 값 검사
-                cursor.execute("""
-                    SELECT 'instruments_flag_values' as check_name,
-                           COUNT(*) as invalid_flag_count
-                    FROM instruments 
-                    WHERE is_etf NOT IN ('Y', 'N')
-                       OR is_warning NOT IN ('Y', 'N')
-                       OR is_managed NOT IN ('Y', 'N')
-                       OR is_elw NOT IN ('Y', 'N')
-                       OR is_foreign NOT IN ('Y', 'N')
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'value': result[1],
-                    'description': '플래그 필드 값 검증 (Y/N)'
-                })
-                
-                # 5. 숫자 필드 검사
-                cursor.execute("""
-                    SELECT 'instruments_numeric_fields' as check_name,
-                           COUNT(*) as invalid_numeric_count
-                    FROM instruments 
-                    WHERE (face_value IS NOT NULL AND face_value < 0)
-                       OR (issue_cnt IS NOT NULL AND issue_cnt < 0)
-                       OR (strike_price IS NOT NULL AND strike_price < 0)
-                """)
-                result = cursor.fetchone()
-                checks.append({
-                    'check': result[0],
-                    'result': result[1] == 0,
-                    'value': result[1],
-                    'description': '숫자 필드 유효성 검사 (음수 체크)'
-                })
-                
-        finally:
-            conn.close()
+        for name, description in descriptions:
+            value = aggregates[f'instruments.{name}']
+            checks.append({
+                'check': name,
+                'result': value == 0,
+                'value': value,
+                'description': description
+            })
         
         return checks
     
     def check_referential_integrity(self):
         """참조 무결성 검사"""
         checks = []
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 # 1. 테마 매핑 테이블의 외래키 검사 (instruments)
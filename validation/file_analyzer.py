@@ -1,6 +1,8 @@
 import os
-import zipfile
+import hashlib
 import logging
+from collections import Counter
+import numpy as np
 import pandas as pd
 import sys
 
@@ -8,9 +10,16 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import DATA_DIR
+from artifact_registry import get_registry, stream_master
 
 logger = logging.getLogger('file_analyzer')
 
+# 스트리밍 분석 청크 크기 (1 MiB)
+CHUNK_SIZE = 1024 * 1024
+NEWLINE = ord('\n')
+# 리포트에 남길 레코드 길이 분포 상위 개수
+HISTOGRAM_TOP_N = 10
+
 class FileAnalyzer:
     """원시 파일 분석기"""
     
@@ -18,72 +27,105 @@ class FileAnalyzer:
         self.file_stats = {}
     
     def analyze_master_file(self, file_path, record_size=None):
-        """마스터 파일 분석 (라인 수, 레코드 수 등)"""
+        """마스터 파일 분석 (라인 수, 레코드 수 등)
+        
+        같은 실행에서 파서가 이미 읽은 파일은 아티팩트 레지스트리의 바이트를 그대로 분석하고,
+        아직 읽지 않은 파일(청크 스트리밍하는 채권 등)은 레지스트리에 올리지 않고
+        ZIP 멤버를 스트림으로 읽어 분석합니다.
+        """
         try:
             full_path = os.path.join(DATA_DIR, file_path) if not os.path.isabs(file_path) else file_path
             
-            # ZIP 파일인 경우 압축 해제 후 분석
-            if full_path.endswith('.zip'):
-                with zipfile.ZipFile(full_path, 'r') as zip_ref:
-                    file_list = zip_ref.namelist()
-                    master_file = None
-                    for file in file_list:
-                        if file.endswith(('.mst', '.cod')):
-                            master_file = file
-                            break
-                    
-                    if master_file:
-                        with zip_ref.open(master_file) as f:
-                            content = f.read()
-                            return self._analyze_binary_content(content, record_size, master_file)
-                    else:
-                        logger.warning(f"ZIP 파일에서 마스터 파일을 찾을 수 없음: {full_path}")
-                        return None
-            else:
-                # 일반 파일인 경우
-                if os.path.exists(full_path):
-                    with open(full_path, 'rb') as f:
-                        content = f.read()
-                        return self._analyze_binary_content(content, record_size, os.path.basename(full_path))
-                else:
+            artifact = get_registry().peek(full_path)
+            if artifact is None:
+                if not os.path.exists(full_path):
                     logger.warning(f"파일이 존재하지 않음: {full_path}")
                     return None
+                with stream_master(full_path) as (stream, signature):
+                    return self._analyze_stream(stream, record_size, signature[0])
+            
+            if record_size not in artifact.analysis:
+                artifact.analysis[record_size] = self._analyze_stream(
+                    artifact.open_binary(), record_size, artifact.member_name
+                )
+            return artifact.analysis[record_size]
                     
         except Exception as e:
             logger.error(f"파일 분석 오류 {file_path}: {e}")
             return None
     
-    def _analyze_binary_content(self, content, record_size, filename):
-        """바이너리 내용 분석"""
-        total_size = len(content)
+    def _analyze_stream(self, stream, record_size, filename):
+        """바이트 스트림을 고정 크기 청크로 한 번 읽으며 분석
+        
+        디코딩 없이 개행(b'\\n') 위치로 레코드 수와 레코드 길이(개행 포함 바이트) 분포를 구하고
+        같은 패스에서 SHA-256 해시를 계산합니다. 메모리 사용량은 청크 크기로 고정됩니다.
+        """
+        total_size = 0
+        line_count = 0
+        pending = 0  # 이전 청크에서 이어지는 라인의 길이
+        histogram = Counter()
+        digest = hashlib.sha256()
         
-        if record_size and record_size > 0:
-            # 고정 길이 레코드인 경우
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total_size += len(chunk)
+            digest.update(chunk)
+            
+            newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == NEWLINE)
+            if len(newlines) == 0:
+                pending += len(chunk)
+                continue
+            
+            # 라인 길이 = 개행 위치 간격 (첫 라인은 이전 청크 잔여분 포함)
+            lengths = np.diff(newlines, prepend=-1)
+            lengths[0] += pending
+            values, counts = np.unique(lengths, return_counts=True)
+            histogram.update(dict(zip(values.tolist(), counts.tolist())))
+            line_count += len(newlines)
+            pending = len(chunk) - 1 - int(newlines[-1])
+        
+        if pending:
+            # 마지막 라인에 개행문자가 없는 경우 (개행 포함 길이로 환산)
+            line_count += 1
+            histogram[pending + 1] += 1
+        
+        dominant_length = histogram.most_common(1)[0][0] if histogram else None
+        
+        mismatched_records = 0
+        if record_size and record_size > 0 and line_count <= 1:
+            # 개행 없는 고정 길이 파일
             record_count = total_size // record_size
             remainder = total_size % record_size
         else:
-            # 가변 길이인 경우 (라인 수 계산)
-            try:
-                text_content = content.decode('cp949', errors='ignore')
-                record_count = text_content.count('\n')
-                if not text_content.endswith('\n') and text_content:
-                    record_count += 1  # 마지막 라인에 개행문자가 없는 경우
-            except:
-                try:
-                    text_content = content.decode('utf-8', errors='ignore')
-                    record_count = text_content.count('\n')
-                    if not text_content.endswith('\n') and text_content:
-                        record_count += 1
-                except:
-                    record_count = None
+            # 개행으로 구분된 파일: 라인 수가 실제 레코드 수
+            record_count = line_count
             remainder = 0
+            if record_size:
+                mismatched_records = line_count - histogram.get(record_size, 0)
+        
+        layout_mismatch = bool(
+            record_size and dominant_length and line_count > 1 and dominant_length != record_size
+        )
+        if layout_mismatch:
+            logger.warning(
+                f"{filename}: 레코드 길이 불일치 - 예상 {record_size}bytes, "
+                f"실제 최빈값 {dominant_length}bytes ({histogram[dominant_length]:,}/{line_count:,}개 레코드)"
+            )
         
         return {
             'filename': filename,
             'total_size': total_size,
             'record_count': record_count,
             'remainder': remainder,
-            'record_size': record_size
+            'record_size': record_size,
+            'dominant_record_length': dominant_length,
+            'record_length_histogram': dict(histogram.most_common(HISTOGRAM_TOP_N)),
+            'distinct_record_lengths': len(histogram),
+            'layout_mismatch': layout_mismatch,
+            'mismatched_records': mismatched_records,
+            'sha256': digest.hexdigest()
         }
     
     def analyze_all_files(self, file_mapping):
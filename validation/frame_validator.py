@@ -0,0 +1,271 @@
+import logging
+import string
+from datetime import date, datetime, timedelta
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger('frame_validator')
+
+FLAG_COLUMNS = ['is_etf', 'is_warning', 'is_managed', 'is_elw', 'is_foreign']
+NON_NEGATIVE_COLUMNS = ['face_value', 'issue_cnt', 'strike_price']
+ISIN_PATTERN = r'^[A-Z]{2}[A-Z0-9]{9}[0-9]$'
+DERIVATIVE_SHORT_PATTERN = r'^[1-4A-D][0-9A-Z]{7}$'
+
+# 국내 종목 상품유형별 코드 형식: instrument_type -> (종목코드 패턴, 단축코드 패턴)
+# 고정 길이 레코드의 필드 위치가 어긋나면 코드 형식부터 깨지므로 치명적 오류로 처리합니다.
+CODE_FORMATS = {
+    'STOCK': (ISIN_PATTERN, r'^[A-Z]?[0-9A-Z]{6}$'),  # ETN 등 영문 접두어 단축코드(Q500001) 허용
+    'ETF': (ISIN_PATTERN, r'^[A-Z]?[0-9A-Z]{6}$'),
+    'ELW': (ISIN_PATTERN, r'^[0-9A-Z]{6}$'),
+    'FUTURE': (f'{ISIN_PATTERN}|{DERIVATIVE_SHORT_PATTERN}', DERIVATIVE_SHORT_PATTERN),
+    'OPTION': (f'{ISIN_PATTERN}|{DERIVATIVE_SHORT_PATTERN}', DERIVATIVE_SHORT_PATTERN),
+    'BOND': (ISIN_PATTERN, r'^[0-9A-Z]{1,9}$'),
+}
+# 해외 종목은 거래소마다 심볼 체계가 달라 공백 없는 문자열 여부만 확인
+OVERSEAS_CODE_PATTERN = r'^\S{1,20}$'
+
+# ISIN 문자 -> 숫자 문자열 변환표 (A=10 ... Z=35)
+_ISIN_TRANSLATION = str.maketrans({ch: str(i + 10) for i, ch in enumerate(string.ascii_uppercase)})
+# 숫자 변환 후 최대 길이 (11자리 본문이 모두 문자인 경우)
+_ISIN_MAX_DIGITS = 22
+
+def isin_check_digit_valid(codes):
+    """ISIN 체크디지트 검증 (벡터 연산) -> bool Series"""
+    codes = pd.Series(codes, dtype=object).astype(str)
+    if codes.empty:
+        return pd.Series([], dtype=bool)
+
+    body = codes.str[:11].str.translate(_ISIN_TRANSLATION).str.zfill(_ISIN_MAX_DIGITS)
+    digits = (
+        np.frombuffer(''.join(body).encode('ascii'), dtype=np.uint8)
+        .reshape(len(body), _ISIN_MAX_DIGITS)
+        .astype(np.int16) - ord('0')
+    )
+
+    # Luhn: 오른쪽 끝 자리부터 한 자리 건너 2배 (앞쪽 0 패딩은 합에 영향 없음)
+    doubled = (np.arange(_ISIN_MAX_DIGITS)[::-1] % 2) == 0
+    values = np.where(doubled, digits * 2, digits)
+    values = np.where(values > 9, values - 9, values)
+    expected = (10 - values.sum(axis=1) % 10) % 10
+
+    actual = codes.str[11].astype(int).to_numpy()
+    return pd.Series(expected == actual, index=codes.index)
+
+class FrameValidator:
+    """DB 적재 전 파싱 결과(DataFrame) 검증기
+
+    적재 후 DB 검증(DatabaseValidator, BusinessValidator)과 같은 규칙을 컬럼 단위 마스크로
+    실행하여, 잘못된 파일은 테이블 초기화/적재 전에 걸러냅니다.
+    """
+
+    def __init__(self, verbose=True):
+        self.checks = []
+        self.verbose = verbose
+
+    def _add(self, check, invalid_mask, frame, description, critical=True, key_column='instrument_code'):
+        invalid_count = int(invalid_mask.sum())
+        samples = []
+        if invalid_count and key_column in frame.columns:
+            samples = frame.loc[invalid_mask, key_column].astype(str).head(5).tolist()
+        self._record({
+            'check': check,
+            'result': invalid_count == 0,
+            'value': invalid_count,
+            'critical': critical,
+            'samples': samples,
+            'description': description
+        })
+
+    def _record(self, entry):
+        self.checks.append(entry)
+        if not self.verbose:
+            return
+        if entry['value']:
+            log = logger.error if entry['critical'] else logger.warning
+            log(f"✗ {entry['description']}: {entry['value']}건 (예: {', '.join(entry['samples'])})")
+        else:
+            logger.info(f"✓ {entry['description']}")
+
+    def validate_instruments(self, frames):
+        """종목 DataFrame 검증 (frames: {항목명: DataFrame})
+
+        frames 에 포함된 항목은 모두 적재 대상이므로, 파싱 실패(빈 DataFrame)나 레코드 없는 파일은
+        치명적 오류로 기록합니다.
+        """
+        # 0. 항목별 파싱 결과 존재 (파서는 오류 시 빈 DataFrame 을 반환)
+        markets = pd.DataFrame({'market_type': list(frames)})
+        missing_frame = pd.Series([df is None or df.empty for df in frames.values()], index=markets.index, dtype=bool)
+        self._add('instruments_frame_missing', missing_frame, markets,
+                  '항목별 파싱 결과 존재 검사 (파싱 실패/빈 파일)', key_column='market_type')
+
+        frames = {name: df for name, df in frames.items() if df is not None and not df.empty}
+        if not frames:
+            return
+        df = pd.concat(
+            [df.assign(_source=name) for name, df in frames.items()],
+            ignore_index=True, sort=False
+        )
+
+        def column(name):
+            return df[name] if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+        def blank(series):
+            return series.isna() | (series.astype(str).str.strip() == '')
+
+        # 1. PK 중복 (INSERT IGNORE로 조용히 누락되는 건)
+        code = column('instrument_code')
+        self._add('instruments_pk_duplicate', code.notna() & code.duplicated(keep=False), df,
+                  '종목코드 중복 검사')
+
+        # 2. 필수 필드 (ELW 제외 단축코드 필수)
+        instrument_type = column('instrument_type')
+        required = (
+            blank(code) | blank(column('instrument_name')) | blank(instrument_type) | blank(column('market_type'))
+            | ((instrument_type != 'ELW') & blank(column('short_code')))
+        )
+        self._add('instruments_required_fields', required, df, '필수 필드 NULL/빈값 검사 (ELW 제외)')
+
+        # 3. 날짜 범위
+        # 2월 29일에도 동작하도록 연도 치환 대신 일수로 계산 (약 10년)
+        max_date = date.today() + timedelta(days=3653)
+        invalid_date = pd.Series(False, index=df.index)
+        for date_column in ['listing_date', 'maturity_date']:
+            values = pd.to_datetime(column(date_column), errors='coerce')
+            invalid_date |= values.notna() & (values < datetime(1900, 1, 1))
+            if date_column == 'listing_date':
+                invalid_date |= values.notna() & (values > datetime.combine(max_date, datetime.min.time()))
+        self._add('instruments_date_format', invalid_date, df, '날짜 형식 유효성 검사')
+
+        # 4. 플래그 값 (Y/N)
+        invalid_flag = pd.Series(False, index=df.index)
+        for flag_column in FLAG_COLUMNS:
+            values = column(flag_column)
+            invalid_flag |= values.notna() & ~values.isin(['Y', 'N'])
+        self._add('instruments_flag_values', invalid_flag, df, '플래그 필드 값 검증 (Y/N)')
+
+        # 5. 숫자 필드 (음수)
+        invalid_numeric = pd.Series(False, index=df.index)
+        for numeric_column in NON_NEGATIVE_COLUMNS:
+            values = pd.to_numeric(column(numeric_column), errors='coerce')
+            invalid_numeric |= values.notna() & (values < 0)
+        self._add('instruments_numeric_fields', invalid_numeric, df, '숫자 필드 유효성 검사 (음수 체크)')
+
+        # 6. ISIN 체크디지트 (ISIN 형식의 종목코드만 대상)
+        isin_like = code.astype(str).str.match(ISIN_PATTERN) & code.notna()
+        invalid_isin = pd.Series(False, index=df.index)
+        if isin_like.any():
+            invalid_isin[isin_like] = ~isin_check_digit_valid(code[isin_like])
+        self._add('instruments_isin_check_digit', invalid_isin, df, 'ISIN 체크디지트 검증')
+
+        # 7. 종목코드/단축코드 형식 (빈값은 필수 필드 검사에서 처리)
+        domestic = column('country_code').fillna('KOR') == 'KOR'
+        invalid_format = pd.Series(False, index=df.index)
+        for key, pattern_index in [('instrument_code', 0), ('short_code', 1)]:
+            values = column(key)
+            text = values.astype(str)
+            for type_name, patterns in CODE_FORMATS.items():
+                target = domestic & (instrument_type == type_name) & ~blank(values)
+                if target.any():
+                    invalid_format[target] |= ~text[target].str.match(patterns[pattern_index])
+            target = ~domestic & ~blank(values)
+            if target.any():
+                invalid_format[target] |= ~text[target].str.match(OVERSEAS_CODE_PATTERN)
+        self._add('instruments_code_format', invalid_format, df, '종목코드/단축코드 형식 검사 (상품유형별)')
+
+        # 8. ELW 기초자산 코드 존재 (지수 등 종목 외 기초자산이 있어 경고로 처리)
+        underlying = column('underlying_code')
+        known_codes = set(code.dropna().astype(str)) | set(column('short_code').dropna().astype(str))
+        underlying_code = underlying.astype(str).str.strip()
+        # 기초자산 단축코드는 'A' 접두어가 붙는 경우가 있음 (예: A005930)
+        resolved = underlying_code.isin(known_codes) | underlying_code.str.replace(r'^A', '', regex=True).isin(known_codes)
+        missing_underlying = (instrument_type == 'ELW') & ~blank(underlying) & ~resolved
+        self._add('elw_underlying_exists', missing_underlying, df, 'ELW 기초자산 코드 존재 검증', critical=False)
+
+        self._known_codes = known_codes
+        self._industry_codes = column('industry_code')
+        self._instrument_frame = df
+
+    def validate_instrument_chunks(self, market, chunks):
+        """대용량 항목(채권) 청크 스트리밍 검증 (전체 DataFrame 을 만들지 않음) -> 검증 행 수
+
+        청크마다 validate_instruments 와 같은 검사를 실행해 검사별로 합산하고,
+        종목코드 중복은 이전 청크의 코드와도 비교합니다.
+        """
+        merged = {}
+        seen_codes = set()
+        cross_duplicates = []
+        rows = 0
+        try:
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                rows += len(chunk)
+                chunk_validator = FrameValidator(verbose=False)
+                chunk_validator.validate_instruments({market: chunk})
+                for entry in chunk_validator.checks:
+                    total = merged.setdefault(entry['check'], dict(entry, value=0, samples=[]))
+                    total['value'] += entry['value']
+                    total['samples'] = (total['samples'] + entry['samples'])[:5]
+
+                codes = chunk['instrument_code'].dropna().astype(str)
+                repeated = codes[codes.isin(seen_codes)]
+                cross_duplicates.extend(repeated.head(5 - len(cross_duplicates)).tolist())
+                merged['instruments_pk_duplicate']['value'] += len(repeated)
+                seen_codes.update(codes)
+        except Exception as e:
+            logger.error(f"{market} 청크 파싱 오류: {e}", exc_info=True)
+            rows = 0
+
+        if not rows:
+            # 청크가 없으면 파싱 실패/빈 파일
+            self._add('instruments_frame_missing', pd.Series([True]), pd.DataFrame({'market_type': [market]}),
+                      '항목별 파싱 결과 존재 검사 (파싱 실패/빈 파일)', key_column='market_type')
+            return 0
+
+        duplicate = merged['instruments_pk_duplicate']
+        duplicate['samples'] = (duplicate['samples'] + cross_duplicates)[:5]
+        for entry in merged.values():
+            entry['result'] = entry['value'] == 0
+            entry['description'] = f"{market} {entry['description']}"
+            self._record(entry)
+        return rows
+
+    def validate_reference(self, member_data=None, sector_data=None, theme_data=None):
+        """참조 테이블 DataFrame 검증 (PK 중복, 종목-참조 키 존재)"""
+        if member_data is not None and not member_data.empty:
+            member_code = member_data['member_code']
+            self._add('member_code_pk_duplicate', member_code.duplicated(keep=False), member_data,
+                      '회원사코드 중복 검사', key_column='member_code')
+
+        if sector_data is not None and not sector_data.empty:
+            sector_codes = set(sector_data['sector_code'].astype(str))
+            industry = getattr(self, '_industry_codes', None)
+            if industry is not None:
+                missing = industry.notna() & (industry.astype(str).str.strip() != '') \
+                    & ~industry.astype(str).isin(sector_codes)
+                self._add('instrument_industry_code_exists', missing, self._instrument_frame,
+                          '종목 업종코드-업종코드 마스터 존재 검증', critical=False)
+
+        if theme_data is not None and not theme_data.empty and hasattr(self, '_known_codes'):
+            stock_code = theme_data['stock_code']
+            missing = stock_code.notna() & (stock_code != '') & ~stock_code.astype(str).isin(self._known_codes)
+            self._add('theme_stock_code_exists', missing, theme_data,
+                      '테마-종목코드 존재 검증', critical=False, key_column='stock_code')
+
+    def summary(self):
+        """검증 결과 요약"""
+        critical_failures = [c for c in self.checks if c['critical'] and not c['result']]
+        warnings = [c for c in self.checks if not c['critical'] and not c['result']]
+        return {
+            'total_checks': len(self.checks),
+            'passed_checks': sum(1 for c in self.checks if c['result']),
+            'critical_failures': len(critical_failures),
+            'warnings': len(warnings),
+            'result': not critical_failures,
+            'checks': self.checks
+        }
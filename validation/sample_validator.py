@@ -7,12 +7,21 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db_utils import get_connection
+from search.fuzzy_index import edit_distance, normalize_name, get_fuzzy_index
+from search.instrument_search import InstrumentSearcher
 
 logger = logging.getLogger('sample_validator')
 
+# 종목명 오타 허용 편집거리
+FUZZY_NAME_MAX_DISTANCE = 1
+
 class SampleValidator:
     """샘플 데이터 검증기"""
     
+    def __init__(self, searcher=None, connection_factory=None):
+        self.get_connection = connection_factory or get_connection
+        self.searcher = searcher if searcher is not None else InstrumentSearcher(connection_factory=connection_factory)
+    
     def validate_known_instruments(self):
         """알려진 종목들의 존재 확인"""
         known_stocks = [
@@ -28,7 +37,7 @@ class SampleValidator:
         ]
         
         results = []
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 for stock in known_stocks:
@@ -49,6 +58,11 @@ class SampleValidator:
                             (aliases and stock['name'] in aliases)
                         )
                         
+                        # 부분 일치 실패 시 오타 허용 후보는 참고용으로만 기록 (검증 결과에는 반영하지 않음)
+                        suggestions = []
+                        if not name_match:
+                            suggestions = self._fuzzy_name_candidates(stock['name'], found_code, found_name, aliases)
+                        
                         is_valid = (
                             found_code == stock['code'] and
                             name_match and
@@ -63,6 +77,7 @@ class SampleValidator:
                                 'market': found_market,
                                 'aliases': aliases
                             },
+                            'suggestions': suggestions,
                             'result': is_valid,
                             'description': f"대표 종목 {stock['code']} 검증"
                         })
@@ -71,19 +86,43 @@ class SampleValidator:
                             logger.info(f"✓ {stock['code']} {stock['name']} 검증 성공")
                         else:
                             logger.warning(f"✗ {stock['code']} {stock['name']} 검증 실패 - 발견된 이름: {found_name}")
+                            if suggestions:
+                                logger.info(f"  오타 허용 일치 후보: {', '.join(s['instrument_name'] for s in suggestions)}")
                     else:
+                        suggestions = self._suggest_instruments(stock['name'])
                         results.append({
                             'expected': stock,
                             'found': None,
+                            'suggestions': suggestions,
                             'result': False,
                             'description': f"대표 종목 {stock['code']} 검증"
                         })
                         logger.error(f"✗ {stock['code']} {stock['name']} 종목을 찾을 수 없음")
+                        if suggestions:
+                            logger.info(f"  유사 종목 후보: {', '.join(s['instrument_code'] + ' ' + s['instrument_name'] for s in suggestions)}")
         finally:
             conn.close()
         
         return results
     
+    def _fuzzy_name_candidates(self, expected_name, found_code, found_name, aliases):
+        """기대 종목명과 편집거리 이내인 종목명/별칭 목록 (참고용 후보)"""
+        expected = normalize_name(expected_name)
+        names = [found_name] + (aliases.split(',') if aliases else [])
+        return [
+            {'instrument_code': found_code, 'instrument_name': name}
+            for name in names
+            if name and edit_distance(expected, normalize_name(name), FUZZY_NAME_MAX_DISTANCE) <= FUZZY_NAME_MAX_DISTANCE
+        ]
+    
+    def _suggest_instruments(self, name, top_k=3):
+        """종목명 오타 대비 유사 종목 후보 조회"""
+        try:
+            return get_fuzzy_index().search(name, max_distance=2, top_k=top_k)
+        except Exception as e:
+            logger.warning(f"유사 종목 검색 실패: {e}")
+            return []
+    
     def validate_search_functionality(self):
         """검색 기능 검증"""
         search_tests = [
@@ -114,57 +153,41 @@ class SampleValidator:
         ]
         
         results = []
-        conn = get_connection()
-        try:
-            with conn.cursor() as cursor:
-                for test in search_tests:
-                    query = test['query']
-                    
-                    # 이름으로 검색
-                    cursor.execute("""
-                        SELECT instrument_code, instrument_name, market_type
-                        FROM instruments
-                        WHERE instrument_name LIKE %s
-                           OR alias_names LIKE %s
-                        ORDER BY 
-                            CASE WHEN instrument_name LIKE %s THEN 1 ELSE 2 END,
-                            market_type,
-                            instrument_name
-                        LIMIT 100
-                    """, (f'%{query}%', f'%{query}%', f'{query}%'))
-                    
-                    search_results = cursor.fetchall()
-                    found_codes = [result[0] for result in search_results]
-                    
-                    # 검증
-                    min_check = len(search_results) >= test['expected_min_results']
-                    include_check = all(code in found_codes for code in test['should_include'])
-                    
-                    results.append({
-                        'query': query,
-                        'found_count': len(search_results),
-                        'expected_min': test['expected_min_results'],
-                        'should_include': test['should_include'],
-                        'found_codes': found_codes[:10],  # 상위 10개만
-                        'sample_results': [f"{r[0]} {r[1]}" for r in search_results[:5]],
-                        'min_check': min_check,
-                        'include_check': include_check,
-                        'result': min_check and include_check,
-                        'description': test['description']
-                    })
-                    
-                    if min_check and include_check:
-                        logger.info(f"✓ '{query}' 검색: {len(search_results)}개 결과")
-                    else:
-                        logger.warning(f"✗ '{query}' 검색 실패: {len(search_results)}개 결과 (최소 {test['expected_min_results']}개 필요)")
-        finally:
-            conn.close()
+        for test in search_tests:
+            query = test['query']
+            
+            # 이름으로 검색 (결과 캐시 사용)
+            search_results = self.searcher.search(query, limit=100)
+            found_codes = [result[0] for result in search_results]
+            
+            # 검증
+            min_check = len(search_results) >= test['expected_min_results']
+            include_check = all(code in found_codes for code in test['should_include'])
+            
+            results.append({
+                'query': query,
+                'found_count': len(search_results),
+                'expected_min': test['expected_min_results'],
+                'should_include': test['should_include'],
+                'found_codes': found_codes[:10],  # 상위 10개만
+                'sample_results': [f"{r[0]} {r[1]}" for r in search_results[:5]],
+                'min_check': min_check,
+                'include_check': include_check,
+                'result': min_check and include_check,
+                'description': test['description']
+            })
+            
+            if min_check and include_check:
+                logger.info(f"✓ '{query}' 검색: {len(search_results)}개 결과")
+            else:
+                logger.warning(f"✗ '{query}' 검색 실패: {len(search_results)}개 결과 (최소 {test['expected_min_results']}개 필요)")
         
+        logger.info(f"검색 캐시 통계: {self.searcher.cache_stats()}")
         return results
     
     def validate_etf_samples(self):
         """ETF 샘플 검증"""
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 # ETF 종목 수 확인
@@ -203,7 +226,7 @@ class SampleValidator:
     
     def validate_market_coverage(self):
         """시장 커버리지 검증"""
-        conn = get_connection()
+        conn = self.get_connection()
         try:
             with conn.cursor() as cursor:
                 # 시장별 종목 수
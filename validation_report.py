@@ -9,6 +9,7 @@ import json
 import os
 from datetime import datetime
 from config import DB_CONFIG
+from validation.check_engine import AggregateCheckEngine
 
 # 로깅 설정
 logging.basicConfig(
@@ -81,64 +82,80 @@ class ValidationReporter:
         self.report_data['tables']['instruments']['by_market'] = market_stats
     
     def _run_basic_validations(self):
-        """기본 검증 실행"""
-        cursor = self.conn.cursor()
-        
+        """기본 검증 실행 (테이블별 조건부 집계 1회 스캔)"""
         validations = [
             {
                 'name': '삼성전자 존재 검증',
-                'query': "SELECT COUNT(*) FROM instruments WHERE instrument_name = '삼성전자'",
+                'table': 'instruments',
+                'condition': "instrument_name = '삼성전자'",
                 'expected_min': 1,
                 'type': 'count'
             },
             {
                 'name': '코스피 종목 수 검증',
-                'query': "SELECT COUNT(*) FROM instruments WHERE market_type = '코스피'",
+                'table': 'instruments',
+                'condition': "market_type = '코스피'",
                 'expected_min': 2000,
                 'type': 'count'
             },
             {
                 'name': '코스닥 종목 수 검증', 
-                'query': "SELECT COUNT(*) FROM instruments WHERE market_type = '코스닥'",
+                'table': 'instruments',
+                'condition': "market_type = '코스닥'",
                 'expected_min': 1500,
                 'type': 'count'
             },
             {
                 'name': '업종코드 존재 검증',
-                'query': "SELECT COUNT(*) FROM sector_code",
+                'table': 'sector_code',
+                'condition': None,
                 'expected_min': 400,
                 'type': 'count'
             },
             {
                 'name': '테마코드 존재 검증',
-                'query': "SELECT COUNT(*) FROM theme_code", 
+                'table': 'theme_code',
+                'condition': None,
                 'expected_min': 200,
                 'type': 'count'
             }
         ]
         
+        engine = AggregateCheckEngine()
         for validation in validations:
-            try:
-                cursor.execute(validation['query'])
-                actual = cursor.fetchone()[0]
-                
-                if validation['type'] == 'count':
-                    passed = actual >= validation['expected_min']
-                    
-                self.report_data['validations'].append({
-                    'name': validation['name'],
-                    'status': 'PASS' if passed else 'FAIL',
-                    'expected': f">= {validation['expected_min']}",
-                    'actual': actual,
-                    'message': f"예상: {validation['expected_min']}개 이상, 실제: {actual}개"
-                })
-                
-            except Exception as e:
+            if validation['condition']:
+                engine.register_count(validation['table'], validation['name'], validation['condition'])
+            else:
+                engine.register(validation['table'], validation['name'], "COUNT(*)")
+        
+        try:
+            aggregates = engine.run(self.conn)
+            error = None
+        except Exception as e:
+            aggregates = {}
+            error = e
+        
+        for validation in validations:
+            if error is not None:
                 self.report_data['validations'].append({
                     'name': validation['name'],
                     'status': 'ERROR',
-                    'message': f"검증 오류: {e}"
+                    'message': f"검증 오류: {error}"
                 })
+                continue
+            
+            actual = aggregates[f"{validation['table']}.{validation['name']}"]
+            
+            if validation['type'] == 'count':
+                passed = actual >= validation['expected_min']
+                
+            self.report_data['validations'].append({
+                'name': validation['name'],
+                'status': 'PASS' if passed else 'FAIL',
+                'expected': f">= {validation['expected_min']}",
+                'actual': actual,
+                'message': f"예상: {validation['expected_min']}개 이상, 실제: {actual}개"
+            })
     
     def _run_business_validations(self):
         """비즈니스 검증 실행"""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+마스터 파일 변경 감시 데몬
+kis_download 폴더를 감시하다가 마스터 파일이 바뀌면 해당 항목만 부분 재적재합니다.
+
+- inotify_simple 이 설치되어 있으면 inotify, 없으면 (mtime, 크기) 폴링으로 감지
+- 다운로드처럼 연속으로 발생하는 변경은 디바운스 구간 동안 모아서 한 번에 처리
+- 재적재가 진행 중일 때 들어온 변경은 대기열에 합쳐 끝난 뒤 한 번 더 실행
+"""
+
+import logging
+import os
+import threading
+import time
+from config import DATA_DIR, FILE_SETS_CSV, WATCH_DEBOUNCE_SECONDS, WATCH_POLL_SECONDS
+
+logger = logging.getLogger('watch_reload')
+
+# 다운로드 임시 파일/매니페스트 등 감시 대상이 아닌 파일
+IGNORED_SUFFIXES = ('.part', '.tmp', '.json', '.log', '.txt')
+
+class PollingBackend:
+    """(mtime, 크기) 스냅샷 비교로 변경 파일 감지"""
+
+    name = 'polling'
+
+    def __init__(self, folder, interval=WATCH_POLL_SECONDS):
+        self.folder = folder
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return snapshot
+
+    def read(self, timeout):
+        """timeout 초 동안 대기 후 변경된 파일명 목록 반환"""
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        changed = [name for name, state in current.items() if self.snapshot.get(name) != state]
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+class InotifyBackend:
+    """inotify 기반 변경 감지 (쓰기 완료/이동 완료 이벤트)"""
+
+    name = 'inotify'
+
+    def __init__(self, folder):
+        from inotify_simple import INotify, flags
+        self.inotify = INotify()
+        self.inotify.add_watch(folder, flags.CLOSE_WRITE | flags.MOVED_TO)
+
+    def read(self, timeout):
+        return [event.name for event in self.inotify.read(timeout=int(timeout * 1000)) if event.name]
+
+    def close(self):
+        self.inotify.close()
+
+def create_backend(folder, poll_interval=WATCH_POLL_SECONDS, use_polling=False):
+    """inotify 사용 가능 시 inotify, 아니면 폴링 백엔드"""
+    if not use_polling:
+        try:
+            return InotifyBackend(folder)
+        except (ImportError, OSError) as e:
+            logger.info(f"inotify 를 사용할 수 없어 폴링으로 감시합니다: {e}")
+    return PollingBackend(folder, poll_interval)
+
+class ReloadWatcher:
+    """변경 파일 -> 항목 매핑, 디바운스, 재적재 실행/병합"""
+
+    def __init__(self, folder=DATA_DIR, debounce=WATCH_DEBOUNCE_SECONDS, poll_interval=WATCH_POLL_SECONDS,
+                 use_polling=False, reload_func=None):
+        self.folder = folder
+        self.debounce = debounce
+        self.backend = create_backend(folder, poll_interval, use_polling)
+        self.reload_func = reload_func
+        self.file_items = {}
+        self.pending = set()
+        self.last_event = None
+        self.reload_thread = None
+        self.reload_count = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._load_file_items()
+
+    def _load_file_items(self):
+        """kis_file_sets.csv 기준 파일명 -> 항목명 매핑 (CSV 변경 시 다시 로드)"""
+        import pandas as pd
+        from reload_data import master_file_items
+        self.file_items = master_file_items(pd.read_csv(FILE_SETS_CSV, encoding='utf-8'))
+
+    def items_for(self, filenames):
+        """변경 파일명 -> 재적재 항목 집합 (감시 대상이 아닌 파일 제외)"""
+        items = set()
+        for filename in filenames:
+            if filename.endswith(IGNORED_SUFFIXES):
+                continue
+            if filename == os.path.basename(FILE_SETS_CSV):
+                self._load_file_items()
+                continue
+            item = self.file_items.get(filename)
+            if item:
+                items.add(item)
+        return items
+
+    def _reload(self, items):
+        try:
+            reload_func = self.reload_func
+            if reload_func is None:
+                from reload_data import reload_sets
+                reload_func = reload_sets
+            logger.info(f"재적재 실행: {sorted(items)}")
+            success = reload_func(items)
+            logger.info(f"재적재 {'성공' if success else '실패'}: {sorted(items)}")
+        except Exception as e:
+            logger.error(f"재적재 중 오류: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self.reload_count += 1
+
+    def _reloading(self):
+        return self.reload_thread is not None and self.reload_thread.is_alive()
+
+    def poll_once(self, timeout):
+        """변경 감지 1회 + 조건 충족 시 재적재 시작 -> 시작 여부"""
+        items = self.items_for(self.backend.read(timeout))
+        now = time.monotonic()
+        if items:
+            new_items = items - self.pending
+            self.pending |= items
+            self.last_event = now
+            if new_items:
+                state = '재적재 진행 중, 대기열에 병합' if self._reloading() else f'{self.debounce:.1f}초 디바운스'
+                logger.info(f"변경 감지: {sorted(new_items)} ({state})")
+
+        # 디바운스 구간 동안 추가 변경이 없고 진행 중인 재적재가 없을 때 한 번에 실행
+        if not self.pending or self._reloading() or now - self.last_event < self.debounce:
+            return False
+        items, self.pending = self.pending, set()
+        self.reload_thread = threading.Thread(target=self._reload, args=(items,), name='reload', daemon=True)
+        self.reload_thread.start()
+        return True
+
+    def run(self):
+        logger.info(f"마스터 파일 감시 시작: {self.folder} ({self.backend.name}, 디바운스 {self.debounce:.1f}초)")
+        try:
+            while not self._stop.is_set():
+                self.poll_once(min(self.debounce, 1.0) or 0.1)
+        finally:
+            self.backend.close()
+            if self._reloading():
+                logger.info("진행 중인 재적재 완료 대기")
+                self.reload_thread.join()
+            logger.info("마스터 파일 감시 종료")
+
+    def stop(self):
+        self._stop.set()
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('logs/kis_watch.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+    arg_parser = argparse.ArgumentParser(description='KIS 마스터 파일 변경 감시 및 부분 재적재')
+    arg_parser.add_argument('--debounce', type=float, default=WATCH_DEBOUNCE_SECONDS, help='변경 묶음 대기 시간(초)')
+    arg_parser.add_argument('--poll-interval', type=float, default=WATCH_POLL_SECONDS, help='폴링 간격(초)')
+    arg_parser.add_argument('--polling', action='store_true', help='inotify 대신 폴링 사용')
+    args = arg_parser.parse_args()
+
+    watcher = ReloadWatcher(debounce=args.debounce, poll_interval=args.poll_interval, use_polling=args.polling)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()